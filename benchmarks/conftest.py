@@ -0,0 +1,51 @@
+"""Fixtures for benchmarks.
+
+Benchmarks use fixed seeds and derandomized Hypothesis settings, so results of different commits are comparable.
+"""
+import json
+import pathlib
+
+import hypothesis
+import pytest
+import yaml
+
+from schemathesis.synthetic import SpecConfig, generate_schema
+
+HERE = pathlib.Path(__file__).parent
+DATA = HERE.parent / "test" / "data"
+SMALL_SCHEMA = DATA / "petstore_v2.yaml"
+LARGE_SCHEMA_PATHS = 500
+# Number of examples for generation throughput benchmarks
+EXAMPLES = 50
+
+
+@pytest.fixture(scope="session")
+def large_schema():
+    """Swagger 2.0 schema with 1500 endpoints and nested references."""
+    return generate_schema(SpecConfig(spec_version="2.0", paths=LARGE_SCHEMA_PATHS))
+
+
+@pytest.fixture(scope="session")
+def schema_files(tmp_path_factory, large_schema):
+    """Small & large schemas in YAML & JSON formats."""
+    directory = tmp_path_factory.mktemp("schemas")
+    small = yaml.safe_load(SMALL_SCHEMA.read_text())
+    files = {}
+    for size, raw_schema in (("small", small), ("large", large_schema)):
+        for file_format, dump in (("yaml", yaml.dump), ("json", json.dumps)):
+            path = directory / f"{size}.{file_format}"
+            path.write_text(dump(raw_schema))
+            files[(size, file_format)] = str(path)
+    return files
+
+
+@pytest.fixture(scope="session")
+def hypothesis_settings():
+    return hypothesis.settings(
+        max_examples=EXAMPLES,
+        derandomize=True,
+        database=None,
+        deadline=None,
+        phases=[hypothesis.Phase.generate],
+        suppress_health_check=list(hypothesis.HealthCheck),
+    )
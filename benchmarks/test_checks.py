@@ -0,0 +1,78 @@
+import json
+
+import pytest
+import requests
+
+import schemathesis
+from schemathesis.checks import ALL_CHECKS
+from schemathesis.models import Case, Status, TestResult
+from schemathesis.runner import events
+from schemathesis.runner.serialization import SerializedTestResult
+from schemathesis.runner.stream import serialize_event
+
+SCHEMA = {
+    "swagger": "2.0",
+    "info": {"title": "Checks", "version": "1.0.0"},
+    "produces": ["application/json"],
+    "paths": {
+        "/items": {
+            "get": {
+                "responses": {
+                    "200": {
+                        "description": "OK",
+                        "schema": {
+                            "type": "array",
+                            "items": {
+                                "type": "object",
+                                "required": ["id", "name"],
+                                "properties": {"id": {"type": "integer"}, "name": {"type": "string"}},
+                            },
+                        },
+                    }
+                }
+            }
+        }
+    },
+}
+
+
+@pytest.fixture(scope="module")
+def endpoint():
+    return schemathesis.from_dict(SCHEMA, base_url="http://127.0.0.1:8080")["/items"]["GET"]
+
+
+@pytest.fixture(scope="module")
+def response():
+    response = requests.Response()
+    response.status_code = 200
+    response.headers["Content-Type"] = "application/json"
+    response._content = json.dumps([{"id": idx, "name": f"Item {idx}"} for idx in range(100)]).encode()
+    response.encoding = "utf-8"
+    return response
+
+
+@pytest.mark.parametrize("check", ALL_CHECKS, ids=lambda check: check.__name__)
+def test_check(benchmark, endpoint, response, check):
+    benchmark(check, response, Case(endpoint))
+
+
+@pytest.fixture(scope="module")
+def test_result(endpoint):
+    """A result with many checks, half of them are failed."""
+    result = TestResult(endpoint, seed=1)
+    for idx in range(100):
+        case = Case(endpoint, query={"id": idx})
+        if idx % 2:
+            result.add_failure("not_a_server_error", case, f"Failure {idx % 5}")
+        else:
+            result.add_success("not_a_server_error", case)
+    return result
+
+
+def test_serialize_result(benchmark, test_result):
+    benchmark(SerializedTestResult.from_test_result, test_result)
+
+
+def test_serialize_event(benchmark, test_result):
+    event = events.AfterExecution.from_result(test_result, Status.failure, [])
+    benchmark(serialize_event, event)
@@ -0,0 +1,108 @@
+import hypothesis
+import pytest
+
+import schemathesis
+from schemathesis._hypothesis import get_case_strategy
+from schemathesis.models import Case
+
+ITEM = {
+    "type": "object",
+    "required": ["name", "count"],
+    "properties": {
+        "name": {"type": "string", "minLength": 1, "maxLength": 20},
+        "count": {"type": "integer", "minimum": 0},
+        "price": {"type": "number"},
+        "tags": {"type": "array", "items": {"type": "string"}, "maxItems": 5},
+    },
+}
+
+
+def make_parameter(location, name="value", schema=None):
+    return {"name": name, "in": location, "required": True, "schema": schema or {"type": "string", "minLength": 1}}
+
+
+# A single endpoint for each parameter location
+PARAMETERS_SCHEMA = {
+    "openapi": "3.0.2",
+    "info": {"title": "Parameters", "version": "1.0.0"},
+    "paths": {
+        "/path/{value}": {"get": {"parameters": [make_parameter("path")], "responses": {"200": {"description": "OK"}}}},
+        "/query": {
+            "get": {
+                "parameters": [
+                    make_parameter("query", "name"),
+                    make_parameter("query", "limit", {"type": "integer", "minimum": 1, "maximum": 100}),
+                ],
+                "responses": {"200": {"description": "OK"}},
+            }
+        },
+        "/headers": {
+            "get": {"parameters": [make_parameter("header", "X-Token")], "responses": {"200": {"description": "OK"}}}
+        },
+        "/cookies": {
+            "get": {"parameters": [make_parameter("cookie", "session")], "responses": {"200": {"description": "OK"}}}
+        },
+        "/body": {
+            "post": {
+                "requestBody": {"required": True, "content": {"application/json": {"schema": ITEM}}},
+                "responses": {"200": {"description": "OK"}},
+            }
+        },
+    },
+}
+LOCATIONS = {
+    "path": ("GET", "/path/{value}"),
+    "query": ("GET", "/query"),
+    "header": ("GET", "/headers"),
+    "cookie": ("GET", "/cookies"),
+    "body": ("POST", "/body"),
+}
+
+
+@pytest.fixture(scope="module")
+def parameters_schema():
+    return schemathesis.from_dict(PARAMETERS_SCHEMA)
+
+
+def get_endpoint(schema, location):
+    method, path = LOCATIONS[location]
+    return schema[path][method]
+
+
+@pytest.mark.parametrize("location", LOCATIONS)
+def test_strategy_construction(benchmark, parameters_schema, location):
+    endpoint = get_endpoint(parameters_schema, location)
+
+    def build():
+        strategy = get_case_strategy(endpoint)
+        # Strategies are lazy, validation builds all the nested ones
+        strategy.validate()
+
+    benchmark(build)
+
+
+@pytest.mark.parametrize("location", LOCATIONS)
+def test_generation(benchmark, parameters_schema, hypothesis_settings, location):
+    endpoint = get_endpoint(parameters_schema, location)
+    strategy = get_case_strategy(endpoint)
+
+    @hypothesis_settings
+    @hypothesis.given(strategy)
+    def generate(case):
+        pass
+
+    benchmark.extra_info["examples"] = hypothesis_settings.max_examples
+    benchmark(generate)
+
+
+def test_as_requests_kwargs(benchmark, parameters_schema):
+    endpoint = get_endpoint(parameters_schema, "body")
+    case = Case(
+        endpoint,
+        path_parameters={"value": "test"},
+        headers={"X-Token": "secret"},
+        cookies={"session": "abc"},
+        query={"name": "test", "limit": 10},
+        body={"name": "item", "count": 1, "tags": ["a", "b"]},
+    )
+    benchmark(case.as_requests_kwargs, base_url="http://127.0.0.1:8080")
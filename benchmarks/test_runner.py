@@ -0,0 +1,77 @@
+"""End-to-end runs against the test applications & a stub application for a synthetic schema."""
+import json
+import sys
+from test.apps import _aiohttp
+
+import pytest
+
+from schemathesis import loaders
+from schemathesis.extra._aiohttp import run_server
+from schemathesis.models import Status
+from schemathesis.runner import events, prepare
+from schemathesis.synthetic import SpecConfig, generate_schema, write_app_module
+
+MAX_EXAMPLES = 10
+# 300 endpoints of the synthetic application
+SYNTHETIC_PATHS = 100
+ENDPOINTS = ("success", "failure", "payload", "path_variable", "multiple_failures")
+
+
+@pytest.fixture(scope="module")
+def aiohttp_schema_url():
+    port = run_server(_aiohttp.create_app(ENDPOINTS))
+    return f"http://127.0.0.1:{port}/swagger.yaml"
+
+
+def execute(*args, **kwargs):
+    return list(prepare(*args, hypothesis_max_examples=MAX_EXAMPLES, hypothesis_derandomize=True, **kwargs))
+
+
+def get_statuses(run_events):
+    """Statuses of tested endpoints, checked once after the benchmark, so a broken run is not measured as a fast one."""
+    assert isinstance(run_events[-1], events.Finished)
+    return {
+        f"{event.result.method} {event.result.path}": event.status
+        for event in run_events
+        if isinstance(event, events.AfterExecution)
+    }
+
+
+@pytest.mark.parametrize("workers_num", (1, 2))
+def test_aiohttp(benchmark, aiohttp_schema_url, workers_num):
+    result = benchmark.pedantic(execute, args=(aiohttp_schema_url,), kwargs={"workers_num": workers_num}, rounds=3)
+    assert get_statuses(result) == {
+        "GET /api/success": Status.success,
+        "GET /api/failure": Status.failure,
+        "POST /api/payload": Status.success,
+        "GET /api/path_variable/{key}": Status.success,
+        "GET /api/multiple_failures": Status.failure,
+    }
+
+
+def test_flask(benchmark):
+    kwargs = {"app": "test.apps._flask.app:app", "loader": loaders.from_wsgi}
+    result = benchmark.pedantic(execute, args=("/swagger.yaml",), kwargs=kwargs, rounds=3)
+    assert get_statuses(result) == {"GET /api/success": Status.success, "GET /api/failure": Status.failure}
+
+
+@pytest.fixture(scope="module")
+def synthetic_app(tmp_path_factory):
+    """Import path of a stub application for a synthetic schema."""
+    directory = tmp_path_factory.mktemp("synthetic")
+    schema_path = str(directory / "schema.json")
+    with open(schema_path, "w") as fd:
+        json.dump(generate_schema(SpecConfig(paths=SYNTHETIC_PATHS, parameters=4, polymorphic=True)), fd)
+    write_app_module(str(directory / "synthetic_app.py"), schema_path)
+    sys.path.insert(0, str(directory))
+    yield "synthetic_app:app"
+    sys.path.remove(str(directory))
+
+
+def test_synthetic(benchmark, synthetic_app):
+    kwargs = {"app": synthetic_app, "loader": loaders.from_wsgi}
+    result = benchmark.pedantic(execute, args=("/schema.json",), kwargs=kwargs, rounds=1)
+    statuses = get_statuses(result)
+    # The stub application conforms to the schema
+    assert len(statuses) == SYNTHETIC_PATHS * 3
+    assert set(statuses.values()) == {Status.success}
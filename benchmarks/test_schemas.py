@@ -0,0 +1,29 @@
+from copy import deepcopy
+
+import pytest
+
+import schemathesis
+
+
+@pytest.mark.parametrize("file_format", ("yaml", "json"))
+@pytest.mark.parametrize("size", ("small", "large"))
+def test_load(benchmark, schema_files, size, file_format):
+    benchmark(schemathesis.from_path, schema_files[(size, file_format)])
+
+
+@pytest.mark.parametrize("validate_schema", (True, False), ids=("validated", "not-validated"))
+def test_from_dict(benchmark, large_schema, validate_schema):
+    benchmark(schemathesis.from_dict, large_schema, validate_schema=validate_schema)
+
+
+def test_resolve_references(benchmark, large_schema):
+    schema = schemathesis.from_dict(large_schema)
+    # References are resolved in place, therefore every round needs a fresh copy
+    benchmark.pedantic(
+        schema.resolve, setup=lambda: ((deepcopy(large_schema["paths"]),), {}), rounds=20, warmup_rounds=1
+    )
+
+
+def test_get_all_endpoints(benchmark, large_schema):
+    schema = schemathesis.from_dict(large_schema)
+    benchmark(lambda: list(schema.get_all_endpoints()))
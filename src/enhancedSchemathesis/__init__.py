@@ -1,8 +1,48 @@
+import sys
+from importlib import import_module
+from typing import TYPE_CHECKING, Any, List
+
 from . import hooks
-from ._hypothesis import init_default_strategies, register_string_format
-from .cli import register_check
 from .constants import __version__
-from .loaders import from_dict, from_file, from_path, from_pytest_fixture, from_uri, from_wsgi
-from .models import Case
 
-init_default_strategies()
+# Public names and modules, where they are defined. They are imported on first access, so `schemathesis --help` or
+# a pytest session with the plugin installed doesn't load Hypothesis, requests, jsonschema, etc. until they are needed
+_LAZY_ATTRIBUTES = {
+    "init_default_strategies": "_hypothesis",
+    "register_string_format": "_hypothesis",
+    "register_check": "cli",
+    "from_dict": "loaders",
+    "from_file": "loaders",
+    "from_path": "loaders",
+    "from_pytest_fixture": "loaders",
+    "from_uri": "loaders",
+    "from_wsgi": "loaders",
+    "Case": "models",
+}
+
+
+def __getattr__(name: str) -> Any:
+    if name in _LAZY_ATTRIBUTES:
+        value = getattr(import_module(f".{_LAZY_ATTRIBUTES[name]}", __name__), name)
+    else:
+        # Submodules were available as attributes when everything was imported eagerly
+        try:
+            value = import_module(f".{name}", __name__)
+        except ModuleNotFoundError as exc:
+            if exc.name != f"{__name__}.{name}":
+                raise
+            raise AttributeError(f"module {__name__!r} has no attribute {name!r}") from None
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> List[str]:
+    return sorted({*globals(), *_LAZY_ATTRIBUTES})
+
+
+if TYPE_CHECKING or sys.version_info < (3, 7):
+    # Module-level `__getattr__` is not supported before Python 3.7
+    from ._hypothesis import init_default_strategies, register_string_format
+    from .cli import register_check
+    from .loaders import from_dict, from_file, from_path, from_pytest_fixture, from_uri, from_wsgi
+    from .models import Case
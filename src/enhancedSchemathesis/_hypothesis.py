@@ -1,6 +1,7 @@
 """Provide strategies for given endpoint(s) definition."""
 import asyncio
 import re
+import time
 from base64 import b64encode
 from functools import partial
 from typing import Any, Callable, Dict, Optional, Union
@@ -11,11 +12,12 @@ import hypothesis.strategies as st
 from hypothesis_jsonschema import from_schema
 
 from . import utils
-from ._compat import handle_warnings
 from .exceptions import InvalidSchema
 from .hooks import get_hook
 from .models import Case, Endpoint
+from .phases import GENERATION, PhaseTimings
 from .types import Hook
+from .value_pool import POOL_LOCATIONS, ValuePool
 
 #PARAMETERS = frozenset(("path_parameters", "headers", "cookies", "query", "body", "form_data"))
 PARAMETERS = frozenset(("path_parameters", "cookies", "query", "body", "form_data"))
@@ -23,11 +25,20 @@ SLASH = "/"
 
 
 def create_test(
-    endpoint: Endpoint, test: Callable, settings: Optional[hypothesis.settings] = None, seed: Optional[int] = None,
+    endpoint: Endpoint,
+    test: Callable,
+    settings: Optional[hypothesis.settings] = None,
+    seed: Optional[int] = None,
+    phases: Optional[PhaseTimings] = None,
+    value_pool: Optional[ValuePool] = None,
 ) -> Callable:
     """Create a Hypothesis test."""
     hooks = getattr(test, "_schemathesis_hooks", None)
     strategy = endpoint.as_strategy(hooks=hooks)
+    if value_pool is not None:
+        strategy = pooled_strategy(strategy, value_pool)
+    if phases is not None:
+        strategy = timed_strategy(strategy, phases)
     wrapped_test = hypothesis.given(case=strategy)(test)
     if seed is not None:
         wrapped_test = hypothesis.seed(seed)(wrapped_test)
@@ -40,14 +51,63 @@ def create_test(
 
 
 def make_test_or_exception(
-    endpoint: Endpoint, func: Callable, settings: Optional[hypothesis.settings] = None, seed: Optional[int] = None, execute_in_order: Optional[dict] = None
+    endpoint: Endpoint,
+    func: Callable,
+    settings: Optional[hypothesis.settings] = None,
+    seed: Optional[int] = None,
+    execute_in_order: Optional[dict] = None,
+    phases: Optional[PhaseTimings] = None,
+    value_pool: Optional[ValuePool] = None,
 ) -> Union[Callable, InvalidSchema]:
     try:
-        return create_test(endpoint, func, settings, seed=seed)
+        return create_test(endpoint, func, settings, seed=seed, phases=phases, value_pool=value_pool)
     except InvalidSchema as exc:
         return exc
 
 
+def timed_strategy(strategy: st.SearchStrategy, phases: PhaseTimings) -> st.SearchStrategy:
+    """Account the time of drawing examples from the strategy as data generation."""
+
+    @st.composite  # type: ignore
+    def timed(draw: Callable) -> Any:
+        start = time.perf_counter()
+        try:
+            return draw(strategy)
+        finally:
+            phases.add(GENERATION, time.perf_counter() - start)
+
+    return timed()
+
+
+def pooled_strategy(strategy: st.SearchStrategy, value_pool: ValuePool) -> st.SearchStrategy:
+    """Replace generated top-level parameters with values from the pool with the pool's probability.
+
+    Both the decision and the value are drawn from Hypothesis strategies, so examples with pool values are shrunk &
+    replayed as usual.
+    """
+
+    @st.composite  # type: ignore
+    def pooled(draw: Callable) -> Case:
+        case = draw(strategy)
+        for location in POOL_LOCATIONS:
+            container = getattr(case, location)
+            if not isinstance(container, dict):
+                continue
+            replaced = dict(container)
+            for name, current in container.items():
+                candidates = value_pool.get_candidates(location, name, current)
+                if not candidates:
+                    continue
+                # Shrinks towards zero, i.e. towards the generated value
+                chance = draw(st.floats(min_value=0, max_value=1, exclude_max=True))
+                if chance >= 1 - value_pool.probability:
+                    replaced[name] = draw(st.sampled_from(candidates))
+            setattr(case, location, replaced)
+        return case
+
+    return pooled()
+
+
 def get_original_test(test: Callable) -> Callable:
     """Get the original test function even if it is wrapped by `hypothesis.settings` decorator.
 
@@ -78,18 +138,47 @@ def get_example(endpoint: Endpoint) -> Optional[Case]:
         if parameter is not None and "example" in parameter:
             static_parameters[name] = parameter["example"]
     if static_parameters:
-        with handle_warnings():
-            strategies = {
-                other: from_schema(getattr(endpoint, other))
-                for other in PARAMETERS - set(static_parameters)
-                if getattr(endpoint, other) is not None
-            }
-            return _get_case_strategy(endpoint, static_parameters, strategies).example()
+        strategies = {
+            other: from_schema(getattr(endpoint, other))
+            for other in PARAMETERS - set(static_parameters)
+            if getattr(endpoint, other) is not None
+        }
+        return get_single_example(_get_case_strategy(endpoint, static_parameters, strategies))
     return None
 
 
+def get_single_example(strategy: st.SearchStrategy) -> Any:
+    """Draw a single value from the strategy.
+
+    Unlike `strategy.example()`, it doesn't generate a batch of values to pick one from and doesn't warn.
+    """
+    examples = []
+
+    @hypothesis.given(strategy)  # type: ignore
+    @hypothesis.settings(  # type: ignore
+        database=None,
+        max_examples=1,
+        deadline=None,
+        verbosity=hypothesis.Verbosity.quiet,
+        phases=(hypothesis.Phase.generate,),
+        suppress_health_check=list(hypothesis.HealthCheck),
+    )
+    def generate(value: Any) -> None:
+        examples.append(value)
+
+    generate()
+    return examples[0]
+
+
 def add_examples(test: Callable, endpoint: Endpoint) -> Callable:
-    """Add examples to the Hypothesis test, if they are specified in the schema."""
+    """Add examples to the Hypothesis test, if they are specified in the schema.
+
+    Tests are created right before they are executed, therefore the example is drawn only for tests that run.
+    """
+    settings = getattr(test, "_hypothesis_internal_use_settings", None) or hypothesis.settings.default
+    if hypothesis.Phase.explicit not in settings.phases:
+        # Explicit examples are not executed
+        return test
     example = get_example(endpoint)
     if example:
         test = hypothesis.example(case=example)(test)
@@ -215,3 +304,7 @@ def register_string_format(name: str, strategy: st.SearchStrategy) -> None:
 def init_default_strategies() -> None:
     register_string_format("binary", st.binary())
     register_string_format("byte", st.binary().map(lambda x: b64encode(x).decode()))
+
+
+# Formats are registered once, when data generation is loaded
+init_default_strategies()
@@ -1,23 +1,35 @@
 import string
+from functools import lru_cache
 from itertools import product
+from types import SimpleNamespace
 from typing import TYPE_CHECKING, Any, Callable, Dict, Generator, Tuple, Union
 
-import jsonschema
-import requests
-
-from .exceptions import get_response_type_error, get_schema_validation_error, get_status_code_error
-from .utils import WSGIResponse, are_content_types_equal, parse_content_type
-
 if TYPE_CHECKING:
+    import requests
+
     from .models import Case
+    from .utils import WSGIResponse
+
+# Checks are listed as CLI options, therefore this module doesn't import `requests`, `jsonschema`, etc. on load
+GenericResponse = Union["requests.Response", "WSGIResponse"]  # pragma: no mutate
+
+
+@lru_cache()
+def _load() -> SimpleNamespace:
+    """Modules used by checks. They are imported once, on the first call of any check."""
+    # pylint: disable=import-outside-toplevel
+    import jsonschema
+    import requests
+
+    from . import exceptions, utils
 
-GenericResponse = Union[requests.Response, WSGIResponse]  # pragma: no mutate
+    return SimpleNamespace(jsonschema=jsonschema, requests=requests, exceptions=exceptions, utils=utils)
 
 
 def not_a_server_error(response: GenericResponse, case: "Case") -> None:
     """A check to verify that the response is not a server-side error."""
     if response.status_code >= 500:
-        exc_class = get_status_code_error(response.status_code)
+        exc_class = _load().exceptions.get_status_code_error(response.status_code)
         raise exc_class(f"Received a response with 5xx status code: {response.status_code}")
 
 
@@ -33,7 +45,7 @@ def status_code_conformance(response: GenericResponse, case: "Case") -> None:
             f"Received a response with a status code, which is not defined in the schema: "
             f"{response.status_code}\n\nDeclared status codes: {responses_list}"
         )
-        exc_class = get_status_code_error(response.status_code)
+        exc_class = _load().exceptions.get_status_code_error(response.status_code)
         raise exc_class(message)
 
 
@@ -45,16 +57,17 @@ def _expand_responses(responses: Dict[Union[str, int], Any]) -> Generator[int, N
 
 
 def content_type_conformance(response: GenericResponse, case: "Case") -> None:
+    utils = _load().utils
     content_types = case.endpoint.get_content_types(response)
     if not content_types:
         return
     content_type = response.headers["Content-Type"]
     for option in content_types:
-        if are_content_types_equal(option, content_type):
+        if utils.are_content_types_equal(option, content_type):
             return
-        expected_main, expected_sub = parse_content_type(option)
-        received_main, received_sub = parse_content_type(content_type)
-    exc_class = get_response_type_error(f"{expected_main}_{expected_sub}", f"{received_main}_{received_sub}")
+        expected_main, expected_sub = utils.parse_content_type(option)
+        received_main, received_sub = utils.parse_content_type(content_type)
+    exc_class = _load().exceptions.get_response_type_error(f"{expected_main}_{expected_sub}", f"{received_main}_{received_sub}")
     raise exc_class(
         f"Received a response with '{content_type}' Content-Type, "
         f"but it is not declared in the schema.\n\n"
@@ -63,6 +76,7 @@ def content_type_conformance(response: GenericResponse, case: "Case") -> None:
 
 
 def response_schema_conformance(response: GenericResponse, case: "Case") -> None:
+    modules = _load()
     try:
         content_type = response.headers["Content-Type"]
     except KeyError:
@@ -83,19 +97,20 @@ def response_schema_conformance(response: GenericResponse, case: "Case") -> None
     schema = case.endpoint.schema._get_response_schema(definition)
     if not schema:
         return
-    if isinstance(response, requests.Response):
+    if isinstance(response, modules.requests.Response):
         data = response.json()
     else:
         data = response.json
+    jsonschema = modules.jsonschema
     try:
         jsonschema.validate(data, schema, cls=jsonschema.Draft4Validator, resolver=case.endpoint.schema.resolver)
     except jsonschema.ValidationError as exc:
-        exc_class = get_schema_validation_error(exc)
+        exc_class = modules.exceptions.get_schema_validation_error(exc)
         raise exc_class(f"The received response does not conform to the defined schema!\n\nDetails: \n\n{exc}")
 
 
 DEFAULT_CHECKS = (not_a_server_error,)
 OPTIONAL_CHECKS = (status_code_conformance, content_type_conformance, response_schema_conformance)
 ALL_CHECKS: Tuple[
-    Callable[[Union[requests.Response, WSGIResponse], "Case"], None], ...
+    Callable[[GenericResponse, "Case"], None], ...
 ] = DEFAULT_CHECKS + OPTIONAL_CHECKS
@@ -1,30 +1,51 @@
+import sys
 import traceback
 from enum import Enum
-from typing import Callable, Dict, Generator, Iterable, List, Optional, Tuple, Union, cast
+from typing import TYPE_CHECKING, Callable, Dict, Generator, Iterable, List, Optional, Sequence, Tuple, Union, cast
 
 import click
-import hypothesis
-import requests
 
 from .. import checks as checks_module
-from .. import models, runner
-from ..runner import events
 from ..types import Filter
-from ..utils import WSGIResponse
-from . import callbacks, output
+from . import callbacks
 from .context import ExecutionContext
-from .options import CSVOption, NotSet, OptionalInt
+from .options import CSVOption, HypothesisCSVOption, NotSet, OptionalInt, not_set
+
+if TYPE_CHECKING:
+    import hypothesis
+
+    from ..models import Case
+    from ..runner import events
+    from ..runner.profiling import Profiler
+    from ..runner.reports import ReportWriter
+    from ..runner.results import ResultsWriter
+
+# The runner, output handlers & everything they depend on are imported inside commands, so `--help` and other
+# invocations, that don't run tests, don't pay for importing them
+# pylint: disable=import-outside-toplevel
 
 CONTEXT_SETTINGS = {"help_option_names": ["-h", "--help"]}
 
 DEFAULT_CHECKS_NAMES = tuple(check.__name__ for check in checks_module.DEFAULT_CHECKS)
 ALL_CHECKS_NAMES = tuple(check.__name__ for check in checks_module.ALL_CHECKS)
 CHECKS_TYPE = click.Choice((*ALL_CHECKS_NAMES, "all"))
+# Members of Hypothesis enums, that are accepted by `run` options. Hypothesis itself is imported only when they are used
+HYPOTHESIS_PHASES = ("explicit", "reuse", "generate", "target", "shrink")
+HYPOTHESIS_HEALTH_CHECKS = (
+    "data_too_large",
+    "filter_too_much",
+    "too_slow",
+    "return_value",
+    "large_base_example",
+    "not_a_test_method",
+    "function_scoped_fixture",
+)
+HYPOTHESIS_VERBOSITY_LEVELS = ("quiet", "normal", "verbose", "debug")
 DEFAULT_WORKERS = 1
 MAX_WORKERS = 64
 
 
-def register_check(function: Callable[[Union[requests.Response, WSGIResponse], models.Case], None]) -> None:
+def register_check(function: Callable[[checks_module.GenericResponse, "Case"], None]) -> None:
     """Register a new check for schemathesis CLI."""
     checks_module.ALL_CHECKS += (function,)
     CHECKS_TYPE.choices += (function.__name__,)  # type: ignore
@@ -116,19 +137,119 @@ def schemathesis(pre_run: Optional[str] = None) -> None:
 )
 @click.option("--validate-schema", help="Enable or disable validation of input schema.", type=bool, default=True)
 @click.option("--show-errors-tracebacks", help="Show full tracebacks for internal errors.", is_flag=True, default=False)
+@click.option(
+    "--profile-phases",
+    help="Show how much time was spent on strategies, data generation, network, checks, shrinking & serialization.",
+    is_flag=True,
+    default=False,
+)
+@click.option(
+    "--profile",
+    "profiles",
+    help="Profile the run per endpoint and write the profile to a file, in TYPE:PATH format. CPU profiles are written "
+    "in the pstats format, allocations as collapsed stacks. Requires a single worker. Supported types: cpu, alloc. "
+    "Example: cpu:run.prof",
+    type=str,
+    multiple=True,
+    callback=callbacks.convert_profiles,
+)
+@click.option(
+    "--event-stream",
+    help="Write all runner events as newline-delimited JSON to the given file, named pipe or unix:<path> socket.",
+    type=str,
+)
+@click.option(
+    "--value-pool-probability",
+    help="Probability of replacing generated parameters with values of the same name from previous successful responses.",
+    type=click.FloatRange(0, 1),
+)
+@click.option(
+    "--adaptive-budget",
+    help="Distribute examples among endpoints by their complexity and stop testing endpoints "
+    "that keep producing the same responses.",
+    is_flag=True,
+    default=False,
+)
+@click.option(
+    "--adaptive-budget-total",
+    help="Total number of examples for all endpoints with --adaptive-budget. "
+    "Defaults to --hypothesis-max-examples multiplied by the number of endpoints.",
+    type=click.IntRange(1),
+)
+@click.option(
+    "--max-duration",
+    help="Maximum duration of the whole test run in seconds. Endpoints that are not tested yet are skipped after it.",
+    type=click.FloatRange(min=0),
+)
+@click.option(
+    "--max-requests",
+    help="Maximum number of requests for the whole test run.",
+    type=click.IntRange(1),
+)
+@click.option(
+    "--rate-limit",
+    help="Maximum rate of requests shared by all workers, in N/s, N/m or N/h format. Example: 10/s",
+    type=str,
+    callback=callbacks.convert_rate_limit,
+)
+@click.option(
+    "--shard",
+    help="Test only the i-th of N parts of the endpoints, in i/N format. Example: 2/4",
+    type=str,
+    callback=callbacks.convert_shard,
+)
+@click.option(
+    "--shard-timings",
+    help="Results file of a previous run, used to balance shards by the endpoints' durations. "
+    "All shards should use the same files.",
+    type=click.Path(exists=True, dir_okay=False),
+    multiple=True,
+    callback=callbacks.load_shard_timings,
+)
+@click.option(
+    "--results-file",
+    help="Write results of the run to a JSON file, that could be combined with results of other shards "
+    "via `schemathesis merge`.",
+    type=click.Path(dir_okay=False),
+)
+@click.option(
+    "--report",
+    "reports",
+    help="Write a report of the run in the given format to a file, in FORMAT:PATH format. "
+    "Supported formats: junit, json. Example: junit:report.xml",
+    type=str,
+    multiple=True,
+    callback=callbacks.convert_reports,
+)
+@click.option(
+    "--timing-history",
+    help="JSON file to keep durations of endpoints between runs. "
+    "With multiple workers the slowest endpoints are started first.",
+    type=click.Path(dir_okay=False),
+)
 @click.option(
     "--hypothesis-deadline",
     help="Duration in milliseconds that each individual example with a test is not allowed to exceed.",
     # max value to avoid overflow. It is maximum amount of days in milliseconds
     type=OptionalInt(1, 999999999 * 24 * 3600 * 1000),
 )
+@click.option(
+    "--hypothesis-database",
+    help="Directory or SQLite file (*.db, *.sqlite, *.sqlite3) to store found examples in. "
+    "Could be shared by multiple runs & processes.",
+    type=str,
+)
 @click.option("--hypothesis-derandomize", help="Use Hypothesis's deterministic mode.", is_flag=True, default=None)
 @click.option(
     "--hypothesis-max-examples",
     help="Maximum number of generated examples per each method/endpoint combination.",
     type=click.IntRange(1),
 )
-@click.option("--hypothesis-phases", help="Control which phases should be run.", type=CSVOption(hypothesis.Phase))
+@click.option(
+    "--hypothesis-phases",
+    help="Control which phases should be run.",
+    type=HypothesisCSVOption("Phase", HYPOTHESIS_PHASES),
+)
 @click.option(
     "--hypothesis-report-multiple-bugs", help="Raise only the exception with the smallest minimal example.", type=bool
 )
@@ -136,12 +257,12 @@ def schemathesis(pre_run: Optional[str] = None) -> None:
 @click.option(
     "--hypothesis-suppress-health-check",
     help="Comma-separated list of health checks to disable.",
-    type=CSVOption(hypothesis.HealthCheck),
+    type=HypothesisCSVOption("HealthCheck", HYPOTHESIS_HEALTH_CHECKS),
 )
 @click.option(
     "--hypothesis-verbosity",
     help="Verbosity level of Hypothesis messages.",
-    type=click.Choice([item.name for item in hypothesis.Verbosity]),
+    type=click.Choice(HYPOTHESIS_VERBOSITY_LEVELS),
     callback=callbacks.convert_verbosity,
 )
 def run(  # pylint: disable=too-many-arguments
@@ -160,21 +281,46 @@ def run(  # pylint: disable=too-many-arguments
     request_timeout: Optional[int] = None,
     validate_schema: bool = True,
     show_errors_tracebacks: bool = False,
+    profile_phases: bool = False,
+    profiles: Iterable[Tuple[str, str]] = (),
+    event_stream: Optional[str] = None,
+    value_pool_probability: Optional[float] = None,
+    adaptive_budget: bool = False,
+    adaptive_budget_total: Optional[int] = None,
+    max_duration: Optional[float] = None,
+    max_requests: Optional[int] = None,
+    rate_limit: Optional[float] = None,
+    shard: Optional[Tuple[int, int]] = None,
+    shard_timings: Optional[Dict[str, float]] = None,
+    results_file: Optional[str] = None,
+    reports: Iterable[Tuple[str, str]] = (),
+    timing_history: Optional[str] = None,
     hypothesis_deadline: Optional[Union[int, NotSet]] = None,
+    hypothesis_database: Optional[str] = None,
     hypothesis_derandomize: Optional[bool] = None,
     hypothesis_max_examples: Optional[int] = None,
-    hypothesis_phases: Optional[List[hypothesis.Phase]] = None,
+    hypothesis_phases: Optional[List["hypothesis.Phase"]] = None,
     hypothesis_report_multiple_bugs: Optional[bool] = None,
-    hypothesis_suppress_health_check: Optional[List[hypothesis.HealthCheck]] = None,
+    hypothesis_suppress_health_check: Optional[List["hypothesis.HealthCheck"]] = None,
     hypothesis_seed: Optional[int] = None,
-    hypothesis_verbosity: Optional[hypothesis.Verbosity] = None,
+    hypothesis_verbosity: Optional["hypothesis.Verbosity"] = None,
 ) -> None:
     """Perform schemathesis test against an API specified by SCHEMA.
 
     SCHEMA must be a valid URL or file path pointing to an Open API / Swagger specification.
     """
     # pylint: disable=too-many-locals
+    from .. import runner
+    from ..runner.profiling import create_profiler
+    from ..runner.reports import create_report_writer
+    from ..runner.results import ResultsWriter
 
+    if profiles and workers_num > 1:
+        # Profiles are attributed to endpoints by the order of events, that is not preserved with multiple workers
+        raise click.UsageError("--profile requires a single worker")
+    if profiles and hypothesis_deadline is None:
+        # Profilers slow tests down, which makes timings unreliable
+        hypothesis_deadline = not_set
     if "all" in checks:
         selected_checks = checks_module.ALL_CHECKS
     else:
@@ -196,7 +342,17 @@ def run(  # pylint: disable=too-many-arguments
         checks=selected_checks,
         workers_num=workers_num,
         validate_schema=validate_schema,
+        value_pool_probability=value_pool_probability,
+        adaptive_budget=adaptive_budget,
+        adaptive_budget_total=adaptive_budget_total,
+        max_duration=max_duration,
+        max_requests=max_requests,
+        rate_limit=rate_limit,
+        shard=shard,
+        shard_timings=shard_timings,
+        timing_history=timing_history,
         hypothesis_deadline=hypothesis_deadline,
+        hypothesis_database=hypothesis_database,
         hypothesis_derandomize=hypothesis_derandomize,
         hypothesis_max_examples=hypothesis_max_examples,
         hypothesis_phases=hypothesis_phases,
@@ -204,15 +360,121 @@ def run(  # pylint: disable=too-many-arguments
         hypothesis_suppress_health_check=hypothesis_suppress_health_check,
         hypothesis_verbosity=hypothesis_verbosity,
     )
-    execute(prepared_runner, workers_num, show_errors_tracebacks)
+    results_writer = None
+    if results_file is not None:
+        results_writer = ResultsWriter(results_file, shard=f"{shard[0]}/{shard[1]}" if shard is not None else None)
+    report_writers = [create_report_writer(report_format, path) for report_format, path in reports]
+    profilers = [create_profiler(profile_type, path) for profile_type, path in profiles]
+    execute(
+        prepared_runner,
+        workers_num,
+        show_errors_tracebacks,
+        event_stream,
+        results_writer,
+        profile_phases,
+        report_writers,
+        profilers,
+    )
+
+
+@schemathesis.command(short_help="Combine results of multiple runs.")
+@click.argument("files", nargs=-1, required=True, type=click.Path(exists=True, dir_okay=False))
+@click.option(
+    "--output",
+    "-o",
+    "output_path",
+    help="Write the combined results to a file. It could be used as --shard-timings for the next runs.",
+    type=click.Path(dir_okay=False),
+)
+@click.option("--show-errors-tracebacks", help="Show full tracebacks for internal errors.", is_flag=True, default=False)
+def merge(files: Tuple[str, ...], output_path: Optional[str] = None, show_errors_tracebacks: bool = False) -> None:
+    """Combine results FILES, written by sharded runs with --results-file, into a single summary."""
+    from ..runner.results import MergedResults
+    from . import output
+
+    try:
+        merged = MergedResults.from_files(files)
+    except (ValueError, KeyError) as exc:
+        raise click.UsageError(f"Invalid results file: {exc}")
+    if output_path is not None:
+        merged.save(output_path)
+    endpoints_count = len(merged.items)
+    context = ExecutionContext(
+        show_errors_tracebacks=show_errors_tracebacks,
+        hypothesis_output=merged.hypothesis_output,
+        endpoints_count=endpoints_count,
+        endpoints_processed=endpoints_count,
+    )
+    for result in merged.results:
+        context.results.append(result)
+    click.secho(f"Merged results of {endpoints_count} endpoints from {merged.runs_count} files", bold=True)
+    output.default.handle_finished(context, merged.to_finished())
+
+
+@schemathesis.command(short_help="Generate a large schema & an application for it.")
+@click.argument("output_path", metavar="OUTPUT", type=click.Path(dir_okay=False))
+@click.option("--spec-version", help="Version of the specification.", type=click.Choice(["2.0", "3.0"]), default="3.0")
+@click.option("--paths", help="Number of paths. Each of them has 3 operations.", type=click.IntRange(1), default=100)
+@click.option(
+    "--parameters", help="Number of query & header parameters of GET operations.", type=click.IntRange(0), default=2
+)
+@click.option("--definitions", help="Number of definitions on each level.", type=click.IntRange(1), default=10)
+@click.option("--ref-fanout", help="Number of references from each definition.", type=click.IntRange(0), default=2)
+@click.option("--ref-depth", help="Number of definitions levels.", type=click.IntRange(1), default=3)
+@click.option("--recursive", help="Top-level definitions contain lists of themselves.", is_flag=True, default=False)
+@click.option(
+    "--polymorphic", help="Payloads are one of several variants of a definition.", is_flag=True, default=False
+)
+@click.option(
+    "--app-module",
+    help="Write a Python module with a WSGI application, that implements the schema, to this path.",
+    type=click.Path(dir_okay=False),
+)
+def synthesize(  # pylint: disable=too-many-arguments
+    output_path: str,
+    spec_version: str = "3.0",
+    paths: int = 100,
+    parameters: int = 2,
+    definitions: int = 10,
+    ref_fanout: int = 2,
+    ref_depth: int = 3,
+    recursive: bool = False,
+    polymorphic: bool = False,
+    app_module: Optional[str] = None,
+) -> None:
+    """Write a synthetic JSON schema to OUTPUT, for benchmarks & load tests of Schemathesis itself."""
+    import json
+
+    from ..synthetic import SpecConfig, generate_schema, write_app_module
+
+    config = SpecConfig(
+        spec_version=spec_version,
+        paths=paths,
+        parameters=parameters,
+        definitions=definitions,
+        ref_fanout=ref_fanout,
+        ref_depth=ref_depth,
+        recursive=recursive,
+        polymorphic=polymorphic,
+    )
+    with open(output_path, "w", encoding="utf-8") as fd:
+        json.dump(generate_schema(config), fd)
+    click.echo(f"Schema with {paths * 3} endpoints is written to {output_path}")
+    if app_module is not None:
+        write_app_module(app_module, output_path)
+        click.echo(f"Application is written to {app_module}, the schema is served at /schema.json")
 
 
-def get_output_handler(workers_num: int) -> Callable[[ExecutionContext, events.ExecutionEvent], None]:
+def get_output_handler(workers_num: int) -> Callable[[ExecutionContext, "events.ExecutionEvent"], None]:
+    from . import output
+
     if workers_num > 1:
-        output_style = OutputStyle.short
+        # The dashboard is redrawn in place, which is possible only in a terminal
+        output_style = OutputStyle.dashboard if sys.stdout.isatty() else OutputStyle.short
     else:
         output_style = OutputStyle.default
-    return cast(Callable[[ExecutionContext, events.ExecutionEvent], None], output_style)
+    handler = getattr(output, output_style.value).handle_event
+    return cast(Callable[[ExecutionContext, "events.ExecutionEvent"], None], handler)
 
 
 def load_hook(module_name: str) -> None:
@@ -229,15 +491,52 @@ def load_hook(module_name: str) -> None:
 class OutputStyle(Enum):
     """Provide different output styles."""
 
-    default = output.default.handle_event
-    short = output.short.handle_event
+    default = "default"
+    short = "short"
+    dashboard = "dashboard"
 
 
 def execute(
-    prepared_runner: Generator[events.ExecutionEvent, None, None], workers_num: int, show_errors_tracebacks: bool
+    prepared_runner: Generator["events.ExecutionEvent", None, None],
+    workers_num: int,
+    show_errors_tracebacks: bool,
+    event_stream: Optional[str] = None,
+    results_writer: Optional["ResultsWriter"] = None,
+    profile_phases: bool = False,
+    report_writers: Sequence["ReportWriter"] = (),
+    profilers: Sequence["Profiler"] = (),
 ) -> None:
     """Execute a prepared runner by drawing events from it and passing to a proper handler."""
+    from ..runner.stream import open_stream
+    from .output.buffer import buffered_stdout
+    from .output.default import refresh_terminal_width_on_resize
+
     handler = get_output_handler(workers_num)
-    context = ExecutionContext(workers_num=workers_num, show_errors_tracebacks=show_errors_tracebacks)
-    for event in prepared_runner:
-        handler(context, event)
+    context = ExecutionContext(
+        workers_num=workers_num, show_errors_tracebacks=show_errors_tracebacks, profile_phases=profile_phases
+    )
+    stream = open_stream(event_stream) if event_stream is not None else None
+    # Output is rendered from a separate thread in batches, so slow terminals don't block the runner
+    try:
+        with buffered_stdout(threaded=True), refresh_terminal_width_on_resize():
+            for profiler in profilers:
+                profiler.start()
+            for event in prepared_runner:
+                for profiler in profilers:
+                    profiler.write(event)
+                # Events are streamed before handling, since some handlers stop the execution (e.g. on `Finished`)
+                if stream is not None:
+                    stream.write(event)
+                if results_writer is not None:
+                    results_writer.write(event)
+                for report_writer in report_writers:
+                    report_writer.write(event)
+                handler(context, event)
+    finally:
+        for profiler in profilers:
+            profiler.stop()
+        if stream is not None:
+            stream.close()
+        for report_writer in report_writers:
+            report_writer.close()
+        context.results.close()
@@ -1,16 +1,20 @@
 import re
 from contextlib import contextmanager
-from typing import Dict, Generator, Optional, Tuple
+from typing import TYPE_CHECKING, Dict, Generator, List, Optional, Tuple
 from urllib.parse import urlparse
 
 import click
-import hypothesis
-from requests import PreparedRequest, RequestException
 
-from .. import utils
+if TYPE_CHECKING:
+    import hypothesis
+
+# Callbacks are not called for `--help`, therefore modules that are slow to import are loaded inside them
+# pylint: disable=import-outside-toplevel
 
 
 def validate_schema(ctx: click.core.Context, param: click.core.Parameter, raw_value: str) -> str:
+    from .. import utils
+
     if "app" not in ctx.params:
         if not urlparse(raw_value).netloc:
             if "\x00" in raw_value or not utils.file_exists(raw_value):
@@ -23,6 +27,8 @@ def validate_schema(ctx: click.core.Context, param: click.core.Parameter, raw_va
 
 
 def _validate_url(value: str) -> None:
+    from requests import PreparedRequest, RequestException
+
     try:
         PreparedRequest().prepare_url(value, {})  # type: ignore
     except RequestException:
@@ -38,6 +44,8 @@ def validate_base_url(ctx: click.core.Context, param: click.core.Parameter, raw_
 def validate_app(ctx: click.core.Context, param: click.core.Parameter, raw_value: Optional[str]) -> Optional[str]:
     if raw_value is None:
         return raw_value
+    from .. import utils
+
     try:
         utils.import_app(raw_value)
         # String is returned instead of an app because it might be passed to a subprocess
@@ -56,6 +64,8 @@ def validate_auth(
     ctx: click.core.Context, param: click.core.Parameter, raw_value: Optional[str]
 ) -> Optional[Tuple[str, str]]:
     if raw_value is not None:
+        from .. import utils
+
         with reraise_format_error(raw_value):
             user, password = tuple(raw_value.split(":"))
         if not user:
@@ -71,6 +81,8 @@ def validate_auth(
 def validate_headers(
     ctx: click.core.Context, param: click.core.Parameter, raw_value: Tuple[str, ...]
 ) -> Dict[str, str]:
+    from .. import utils
+
     headers = {}
     for header in raw_value:
         with reraise_format_error(header):
@@ -98,11 +110,80 @@ def validate_regex(ctx: click.core.Context, param: click.core.Parameter, raw_val
     return raw_value
 
 
+def convert_rate_limit(ctx: click.core.Context, param: click.core.Parameter, value: Optional[str]) -> Optional[float]:
+    if value is None:
+        return value
+    from ..runner.impl.limits import parse_rate_limit
+
+    try:
+        return parse_rate_limit(value)
+    except ValueError:
+        raise click.BadParameter(f"Should be in N/s, N/m or N/h format. Got: {value}")
+
+
+def convert_shard(
+    ctx: click.core.Context, param: click.core.Parameter, value: Optional[str]
+) -> Optional[Tuple[int, int]]:
+    if value is None:
+        return value
+    from ..runner.impl.sharding import parse_shard
+
+    try:
+        return parse_shard(value)
+    except ValueError as exc:
+        raise click.BadParameter(f"{exc.args[0]}. Got: {value}")
+
+
+def convert_reports(
+    ctx: click.core.Context, param: click.core.Parameter, value: Tuple[str, ...]
+) -> List[Tuple[str, str]]:
+    from ..runner.reports import REPORT_WRITERS
+
+    reports = []
+    for item in value:
+        report_format, _, path = item.partition(":")
+        if report_format not in REPORT_WRITERS or not path:
+            formats = ", ".join(REPORT_WRITERS)
+            raise click.BadParameter(f"Should be in FORMAT:PATH format, where FORMAT is one of: {formats}. Got: {item}")
+        reports.append((report_format, path))
+    return reports
+
+
+def convert_profiles(
+    ctx: click.core.Context, param: click.core.Parameter, value: Tuple[str, ...]
+) -> List[Tuple[str, str]]:
+    from ..runner.profiling import PROFILERS
+
+    profiles = []
+    for item in value:
+        profile_type, _, path = item.partition(":")
+        if profile_type not in PROFILERS or not path:
+            types = ", ".join(PROFILERS)
+            raise click.BadParameter(f"Should be in TYPE:PATH format, where TYPE is one of: {types}. Got: {item}")
+        profiles.append((profile_type, path))
+    return profiles
+
+
+def load_shard_timings(
+    ctx: click.core.Context, param: click.core.Parameter, value: Tuple[str, ...]
+) -> Optional[Dict[str, float]]:
+    if not value:
+        return None
+    from ..runner.results import load_timings
+
+    try:
+        return load_timings(value)
+    except (ValueError, KeyError) as exc:
+        raise click.BadParameter(f"Invalid results file: {exc}")
+
+
 def convert_verbosity(
     ctx: click.core.Context, param: click.core.Parameter, value: Optional[str]
-) -> Optional[hypothesis.Verbosity]:
+) -> Optional["hypothesis.Verbosity"]:
     if value is None:
         return value
+    import hypothesis
+
     return hypothesis.Verbosity[value]
 
 
@@ -1,11 +1,59 @@
 # pylint: disable=too-many-instance-attributes
+import json
 import os
 import shutil
-from typing import List, Optional
+import tempfile
+from typing import IO, TYPE_CHECKING, Generator, List, Optional
 
 import attr
 
-from ..runner.serialization import SerializedTestResult
+if TYPE_CHECKING:
+    from ..runner.serialization import SerializedTestResult
+    from .output.dashboard import LiveStatistic
+
+
+@attr.s(slots=True)  # pragma: no mutate
+class DisplayedResults:
+    """Results of tested endpoints for the summary in the end of the run.
+
+    Only results with failures, errors or logs are displayed. They are appended to a temporary file and read back when
+    they are iterated, other results are only counted - memory usage doesn't grow with the number of endpoints.
+    """
+
+    _file: Optional[IO[str]] = attr.ib(default=None, init=False)  # pragma: no mutate
+    _count: int = attr.ib(default=0, init=False)  # pragma: no mutate
+
+    def append(self, result: "SerializedTestResult") -> None:
+        # pylint: disable=import-outside-toplevel
+        self._count += 1
+        if not (result.has_failures or result.has_errors or result.has_logs or result.is_errored):
+            return
+        from ..runner.results import serialize_test_result
+
+        if self._file is None:
+            self._file = tempfile.TemporaryFile("w+", encoding="utf-8")
+        # Iteration could be stopped in the middle of the file
+        self._file.seek(0, os.SEEK_END)
+        self._file.write(json.dumps(serialize_test_result(result), default=str))
+        self._file.write("\n")
+
+    def __iter__(self) -> Generator["SerializedTestResult", None, None]:
+        # pylint: disable=import-outside-toplevel
+        if self._file is None:
+            return
+        from ..runner.results import load_test_result
+
+        self._file.seek(0)
+        for line in self._file:
+            yield load_test_result(json.loads(line))
+
+    def __len__(self) -> int:
+        return self._count
+
+    def close(self) -> None:
+        if self._file is not None:
+            self._file.close()
+            self._file = None
 
 
 @attr.s(slots=True)  # pragma: no mutate
@@ -15,9 +63,12 @@ class ExecutionContext:
     hypothesis_output: List[str] = attr.ib(factory=list)  # pragma: no mutate
     workers_num: int = attr.ib(default=1)  # pragma: no mutate
     show_errors_tracebacks: bool = attr.ib(default=False)  # pragma: no mutate
+    profile_phases: bool = attr.ib(default=False)  # pragma: no mutate
     endpoints_processed: int = attr.ib(default=0)  # pragma: no mutate
     # It is set in runtime, from a `Initialized` event
     endpoints_count: Optional[int] = attr.ib(default=None)  # pragma: no mutate
     current_line_length: int = attr.ib(default=0)  # pragma: no mutate
     terminal_size: os.terminal_size = attr.ib(factory=shutil.get_terminal_size)  # pragma: no mutate
-    results: List[SerializedTestResult] = attr.ib(factory=list)  # pragma: no mutate
+    results: DisplayedResults = attr.ib(factory=DisplayedResults)  # pragma: no mutate
+    # Counters for the live dashboard, it is set in runtime, from a `Initialized` event
+    live_statistic: Optional["LiveStatistic"] = attr.ib(default=None)  # pragma: no mutate
@@ -1,5 +1,5 @@
 from enum import Enum
-from typing import List, Optional, Type, Union
+from typing import List, Optional, Sequence, Type, Union
 
 import click
 
@@ -24,6 +24,32 @@ class CSVOption(click.Choice):
         self.fail(f"invalid choice(s): {sorted_options}. Choose from {available_options}")
 
 
+class HypothesisCSVOption(CSVOption):
+    """Comma-separated members of an enum from the `hypothesis` package.
+
+    Member names are given explicitly, so Hypothesis is imported only when the option is converted, not on `--help`.
+    """
+
+    def __init__(self, enum_name: str, choices: Sequence[str]):  # pylint: disable=super-init-not-called
+        self.enum_name = enum_name
+        click.Choice.__init__(self, tuple(choices))  # pylint: disable=non-parent-init-called
+
+    @property  # type: ignore
+    def enum(self) -> Type[Enum]:  # type: ignore
+        import hypothesis  # pylint: disable=import-outside-toplevel
+
+        return getattr(hypothesis, self.enum_name)
+
+    def convert(
+        self, value: str, param: Optional[click.core.Parameter], ctx: Optional[click.core.Context]
+    ) -> List[Enum]:
+        try:
+            return super().convert(value, param, ctx)
+        except KeyError as exc:
+            # Older Hypothesis versions don't have some members
+            self.fail(f"{exc.args[0]} is not supported by the installed Hypothesis version")
+
+
 not_set = NotSet()
 
 
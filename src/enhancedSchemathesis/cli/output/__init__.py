@@ -1 +1 @@
-from . import default, short
+from . import dashboard, default, short
@@ -0,0 +1,104 @@
+"""Buffered standard output for the CLI.
+
+Click writes & flushes the stream on every `echo` call, i.e. multiple times per endpoint. With many fast endpoints
+terminal I/O slows down the whole run, therefore the CLI replaces `sys.stdout` with a buffer during the execution.
+Its content is written in batches - when the buffer is big or old enough, or from a separate rendering thread.
+"""
+import sys
+import threading
+import time
+from contextlib import contextmanager
+from typing import Generator, List, Optional, TextIO
+
+# Pending output is written at least this often, in seconds
+FLUSH_INTERVAL = 0.1  # pragma: no mutate
+# Number of pending characters, that are written immediately without a rendering thread
+MAX_BUFFER_SIZE = 64 * 1024  # pragma: no mutate
+
+
+class BufferedOutput:
+    """A text stream, that collects writes and passes them to the wrapped stream in batches.
+
+    With `threaded=True` the wrapped stream is written only from a separate thread, so writers never block on it.
+    """
+
+    def __init__(self, stream: TextIO, flush_interval: float = FLUSH_INTERVAL, threaded: bool = False) -> None:
+        self.stream = stream
+        self.flush_interval = flush_interval
+        self._chunks: List[str] = []
+        self._size = 0
+        self._last_drain = time.monotonic()
+        # Protects the pending chunks
+        self._lock = threading.Lock()
+        # Keeps the order of batches if they are drained from different threads
+        self._drain_lock = threading.Lock()
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+        if threaded:
+            self._thread = threading.Thread(target=self._render, name="schemathesis-output", daemon=True)
+            self._thread.start()
+
+    @property
+    def encoding(self) -> str:
+        return self.stream.encoding
+
+    @property
+    def errors(self) -> Optional[str]:
+        return self.stream.errors
+
+    def isatty(self) -> bool:
+        return self.stream.isatty()
+
+    def fileno(self) -> int:
+        return self.stream.fileno()
+
+    def writable(self) -> bool:
+        return True
+
+    def write(self, text: str) -> int:
+        if not isinstance(text, str):
+            raise TypeError(f"write() argument must be str, not {type(text).__name__}")
+        with self._lock:
+            self._chunks.append(text)
+            self._size += len(text)
+            is_due = self._size >= MAX_BUFFER_SIZE or time.monotonic() - self._last_drain >= self.flush_interval
+        if is_due and self._thread is None:
+            self.drain()
+        return len(text)
+
+    def flush(self) -> None:
+        """Do nothing - Click flushes after every message. Pending output is written by `drain`."""
+
+    def drain(self) -> None:
+        """Write all pending output to the wrapped stream."""
+        with self._drain_lock:
+            with self._lock:
+                chunks, self._chunks, self._size = self._chunks, [], 0
+                self._last_drain = time.monotonic()
+            if chunks:
+                self.stream.write("".join(chunks))
+                self.stream.flush()
+
+    def close(self) -> None:
+        """Stop the rendering thread & write the rest of the output."""
+        if self._thread is not None:
+            self._stop.set()
+            self._thread.join()
+            self._thread = None
+        self.drain()
+
+    def _render(self) -> None:
+        while not self._stop.wait(self.flush_interval):
+            self.drain()
+
+
+@contextmanager
+def buffered_stdout(threaded: bool = False) -> Generator[BufferedOutput, None, None]:
+    """Replace `sys.stdout` with a buffer, that is written to the original stream when the block exits."""
+    output = BufferedOutput(sys.stdout, threaded=threaded)
+    sys.stdout = output  # type: ignore
+    try:
+        yield output
+    finally:
+        sys.stdout = output.stream
+        output.close()
@@ -0,0 +1,182 @@
+"""Live dashboard for parallel runs in interactive terminals.
+
+The dashboard is redrawn in place a few times per second. Everything it shows is computed from counters, that are
+updated once per event, so redraws don't depend on the number of processed endpoints.
+"""
+import time
+from typing import List, Optional
+
+import attr
+import click
+
+from ...models import Status
+from ...phases import GENERATION
+from ...runner import events
+from ..context import ExecutionContext
+from . import default
+
+# Minimal time between redraws, in seconds
+REFRESH_INTERVAL = 0.25  # pragma: no mutate
+# Moves the cursor N lines up to the beginning of the line & clears a line
+CURSOR_UP = "\x1b[{}A\r"  # pragma: no mutate
+CLEAR_LINE = "\x1b[2K"  # pragma: no mutate
+
+
+def format_duration(seconds: float) -> str:
+    minutes, seconds = divmod(int(seconds), 60)
+    hours, minutes = divmod(minutes, 60)
+    if hours:
+        return f"{hours}h {minutes:02}m {seconds:02}s"
+    if minutes:
+        return f"{minutes}m {seconds:02}s"
+    return f"{seconds}s"
+
+
+def get_rate(count: int, seconds: float) -> float:
+    return count / seconds if seconds > 0 else 0.0
+
+
+@attr.s(slots=True)  # pragma: no mutate
+class LiveStatistic:
+    """Counters for the dashboard.
+
+    Workers don't report their identity, but each of them tests one endpoint at a time - every started endpoint
+    takes a free slot until it is finished.
+    """
+
+    workers: List[Optional[str]] = attr.ib()  # pragma: no mutate
+    endpoints_count: int = attr.ib()  # pragma: no mutate
+    start_time: float = attr.ib(factory=time.monotonic)  # pragma: no mutate
+    processed: int = attr.ib(default=0)  # pragma: no mutate
+    passed: int = attr.ib(default=0)  # pragma: no mutate
+    failed: int = attr.ib(default=0)  # pragma: no mutate
+    errored: int = attr.ib(default=0)  # pragma: no mutate
+    skipped: int = attr.ib(default=0)  # pragma: no mutate
+    requests: int = attr.ib(default=0)  # pragma: no mutate
+    examples: int = attr.ib(default=0)  # pragma: no mutate
+    server_errors: int = attr.ib(default=0)  # pragma: no mutate
+    # When the dashboard was drawn the last time & how many lines it takes
+    drawn_at: Optional[float] = attr.ib(default=None)  # pragma: no mutate
+    drawn_lines: int = attr.ib(default=0)  # pragma: no mutate
+
+    @classmethod
+    def from_event(cls, event: events.Initialized, workers_num: int) -> "LiveStatistic":
+        return cls(workers=[None] * workers_num, endpoints_count=event.endpoints_count, start_time=event.start_time)
+
+    def start(self, event: events.BeforeExecution) -> None:
+        name = f"{event.method} {event.path}"
+        if None in self.workers:
+            self.workers[self.workers.index(None)] = name
+        else:
+            self.workers.append(name)
+
+    def finish(self, event: events.AfterExecution) -> None:
+        name = f"{event.result.method} {event.result.path}"
+        if name in self.workers:
+            self.workers[self.workers.index(name)] = None
+        self.processed += 1
+        if event.result.is_skipped:
+            self.skipped += 1
+        elif event.status == Status.success:
+            self.passed += 1
+        elif event.status == Status.failure:
+            self.failed += 1
+        else:
+            self.errored += 1
+        self.requests += event.result.requests_count
+        self.examples += int(event.phases.get(GENERATION, {}).get("count", 0))
+        self.server_errors += sum(count for code, count in event.result.status_codes.items() if int(code) >= 500)
+
+    @property
+    def elapsed(self) -> float:
+        return time.monotonic() - self.start_time
+
+    @property
+    def eta(self) -> Optional[float]:
+        if not self.processed:
+            return None
+        remaining = max(self.endpoints_count - self.processed, 0)
+        return self.elapsed / self.processed * remaining
+
+    def render(self, width: int) -> List[str]:
+        """Dashboard lines, cut to the terminal width, so they are not wrapped."""
+        elapsed = self.elapsed
+        eta = self.eta
+        percentage = self.processed * 100 // self.endpoints_count if self.endpoints_count else 100
+        error_rate = (self.failed + self.errored) * 100 / self.processed if self.processed else 0.0
+        server_errors_rate = self.server_errors * 100 / self.requests if self.requests else 0.0
+        lines = [
+            f"Endpoints: {self.processed} / {self.endpoints_count} ({percentage}%)"
+            f"    Elapsed: {format_duration(elapsed)}"
+            f"    ETA: {format_duration(eta) if eta is not None else '-'}",
+            f"Throughput: {get_rate(self.requests, elapsed):.1f} requests/s"
+            f"    {get_rate(self.examples, elapsed):.1f} examples/s",
+            f"Results: {self.passed} passed, {self.failed} failed, {self.errored} errored, {self.skipped} skipped"
+            f"    Error rate: {error_rate:.1f}%    5xx responses: {server_errors_rate:.1f}%",
+        ]
+        for idx, endpoint in enumerate(self.workers, 1):
+            lines.append(f"Worker {idx}: {endpoint or 'idle'}")
+        return [line[:width] for line in lines]
+
+
+def draw(context: ExecutionContext, force: bool = False) -> None:
+    """Redraw the dashboard in place, at most once per `REFRESH_INTERVAL` unless forced."""
+    statistic = context.live_statistic
+    if statistic is None:
+        return
+    now = time.monotonic()
+    if not force and statistic.drawn_at is not None and now - statistic.drawn_at < REFRESH_INTERVAL:
+        return
+    lines = statistic.render(default.get_terminal_width())
+    if statistic.drawn_lines:
+        click.echo(CURSOR_UP.format(statistic.drawn_lines), nl=False)
+    for line in lines:
+        click.echo(CLEAR_LINE + line)
+    statistic.drawn_at = now
+    statistic.drawn_lines = len(lines)
+
+
+def handle_initialized(context: ExecutionContext, event: events.Initialized) -> None:
+    default.handle_initialized(context, event)
+    context.live_statistic = LiveStatistic.from_event(event, context.workers_num)
+    draw(context, force=True)
+
+
+def handle_before_execution(context: ExecutionContext, event: events.BeforeExecution) -> None:
+    if context.live_statistic is not None:
+        context.live_statistic.start(event)
+    draw(context)
+
+
+def handle_after_execution(context: ExecutionContext, event: events.AfterExecution) -> None:
+    context.endpoints_processed += 1
+    context.results.append(event.result)
+    context.hypothesis_output.extend(event.hypothesis_output)
+    if context.live_statistic is not None:
+        context.live_statistic.finish(event)
+    draw(context, force=context.endpoints_processed == context.endpoints_count)
+
+
+def handle_finished(context: ExecutionContext, event: events.Finished) -> None:
+    draw(context, force=True)
+    click.echo()
+    default.handle_finished(context, event)
+
+
+def handle_event(context: ExecutionContext, event: events.ExecutionEvent) -> None:
+    """Dashboard output style redraws live statistic instead of showing symbols in the progress bar.
+
+    Otherwise, identical to the default output style.
+    """
+    if isinstance(event, events.Initialized):
+        handle_initialized(context, event)
+    if isinstance(event, events.BeforeExecution):
+        handle_before_execution(context, event)
+    if isinstance(event, events.AfterExecution):
+        handle_after_execution(context, event)
+    if isinstance(event, events.Finished):
+        handle_finished(context, event)
+    if isinstance(event, events.Interrupted):
+        default.handle_interrupted(context, event)
+    if isinstance(event, events.InternalError):
+        default.handle_internal_error(context, event)
@@ -1,7 +1,11 @@
 import os
 import platform
 import shutil
-from typing import Any, Dict, List, Optional, Set, Tuple, Union, cast
+import signal
+import threading
+from contextlib import contextmanager
+from functools import lru_cache
+from typing import Any, Dict, Generator, List, Optional, Tuple, Union, cast
 
 import click
 from hypothesis import settings
@@ -10,14 +14,43 @@ from ..._compat import metadata
 from ...constants import __version__
 from ...models import Status
 from ...runner import events
-from ...runner.serialization import SerializedCase, SerializedCheck, SerializedTestResult
+from ...runner.serialization import SerializedCase, SerializedTestResult, get_unique_failures
 from ..context import ExecutionContext
 
 
+@lru_cache()
 def get_terminal_width() -> int:
+    """The width is needed for every endpoint, it is cached until the terminal is resized."""
     return shutil.get_terminal_size().columns
 
 
+@contextmanager
+def refresh_terminal_width_on_resize() -> Generator[None, None, None]:
+    """Reset the cached terminal width on `SIGWINCH`.
+
+    Signal handlers could be installed only from the main thread and `SIGWINCH` is not available on Windows, in these
+    cases the width is not refreshed during the run.
+    """
+    # The width could be cached by a previous run in the same process
+    get_terminal_width.cache_clear()
+    signum = getattr(signal, "SIGWINCH", None)
+    if signum is None or threading.current_thread() is not threading.main_thread():
+        yield
+        return
+    previous = signal.getsignal(signum)
+
+    def on_resize(*args: Any) -> None:
+        get_terminal_width.cache_clear()
+        if callable(previous):
+            previous(*args)
+
+    signal.signal(signum, on_resize)
+    try:
+        yield
+    finally:
+        signal.signal(signum, previous)
+
+
 def display_section_name(title: str, separator: str = "=", **kwargs: Any) -> None:
     """Print section name with separators in terminal with the given title nicely centered."""
     message = f" {title} ".center(get_terminal_width(), separator)
@@ -38,9 +71,12 @@ def get_percentage(position: int, length: int) -> str:
 
 def display_execution_result(context: ExecutionContext, event: events.AfterExecution) -> None:
     """Display an appropriate symbol for the given event's execution result."""
-    symbol, color = {Status.success: (".", "green"), Status.failure: ("F", "red"), Status.error: ("E", "red")}[
-        event.status
-    ]
+    if event.result.is_skipped:
+        symbol, color = "S", "yellow"
+    else:
+        symbol, color = {Status.success: (".", "green"), Status.failure: ("F", "red"), Status.error: ("E", "red")}[
+            event.status
+        ]
     context.current_line_length += len(symbol)
     click.secho(symbol, nl=False, fg=color)
 
@@ -74,6 +110,9 @@ def get_summary_message_parts(event: events.Finished) -> List[str]:
     errored = event.errored_count
     if errored:
         parts.append(f"{errored} errored")
+    skipped = event.skipped_count
+    if skipped:
+        parts.append(f"{skipped} skipped")
     return parts
 
 
@@ -147,32 +186,20 @@ def display_failures(context: ExecutionContext, event: events.Finished) -> None:
 def display_failures_for_single_test(result: SerializedTestResult) -> None:
     """Display a failure for a single method / endpoint."""
     display_subsection(result)
-    checks = _get_unique_failures(result.checks)
+    checks = get_unique_failures(result.checks)
     for idx, check in enumerate(checks, 1):
         message: Optional[str]
         if check.message:
             message = f"{idx}. {check.message}"
         else:
             message = None
-        example = cast(SerializedCase, check.example)  # filtered in `_get_unique_failures`
+        example = cast(SerializedCase, check.example)  # filtered in `get_unique_failures`
         display_example(example, check.name, message, result.seed)
         # Display every time except the last check
         if idx != len(checks):
             click.echo("\n")
 
 
-def _get_unique_failures(checks: List[SerializedCheck]) -> List[SerializedCheck]:
-    """Return only unique checks that should be displayed in the output."""
-    seen: Set[Tuple[str, Optional[str]]] = set()
-    unique_checks = []
-    for check in reversed(checks):
-        # There are also could be checks that didn't fail
-        if check.example is not None and check.value == Status.failure and (check.name, check.message) not in seen:
-            unique_checks.append(check)
-            seen.add((check.name, check.message))
-    return unique_checks
-
-
 def display_example(
     case: SerializedCase, check_name: Optional[str] = None, message: Optional[str] = None, seed: Optional[int] = None
 ) -> None:
@@ -253,6 +280,42 @@ def display_check_result(check_name: str, results: Dict[Union[str, Status], int]
     )
 
 
+def display_latency(event: events.Finished) -> None:
+    """Show percentiles of response times & the number of responses by status codes."""
+    if not event.latency:
+        return
+    click.echo()
+    percentiles = ", ".join(
+        f"{key} {event.latency[key] * 1000:.2f} ms" for key in ("p50", "p95", "p99") if key in event.latency
+    )
+    click.echo(
+        f"Response times: {percentiles} (max {event.latency['max'] * 1000:.2f} ms, {event.latency['count']} responses)"
+    )
+    if event.status_codes:
+        codes = ", ".join(f"{code}: {count}" for code, count in sorted(event.status_codes.items()))
+        click.echo(f"Status codes: {codes}")
+
+
+def display_phases(context: ExecutionContext, event: events.Finished) -> None:
+    """Show how much time was spent in each test phase, the slowest phases go first."""
+    if not context.profile_phases:
+        return
+    click.echo()
+    display_section_name("PHASES")
+    click.echo()
+    if not event.phases:
+        click.secho("No phases were measured.", bold=True)
+        return
+    columns = ("count", "total", "mean", "p50", "p95", "p99")
+    width = max(map(len, event.phases)) + 4
+    template = f"{{:<{width}}}" + "{:>12}" * len(columns)
+    header = (column if column == "count" else f"{column} (ms)" for column in columns)
+    click.secho(template.format("Phase", *header), bold=True)
+    for phase, statistic in sorted(event.phases.items(), key=lambda item: -item[1]["total"]):
+        values = [f"{statistic['count']:.0f}"] + [f"{statistic[column] * 1000:.2f}" for column in columns[1:]]
+        click.echo(template.format(phase, *values))
+
+
 def display_internal_error(context: ExecutionContext, event: events.InternalError) -> None:
     click.secho(event.message, fg="red")
     if event.exception:
@@ -315,6 +378,8 @@ def handle_finished(context: ExecutionContext, event: events.Finished) -> None:
     display_failures(context, event)
     display_application_logs(context, event)
     display_statistic(event)
+    display_latency(event)
+    display_phases(context, event)
     click.echo()
     display_summary(event)
 
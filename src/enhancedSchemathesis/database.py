@@ -0,0 +1,105 @@
+"""Persistent storage for examples found by Hypothesis.
+
+All endpoint tests are built from the same test function, therefore Hypothesis computes the same database key for
+all of them. `EndpointDatabase` separates them by the endpoint's method, path & a hash of its definition, so
+examples are replayed only for the endpoint they were found for and only while its definition is the same.
+"""
+import hashlib
+import json
+import os
+import sqlite3
+import threading
+from typing import Iterable, Union
+
+from hypothesis.database import DirectoryBasedExampleDatabase, ExampleDatabase
+
+from .models import Endpoint
+
+SQLITE_EXTENSIONS = (".db", ".sqlite", ".sqlite3")  # pragma: no mutate
+# Seconds to wait for a lock held by other processes
+SQLITE_TIMEOUT = 30  # pragma: no mutate
+
+
+def get_schema_hash(endpoint: Endpoint) -> str:
+    """A stable hash of the endpoint's definition."""
+    dumped = json.dumps(endpoint.definition, sort_keys=True, default=str)
+    return hashlib.sha256(dumped.encode("utf-8")).hexdigest()[:16]
+
+
+class EndpointDatabase(ExampleDatabase):
+    """A view of another database, where all keys are prefixed with the endpoint's identity."""
+
+    def __init__(self, database: ExampleDatabase, endpoint: Endpoint) -> None:
+        self.database = database
+        self.prefix = f"{endpoint.method.upper()} {endpoint.path}:{get_schema_hash(endpoint)}:".encode("utf-8")
+
+    def __repr__(self) -> str:
+        return f"EndpointDatabase({self.database!r}, {self.prefix!r})"
+
+    def save(self, key: bytes, value: bytes) -> None:
+        self.database.save(self.prefix + key, value)
+
+    def fetch(self, key: bytes) -> Iterable[bytes]:
+        return self.database.fetch(self.prefix + key)
+
+    def delete(self, key: bytes, value: bytes) -> None:
+        self.database.delete(self.prefix + key, value)
+
+    def move(self, src: bytes, dest: bytes, value: bytes) -> None:
+        self.database.move(self.prefix + src, self.prefix + dest, value)
+
+
+class SQLiteExampleDatabase(ExampleDatabase):
+    """Examples in a single SQLite file, that could be shared by multiple processes.
+
+    Every thread uses its own connection and concurrent writes are serialized by SQLite's locking.
+    """
+
+    def __init__(self, path: str) -> None:
+        self.path = path
+        self._local = threading.local()
+        with self._connection as connection:
+            connection.execute(
+                "CREATE TABLE IF NOT EXISTS examples (key BLOB NOT NULL, value BLOB NOT NULL, PRIMARY KEY (key, value))"
+            )
+
+    def __repr__(self) -> str:
+        return f"SQLiteExampleDatabase({self.path!r})"
+
+    @property
+    def _connection(self) -> sqlite3.Connection:
+        connection = getattr(self._local, "connection", None)
+        if connection is None:
+            connection = sqlite3.connect(self.path, timeout=SQLITE_TIMEOUT)
+            # Readers don't block writers & vice versa
+            connection.execute("PRAGMA journal_mode=WAL")
+            self._local.connection = connection
+        return connection
+
+    def save(self, key: bytes, value: bytes) -> None:
+        with self._connection as connection:
+            connection.execute("INSERT OR IGNORE INTO examples (key, value) VALUES (?, ?)", (key, value))
+
+    def fetch(self, key: bytes) -> Iterable[bytes]:
+        cursor = self._connection.execute("SELECT value FROM examples WHERE key = ?", (key,))
+        return [row[0] for row in cursor.fetchall()]
+
+    def delete(self, key: bytes, value: bytes) -> None:
+        with self._connection as connection:
+            connection.execute("DELETE FROM examples WHERE key = ? AND value = ?", (key, value))
+
+    def move(self, src: bytes, dest: bytes, value: bytes) -> None:
+        if src == dest:
+            self.save(src, value)
+            return
+        with self._connection as connection:
+            connection.execute("DELETE FROM examples WHERE key = ? AND value = ?", (src, value))
+            connection.execute("INSERT OR IGNORE INTO examples (key, value) VALUES (?, ?)", (dest, value))
+
+
+def open_database(location: Union[str, os.PathLike]) -> ExampleDatabase:
+    """Open a database by its location - a SQLite file (*.db, *.sqlite, *.sqlite3) or a directory."""
+    location = os.fspath(location)
+    if location.endswith(SQLITE_EXTENSIONS):
+        return SQLiteExampleDatabase(location)
+    return DirectoryBasedExampleDatabase(location)
@@ -0,0 +1,189 @@
+"""Dependencies between operations, declared via `execute_in_order`.
+
+Each `execute_in_order` entry is keyed by an operation in the "method:path" format. Its "store" list contains
+fields to save from the operation's responses and its "required" mapping defines, which parameters should be filled
+with values stored from other operations, in the "method:path:field" format.
+"""
+from collections import deque
+from typing import Any, Dict, List, Optional, Set, Tuple
+
+import attr
+
+from .models import Case, Endpoint
+from .store_result import ResponseStore
+
+# Locations in `required` that could be filled with stored values
+REQUIRED_LOCATIONS = ("path_parameters", "query", "body")  # pragma: no mutate
+# Missing values are distinguished from stored `None`
+NOT_STORED = object()  # pragma: no mutate
+
+
+def get_operation_key(endpoint: Endpoint) -> str:
+    """Operation identifier in the same format as keys in `execute_in_order`.
+
+    Paths in these keys are the same as in the schema, i.e. without the schema's base path.
+    """
+    path = endpoint.schema_path if endpoint.schema_path is not None else endpoint.path
+    return make_operation_key(endpoint.method, path)
+
+
+def make_operation_key(method: str, path: str) -> str:
+    return f"{method.lower()}:{path.lower()}"
+
+
+def normalize_operation_key(key: str) -> str:
+    """Convert an `execute_in_order` key, that could be in any case, to the `get_operation_key` format."""
+    method, _, path = key.partition(":")
+    return make_operation_key(method, path)
+
+
+def parse_dependency(value: str) -> Tuple[str, str]:
+    """Split a "method:path:field" dependency into the producer operation & the stored field."""
+    operation, field = value.rsplit(":", 1)
+    return operation, field
+
+
+def get_producers(execute_in_order: Dict[str, Any]) -> Dict[str, Set[str]]:
+    """Operations, values of which are needed for each operation."""
+    output: Dict[str, Set[str]] = {}
+    for operation, definition in execute_in_order.items():
+        producers = output.setdefault(operation.lower(), set())
+        for location, parameters in (definition.get("required") or {}).items():
+            if location not in REQUIRED_LOCATIONS:
+                continue
+            for dependency in parameters.values():
+                producer, _ = parse_dependency(dependency)
+                producers.add(producer.lower())
+    return output
+
+
+def sort_operations(execute_in_order: Dict[str, Any]) -> List[str]:
+    """Sort `execute_in_order` keys, so producers go before operations that depend on them.
+
+    Independent operations keep their original order. Operations from dependency cycles are placed in the end in the
+    original order, since there is no valid order for them.
+    """
+    keys = {key.lower(): key for key in execute_in_order}
+    producers = {
+        operation: {producer for producer in dependencies if producer in keys and producer != operation}
+        for operation, dependencies in get_producers(execute_in_order).items()
+    }
+    consumers: Dict[str, List[str]] = {operation: [] for operation in keys}
+    for operation, dependencies in producers.items():
+        for producer in dependencies:
+            consumers[producer].append(operation)
+    remaining = {operation: len(dependencies) for operation, dependencies in producers.items()}
+    ready = deque(operation for operation in keys if not remaining[operation])
+    output = []
+    while ready:
+        operation = ready.popleft()
+        output.append(operation)
+        for consumer in consumers[operation]:
+            remaining[consumer] -= 1
+            if not remaining[consumer]:
+                ready.append(consumer)
+    output.extend(operation for operation in keys if remaining[operation])
+    return [keys[operation] for operation in output]
+
+
+def parse_field_path(value: str) -> Tuple[str, ...]:
+    """Split a field reference into keys of nested JSON values.
+
+    Both dotted paths ("data.items.0.id") and JSON pointers ("/data/items/0/id") are supported.
+    """
+    if value.startswith("/"):
+        return tuple(part.replace("~1", "/").replace("~0", "~") for part in value[1:].split("/"))
+    return tuple(value.split("."))
+
+
+def get_field(data: Any, path: Tuple[str, ...]) -> Any:
+    """Get a nested value from a decoded JSON document. Returns `None` if there is no such value."""
+    for key in path:
+        if isinstance(data, dict):
+            data = data.get(key)
+        elif isinstance(data, list) and key.isdigit() and int(key) < len(data):
+            data = data[int(key)]
+        else:
+            return None
+    return data
+
+
+def set_field(container: Dict[str, Any], path: Tuple[str, ...], value: Any) -> None:
+    """Set a nested value, creating intermediate objects if needed."""
+    *parents, last = path
+    for key in parents:
+        child = container.get(key)
+        if not isinstance(child, dict):
+            child = container[key] = {}
+        container = child
+    container[last] = value
+
+
+@attr.s(slots=True)  # pragma: no mutate
+class Injection:
+    """Fill a parameter with a value stored from another operation."""
+
+    location: str = attr.ib()  # pragma: no mutate
+    target: Tuple[str, ...] = attr.ib()  # pragma: no mutate
+    producer: str = attr.ib()  # pragma: no mutate
+    field: str = attr.ib()  # pragma: no mutate
+
+
+@attr.s(slots=True)  # pragma: no mutate
+class DependencyPlan:
+    """Dependencies of a single operation, compiled from its `execute_in_order` entry."""
+
+    operation: str = attr.ib()  # pragma: no mutate
+    injections: List[Injection] = attr.ib(factory=list)  # pragma: no mutate
+    # Stored field names with their parsed paths in the response payload
+    extractions: List[Tuple[str, Tuple[str, ...]]] = attr.ib(factory=list)  # pragma: no mutate
+
+    def inject(self, case: Case, store: ResponseStore) -> None:
+        """Fill the case's parameters with already stored values. Values that are not stored yet are skipped."""
+        for injection in self.injections:
+            value = store.get(injection.producer, injection.field, NOT_STORED)
+            if value is NOT_STORED:
+                continue
+            container = getattr(case, injection.location)
+            if container is None:
+                container = {}
+                setattr(case, injection.location, container)
+            elif not isinstance(container, dict):
+                continue
+            set_field(container, injection.target, value)
+
+    def extract(self, data: Any) -> Dict[str, Any]:
+        """Values to store from a decoded response payload."""
+        return {name: get_field(data, path) for name, path in self.extractions}
+
+
+def _parse_target(location: str, name: str) -> Tuple[str, ...]:
+    # Only body properties could be nested, path & query parameter names are used as is
+    if location == "body" and name.startswith("/"):
+        return parse_field_path(name)
+    return (name,)
+
+
+def compile_plan(operation: str, definition: Dict[str, Any]) -> DependencyPlan:
+    """Parse all dependency strings & field paths of an `execute_in_order` entry."""
+    plan = DependencyPlan(operation=operation.lower())
+    for location, parameters in (definition.get("required") or {}).items():
+        if location not in REQUIRED_LOCATIONS:
+            continue
+        for name, dependency in parameters.items():
+            producer, field = parse_dependency(dependency)
+            plan.injections.append(Injection(location, _parse_target(location, name), producer.lower(), field))
+    for field in definition.get("store") or ():
+        plan.extractions.append((field, parse_field_path(field)))
+    return plan
+
+
+def get_dependency_plan(endpoint: Endpoint, execute_in_order: Optional[Dict[str, Any]]) -> Optional[DependencyPlan]:
+    """Compile the endpoint's dependencies. Returns `None` if there is no `execute_in_order` configuration at all."""
+    if not execute_in_order:
+        return None
+    operation = get_operation_key(endpoint)
+    for key, definition in execute_in_order.items():
+        if key.lower() == operation:
+            return compile_plan(operation, definition)
+    return DependencyPlan(operation=operation)
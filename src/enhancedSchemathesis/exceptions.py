@@ -1,5 +1,9 @@
+import threading
+from collections import OrderedDict
+from contextlib import contextmanager
 from hashlib import sha1
-from typing import Dict, Type, Union
+from itertools import islice
+from typing import Dict, Generator, Set, Type, Union
 
 import attr
 import requests
@@ -7,30 +11,84 @@ from jsonschema import ValidationError
 
 from .utils import WSGIResponse
 
-CACHE: Dict[Union[str, int], Type[AssertionError]] = {}
+# Failures are identified by structured keys, therefore the number of distinct classes is usually small.
+# The limit protects from unbounded growth with custom checks that produce a unique message on every call
+CACHE_MAX_SIZE = 4096  # pragma: no mutate
+CACHE: "OrderedDict[str, Type[AssertionError]]" = OrderedDict()
+# Checks are executed concurrently by `ThreadPoolRunner` workers
+CACHE_LOCK = threading.Lock()
+# Names of classes, that are used by running tests, with the number of such tests. They are never evicted
+PINNED: Dict[str, int] = {}
+# Names used by the test, that is running in the current thread
+_SCOPE = threading.local()
+
+
+@contextmanager
+def exception_scope() -> Generator[None, None, None]:
+    """Keep classes, that are used within the scope, in the cache until the scope is finished.
+
+    Hypothesis compares exception types to tell failures apart, therefore the class for the same failure should not
+    change while a test is running.
+    """
+    names: Set[str] = set()
+    previous = getattr(_SCOPE, "names", None)
+    _SCOPE.names = names
+    try:
+        yield
+    finally:
+        _SCOPE.names = previous
+        with CACHE_LOCK:
+            for name in names:
+                PINNED[name] -= 1
+                if not PINNED[name]:
+                    del PINNED[name]
+            _evict()
+
+
+def _evict() -> None:
+    # The least recently used classes go first. Pinned ones are skipped, so the cache could temporarily be larger
+    overflow = len(CACHE) - CACHE_MAX_SIZE
+    if overflow <= 0:
+        return
+    for name in list(islice((name for name in CACHE if name not in PINNED), overflow)):
+        del CACHE[name]
 
 
 def get_exception(name: str) -> Type[AssertionError]:
     """Create a new exception class with provided name or fetch one from cache."""
-    if name in CACHE:
-        exception_class = CACHE[name]
-    else:
-        exception_class = type(name, (AssertionError,), {})
-        CACHE[name] = exception_class
+    with CACHE_LOCK:
+        names = getattr(_SCOPE, "names", None)
+        if names is not None and name not in names:
+            names.add(name)
+            PINNED[name] = PINNED.get(name, 0) + 1
+        exception_class = CACHE.get(name)
+        if exception_class is None:
+            exception_class = type(name, (AssertionError,), {})
+            CACHE[name] = exception_class
+            _evict()
+        else:
+            CACHE.move_to_end(name)
     return exception_class
 
 
-def _get_hashed_exception(prefix: str, message: str) -> Type[AssertionError]:
-    """Give different exceptions for different error messages."""
-    messages_digest = sha1(message.encode("utf-8")).hexdigest()
-    name = f"{prefix}{messages_digest}"
+def _get_hashed_exception(prefix: str, key: str) -> Type[AssertionError]:
+    """Give different exceptions for different failure keys."""
+    digest = sha1(key.encode("utf-8")).hexdigest()
+    name = f"{prefix}{digest}"
     return get_exception(name)
 
 
+def _get_failure_key(exception: AssertionError) -> str:
+    # Built-in checks raise dedicated classes, that already identify the failure.
+    # Only plain assertions from custom checks are distinguished by their messages
+    if type(exception) is AssertionError:  # pylint: disable=unidiomatic-typecheck
+        return str(exception.args[0]) if exception.args else ""
+    return type(exception).__name__
+
+
 def get_grouped_exception(*exceptions: AssertionError) -> Type[AssertionError]:
-    messages = [exception.args[0] for exception in exceptions]
-    message = "".join(messages)
-    return _get_hashed_exception("GroupedException", message)
+    key = "|".join(_get_failure_key(exception) for exception in exceptions)
+    return _get_hashed_exception("GroupedException", key)
 
 
 def get_status_code_error(status_code: int) -> Type[AssertionError]:
@@ -46,8 +104,13 @@ def get_response_type_error(expected: str, received: str) -> Type[AssertionError
 
 
 def get_schema_validation_error(exception: ValidationError) -> Type[AssertionError]:
-    """Return new exception for schema validation error."""
-    return _get_hashed_exception("SchemaValidationError", str(exception))
+    """Return new exception for schema validation error.
+
+    The failed validator & its location in the schema identify the error. The string representation is not used,
+    since it contains the whole instance, which could be huge.
+    """
+    key = f"{exception.validator}:{'/'.join(map(str, exception.relative_schema_path))}"
+    return _get_hashed_exception("SchemaValidationError", key)
 
 
 class InvalidSchema(Exception):
@@ -1,18 +1,23 @@
-from functools import partial
-from typing import Any, Callable, Generator, List, Optional, Type, cast
+"""The plugin is loaded into every pytest session via the `pytest11` entry point.
+
+Until a test marked by schemathesis is collected, it only depends on pytest - Hypothesis, requests and the rest of
+the package are imported by the collector of such tests.
+"""
+import inspect
+from functools import partial, wraps
+from typing import TYPE_CHECKING, Any, Callable, Generator, List, Optional, Type, cast
 
 import pytest
 from _pytest import fixtures, nodes
 from _pytest.config import hookimpl
 from _pytest.fixtures import FuncFixtureInfo
 from _pytest.python import Class, Function, FunctionDefinition, Metafunc, Module, PyCollector
-from hypothesis.errors import InvalidArgument  # pylint: disable=ungrouped-imports
 from packaging import version
 
-from .._hypothesis import create_test
-from ..exceptions import InvalidSchema
-from ..models import Endpoint
-from ..utils import is_schemathesis_test
+if TYPE_CHECKING:
+    from ..models import Endpoint
+
+# pylint: disable=import-outside-toplevel
 
 USE_FROM_PARENT = version.parse(pytest.__version__) >= version.parse("5.4.0")
 
@@ -23,10 +28,10 @@ class SchemathesisCase(PyCollector):
         self.schemathesis_case = test_function._schemathesis_test  # type: ignore
         super().__init__(*args, **kwargs)
 
-    def _get_test_name(self, endpoint: Endpoint) -> str:
+    def _get_test_name(self, endpoint: "Endpoint") -> str:
         return f"{self.name}[{endpoint.method}:{endpoint.path}]"
 
-    def _gen_items(self, endpoint: Endpoint) -> Generator[Function, None, None]:
+    def _gen_items(self, endpoint: "Endpoint") -> Generator[Function, None, None]:
         """Generate all items for the given endpoint.
 
         Could produce more than one test item if
@@ -34,9 +39,13 @@ class SchemathesisCase(PyCollector):
 
         This implementation is based on the original one in pytest, but with slight adjustments
         to produce tests out of hypothesis ones.
+
+        Items only know their endpoint - the Hypothesis test is created when an item is set up, therefore tests,
+        that are deselected or collected by other xdist workers don't build strategies & draw explicit examples.
         """
         name = self._get_test_name(endpoint)
-        funcobj = self._make_test(endpoint)
+        funcobj = self._make_placeholder()
+        test_factory = self._make_test_factory(endpoint)
 
         cls = self._get_class_parent()
         if USE_FROM_PARENT:
@@ -54,7 +63,9 @@ class SchemathesisCase(PyCollector):
         else:
             create_function = SchemathesisFunction
         if not metafunc._calls:
-            yield create_function(name=name, parent=self.parent, callobj=funcobj, fixtureinfo=fixtureinfo)
+            yield create_function(
+                name=name, parent=self.parent, callobj=funcobj, fixtureinfo=fixtureinfo, test_factory=test_factory
+            )
         else:
             fixtures.add_funcarg_pseudo_fixture_def(self.parent, metafunc, fixturemanager)
             fixtureinfo.prune_dependency_tree()
@@ -68,6 +79,7 @@ class SchemathesisCase(PyCollector):
                     fixtureinfo=fixtureinfo,
                     keywords={callspec.id: True},
                     originalname=name,
+                    test_factory=test_factory,
                 )
 
     def _get_class_parent(self) -> Optional[Type]:
@@ -88,11 +100,41 @@ class SchemathesisCase(PyCollector):
         self.ihook.pytest_generate_tests.call_extra(methods, {"metafunc": metafunc})
         return metafunc
 
-    def _make_test(self, endpoint: Endpoint) -> Callable:
+    def _make_placeholder(self) -> Callable:
+        """A function with the same signature & attributes as the Hypothesis test, but without the `case` argument.
+
+        Pytest resolves fixtures & markers of items from it during collection.
+        """
+        signature = inspect.signature(self.test_function)
+
+        @wraps(self.test_function)
+        def placeholder(*args: Any, **kwargs: Any) -> None:
+            raise RuntimeError("The test is created during the item setup")
+
+        parameters = [parameter for name, parameter in signature.parameters.items() if name != "case"]
+        placeholder.__signature__ = signature.replace(parameters=parameters)  # type: ignore
+        return placeholder
+
+    def _make_test_factory(self, endpoint: "Endpoint") -> Callable[[], Callable]:
+        """The test is created once and shared by all items of the endpoint, e.g. with `pytest.mark.parametrize`."""
+        test: Optional[Callable] = None
+
+        def factory() -> Callable:
+            nonlocal test
+            if test is None:
+                test = self._make_test(endpoint)
+            return test
+
+        return factory
+
+    def _make_test(self, endpoint: "Endpoint") -> Callable:
+        from .._hypothesis import create_test
+        from ..exceptions import InvalidSchema
+
         try:
             return create_test(endpoint, self.test_function)
         except InvalidSchema:
-            return lambda: pytest.fail("Invalid schema for endpoint")
+            return lambda *args, **kwargs: pytest.fail("Invalid schema for endpoint")
 
     def collect(self) -> List[Function]:  # type: ignore
         """Generate different test items for all endpoints available in the given schema."""
@@ -105,6 +147,19 @@ class SchemathesisCase(PyCollector):
 
 
 class SchemathesisFunction(Function):  # pylint: disable=too-many-ancestors
+    def __init__(self, *args: Any, test_factory: Callable[[], Callable], **kwargs: Any) -> None:
+        super().__init__(*args, **kwargs)
+        self.test_factory = test_factory
+        self.is_test_created = False
+        # The Hypothesis plugin can't detect Hypothesis tests by placeholders
+        self.add_marker("hypothesis")
+
+    def create_test(self) -> None:
+        """Replace the placeholder, that was used during collection, with the Hypothesis test."""
+        if not self.is_test_created:
+            self.obj = self.test_factory()
+            self.is_test_created = True
+
     def _getobj(self) -> partial:
         """Tests defined as methods require `self` as the first argument.
 
@@ -113,6 +168,18 @@ class SchemathesisFunction(Function):  # pylint: disable=too-many-ancestors
         return partial(self.obj, self.parent.obj)
 
 
+def is_schemathesis_test(obj: Any) -> bool:
+    try:
+        # A cheap check goes first, so the rest of the package is not imported for regular tests
+        if not hasattr(obj, "_schemathesis_test"):
+            return False
+    except Exception:
+        return False
+    from ..utils import is_schemathesis_test as _is_schemathesis_test
+
+    return _is_schemathesis_test(obj)
+
+
 @hookimpl(hookwrapper=True)  # type:ignore # pragma: no mutate
 def pytest_pycollect_makeitem(collector: nodes.Collector, name: str, obj: Any) -> Generator[None, Any, None]:
     """Switch to a different collector if the test is parametrized marked by schemathesis."""
@@ -127,6 +194,13 @@ def pytest_pycollect_makeitem(collector: nodes.Collector, name: str, obj: Any) -
         outcome.get_result()
 
 
+@hookimpl(tryfirst=True)  # pragma: no mutate
+def pytest_runtest_setup(item: nodes.Item) -> None:
+    """Create the test before other plugins inspect `item.obj` during the setup."""
+    if isinstance(item, SchemathesisFunction):
+        item.create_test()
+
+
 @hookimpl(hookwrapper=True)  # pragma: no mutate
 def pytest_pyfunc_call(pyfuncitem):  # type:ignore
     """It is possible to have a Hypothesis exception in runtime.
@@ -136,5 +210,10 @@ def pytest_pyfunc_call(pyfuncitem):  # type:ignore
     outcome = yield
     try:
         outcome.get_result()
-    except InvalidArgument as exc:
+    except Exception as exc:
+        # Hypothesis is already imported if it raised the exception
+        from hypothesis.errors import InvalidArgument
+
+        if not isinstance(exc, InvalidArgument):
+            raise
         pytest.fail(exc.args[0])
@@ -0,0 +1,97 @@
+"""Fixed-memory histogram of response times.
+
+Durations are put into log-linear buckets, the same way as in HDR histograms: every power of two of microseconds is
+split into `SUB_BUCKETS` equal parts. It keeps the relative error of percentiles under 1 / SUB_BUCKETS with at most
+`MAX_EXPONENT * SUB_BUCKETS` buckets, no matter how many responses were recorded. Histograms are merged by adding
+bucket counts, therefore results of different workers or shards could be combined without losing precision.
+"""
+import math
+from typing import Any, Dict, Optional
+
+import attr
+
+# Percentiles, that are reported for response times & durations of test phases
+PERCENTILES = (50, 95, 99)  # pragma: no mutate
+SUB_BUCKETS = 32  # pragma: no mutate
+# 2 ** 40 microseconds is about 12 days, longer durations go to the last bucket
+MAX_EXPONENT = 40  # pragma: no mutate
+MICROSECONDS = 1_000_000  # pragma: no mutate
+
+
+def get_bucket(seconds: float) -> int:
+    value = max(seconds * MICROSECONDS, 1.0)
+    exponent = min(int(math.log2(value)), MAX_EXPONENT - 1)
+    sub_bucket = min(int((value / 2 ** exponent - 1) * SUB_BUCKETS), SUB_BUCKETS - 1)
+    return exponent * SUB_BUCKETS + sub_bucket
+
+
+def get_bucket_upper_bound(bucket: int) -> float:
+    """The highest duration in seconds, that goes to the bucket."""
+    exponent, sub_bucket = divmod(bucket, SUB_BUCKETS)
+    return 2 ** exponent * (1 + (sub_bucket + 1) / SUB_BUCKETS) / MICROSECONDS
+
+
+@attr.s(slots=True)  # pragma: no mutate
+class LatencyHistogram:
+    """Response times in seconds."""
+
+    buckets: Dict[int, int] = attr.ib(factory=dict)  # pragma: no mutate
+    count: int = attr.ib(default=0)  # pragma: no mutate
+    total: float = attr.ib(default=0.0)  # pragma: no mutate
+    min: Optional[float] = attr.ib(default=None)  # pragma: no mutate
+    max: Optional[float] = attr.ib(default=None)  # pragma: no mutate
+
+    def record(self, seconds: float) -> None:
+        bucket = get_bucket(seconds)
+        self.buckets[bucket] = self.buckets.get(bucket, 0) + 1
+        self.count += 1
+        self.total += seconds
+        self.min = seconds if self.min is None else min(self.min, seconds)
+        self.max = seconds if self.max is None else max(self.max, seconds)
+
+    def merge(self, other: "LatencyHistogram") -> None:
+        for bucket, count in other.buckets.items():
+            self.buckets[bucket] = self.buckets.get(bucket, 0) + count
+        self.count += other.count
+        self.total += other.total
+        if other.min is not None:
+            self.min = other.min if self.min is None else min(self.min, other.min)
+        if other.max is not None:
+            self.max = other.max if self.max is None else max(self.max, other.max)
+
+    def get_percentile(self, percentile: int) -> Optional[float]:
+        """Nearest-rank percentile, precise up to the bucket width."""
+        if not self.count:
+            return None
+        rank = max((self.count * percentile + 99) // 100, 1)
+        seen = 0
+        for bucket in sorted(self.buckets):
+            seen += self.buckets[bucket]
+            if seen >= rank:
+                # Bucket bounds could be wider than the observed values
+                return min(max(get_bucket_upper_bound(bucket), self.min), self.max)  # type: ignore
+        return self.max
+
+    def summary(self) -> Dict[str, float]:
+        """Count, mean, min, max & percentiles. Empty if nothing was recorded."""
+        if not self.count:
+            return {}
+        summary = {"count": self.count, "mean": self.total / self.count, "min": self.min, "max": self.max}
+        for percentile in PERCENTILES:
+            summary[f"p{percentile}"] = self.get_percentile(percentile)
+        return summary  # type: ignore
+
+    def serialize(self) -> Dict[str, Any]:
+        """Summary with raw buckets & total, so the histogram could be restored via `deserialize` and merged."""
+        return {**self.summary(), "total": self.total, "buckets": dict(self.buckets)}
+
+    @classmethod
+    def deserialize(cls, data: Dict[str, Any]) -> "LatencyHistogram":
+        # Bucket keys are strings after a JSON round trip
+        return cls(
+            buckets={int(bucket): count for bucket, count in data.get("buckets", {}).items()},
+            count=data.get("count", 0),
+            total=data.get("total", 0.0),
+            min=data.get("min"),
+            max=data.get("max"),
+        )
@@ -1,6 +1,6 @@
 # pylint: disable=too-many-arguments
 import pathlib
-from typing import IO, Any, Callable, Dict, Optional, Union
+from typing import IO, TYPE_CHECKING, Any, Callable, Dict, Optional, Union
 from urllib.parse import urljoin
 
 import jsonschema
@@ -9,15 +9,16 @@ import yaml
 from jsonschema import ValidationError
 from werkzeug.test import Client
 
-from . import spec_schemas
 from .constants import USER_AGENT
 from .exceptions import HTTPError
-from .lazy import LazySchema
 from .schemas import BaseSchema, OpenApi30, SwaggerV20
 from .types import Filter, PathLike
 from .utils import NOT_SET, StringDatesYAMLLoader, WSGIResponse, get_base_url
 from collections import OrderedDict
 
+if TYPE_CHECKING:
+    from .lazy import LazySchema
+
 
 def from_path(
     path: PathLike,
@@ -122,7 +123,7 @@ def from_dict(
 ) -> BaseSchema:
     """Get a proper abstraction for the given raw schema."""
     if "swagger" in raw_schema:
-        _maybe_validate_schema(raw_schema, spec_schemas.SWAGGER_20, validate_schema)
+        _maybe_validate_schema(raw_schema, "SWAGGER_20", validate_schema)
         return SwaggerV20(
             raw_schema,
             location=location,
@@ -136,7 +137,7 @@ def from_dict(
         )
 
     if "openapi" in raw_schema:
-        _maybe_validate_schema(raw_schema, spec_schemas.OPENAPI_30, validate_schema)    
+        _maybe_validate_schema(raw_schema, "OPENAPI_30", validate_schema)
         return OpenApi30(
             raw_schema,
             location=location,
@@ -151,12 +152,18 @@ def from_dict(
     raise ValueError("Unsupported schema type")
 
 
-def _maybe_validate_schema(instance: Union[Dict[str, Any],OrderedDict], schema: Dict[str, Any], validate_schema: bool) -> None:
+def _maybe_validate_schema(instance: Union[Dict[str, Any],OrderedDict], spec: str, validate_schema: bool) -> None:
     if validate_schema:
+        # Meta-schemas are big, they are loaded only if validation is needed
+        from .spec_schemas import get_validator  # pylint: disable=import-outside-toplevel
+
         try:
-            jsonschema.validate(instance, schema)
+            # The same as `jsonschema.validate`, but the validator is not re-created & re-checked for every schema
+            error = jsonschema.exceptions.best_match(get_validator(spec).iter_errors(instance))
         except TypeError:
             raise ValidationError("Invalid schema")
+        if error is not None:
+            raise error
 
 
 def from_pytest_fixture(
@@ -164,8 +171,10 @@ def from_pytest_fixture(
     method: Optional[Filter] = NOT_SET,
     endpoint: Optional[Filter] = NOT_SET,
     tag: Optional[Filter] = NOT_SET,
-) -> LazySchema:
+) -> "LazySchema":
     """Needed for a consistent library API."""
+    from .lazy import LazySchema  # pylint: disable=import-outside-toplevel
+
     return LazySchema(fixture_name, method=method, endpoint=endpoint, tag=tag)
 
 
@@ -1,4 +1,5 @@
 # pylint: disable=too-many-instance-attributes
+import threading
 from collections import Counter
 from contextlib import contextmanager
 from enum import IntEnum
@@ -13,6 +14,8 @@ from hypothesis.strategies import SearchStrategy
 
 from .checks import ALL_CHECKS
 from .exceptions import InvalidSchema
+from .latency import LatencyHistogram
+from .phases import PhaseTimings
 from .types import Body, Cookies, FormData, Headers, Hook, PathParameters, Query
 from .utils import GenericResponse, WSGIResponse
 
@@ -230,6 +233,8 @@ class Endpoint:
     query: Optional[Query] = attr.ib(default=None)  # pragma: no mutate
     body: Optional[Body] = attr.ib(default=None)  # pragma: no mutate
     form_data: Optional[FormData] = attr.ib(default=None)  # pragma: no mutate
+    # Path as it is in the schema, without the schema's base path. `path` is used if it is not set
+    schema_path: Optional[str] = attr.ib(default=None, cmp=False)  # pragma: no mutate
 
     def as_strategy(self, hooks: Optional[Dict[str, Hook]] = None) -> SearchStrategy:
         from ._hypothesis import get_case_strategy  # pylint: disable=import-outside-toplevel
@@ -269,9 +274,32 @@ class TestResult:
     logs: List[LogRecord] = attr.ib(factory=list)  # pragma: no mutate
     is_errored: bool = attr.ib(default=False)  # pragma: no mutate
     seed: Optional[int] = attr.ib(default=None)  # pragma: no mutate
+    # The endpoint was not tested, since the run's limits were exhausted before it
+    is_skipped: bool = attr.ib(default=False)  # pragma: no mutate
     response_status_code: int = attr.ib(default=600)
     response_error_result: Optional[Union[str, dict]] = attr.ib(default="Not Executed")
     response_time_in_sec: Optional[str] = attr.ib(default='0 sec')
+    # Number of sent requests and their total duration in seconds
+    requests_count: int = attr.ib(default=0)  # pragma: no mutate
+    requests_time: float = attr.ib(default=0.0)  # pragma: no mutate
+    phases: PhaseTimings = attr.ib(factory=PhaseTimings)  # pragma: no mutate
+    # Response times & status codes of all received responses
+    latency: LatencyHistogram = attr.ib(factory=LatencyHistogram)  # pragma: no mutate
+    status_codes: Dict[int, int] = attr.ib(factory=dict)  # pragma: no mutate
+    # Per-check tallies, maintained by `add_success` / `add_failure` to avoid rescanning `checks`
+    _check_stats: Dict[str, Counter] = attr.ib(factory=dict, init=False)  # pragma: no mutate
+    _failures_count: int = attr.ib(default=0, init=False)  # pragma: no mutate
+
+    def __attrs_post_init__(self) -> None:
+        for check in self.checks:
+            self._track_check(check)
+
+    def _track_check(self, check: Check) -> None:
+        counter = self._check_stats.setdefault(check.name, Counter())
+        counter[check.value] += 1
+        counter["total"] += 1
+        if check.value == Status.failure:
+            self._failures_count += 1
 
     def mark_errored(self) -> None:
         self.is_errored = True
@@ -282,23 +310,33 @@ class TestResult:
 
     @property
     def has_failures(self) -> bool:
-        return any(check.value == Status.failure for check in self.checks)
+        return self._failures_count > 0
 
     @property
     def has_logs(self) -> bool:
         return bool(self.logs)
 
+    @property
+    def check_stats(self) -> Dict[str, Counter]:
+        """Number of executed checks grouped by check name and status."""
+        return self._check_stats
+
+    def _add_check(self, check: Check) -> None:
+        self.checks.append(check)
+        self._track_check(check)
+
     def add_success(self, name: str, example: Case) -> None:
-        self.checks.append(Check(name, Status.success, example))
+        self._add_check(Check(name, Status.success, example))
 
     def add_failure(self, name: str, example: Case, message: str) -> None:
-        self.checks.append(Check(name, Status.failure, example, message))
+        self._add_check(Check(name, Status.failure, example, message))
 
     def add_error(self, exception: Exception, example: Optional[Case] = None) -> None:
         self.errors.append((exception, example))
 
     def add_status_code(self, code: int) -> None:
         self.response_status_code = code
+        self.status_codes[code] = self.status_codes.get(code, 0) + 1
     
     def add_response_error_result(self, error: Union[str, dict]) -> None:
         self.response_error_result = error
@@ -306,12 +344,46 @@ class TestResult:
     def add_response_elapsed_time(self, _time: str) -> None:
         self.response_time_in_sec = _time
 
+    def add_request(self, elapsed: float) -> None:
+        """Account a sent request, that took `elapsed` seconds."""
+        self.requests_count += 1
+        self.requests_time += elapsed
+
+    def add_response_time(self, elapsed: float) -> None:
+        """Account a received response, that took `elapsed` seconds."""
+        self.latency.record(elapsed)
+        self.response_time_in_sec = f"{elapsed} sec"
+
 
 @attr.s(slots=True, repr=False)  # pragma: no mutate
 class TestResultSet:
-    """Set of multiple test results."""
+    """Set of multiple test results.
+
+    All aggregates are updated on `append`, therefore they are cheap to read at any moment of the run.
+    Results should not be modified after they are added to the set. Appended results are kept in `results` only if
+    `keep_results` is set, otherwise the memory usage doesn't depend on the number of tested endpoints.
+    """
 
     results: List[TestResult] = attr.ib(factory=list)  # pragma: no mutate
+    keep_results: bool = attr.ib(default=False)  # pragma: no mutate
+    _count: int = attr.ib(default=0, init=False)  # pragma: no mutate
+    _passed_count: int = attr.ib(default=0, init=False)  # pragma: no mutate
+    _failed_count: int = attr.ib(default=0, init=False)  # pragma: no mutate
+    _errored_count: int = attr.ib(default=0, init=False)  # pragma: no mutate
+    _skipped_count: int = attr.ib(default=0, init=False)  # pragma: no mutate
+    _has_failures: bool = attr.ib(default=False, init=False)  # pragma: no mutate
+    _has_errors: bool = attr.ib(default=False, init=False)  # pragma: no mutate
+    _has_logs: bool = attr.ib(default=False, init=False)  # pragma: no mutate
+    _total: Dict[str, Counter] = attr.ib(factory=dict, init=False)  # pragma: no mutate
+    _phases: PhaseTimings = attr.ib(factory=PhaseTimings, init=False)  # pragma: no mutate
+    _latency: LatencyHistogram = attr.ib(factory=LatencyHistogram, init=False)  # pragma: no mutate
+    _status_codes: Dict[int, int] = attr.ib(factory=dict, init=False)  # pragma: no mutate
+    # Results are appended from multiple threads by `ThreadPoolRunner`
+    _lock: threading.Lock = attr.ib(factory=threading.Lock, init=False)  # pragma: no mutate
+
+    def __attrs_post_init__(self) -> None:
+        for result in self.results:
+            self._track_result(result)
 
     def __iter__(self) -> Iterator[TestResult]:
         return iter(self.results)
@@ -319,55 +391,89 @@ class TestResultSet:
     @property
     def is_empty(self) -> bool:
         """If the result set contains no results."""
-        return len(self.results) == 0
+        return self._count == 0
 
     @property
     def has_failures(self) -> bool:
         """If any result has any failures."""
-        return any(result.has_failures for result in self)
+        return self._has_failures
 
     @property
     def has_errors(self) -> bool:
         """If any result has any errors."""
-        return any(result.has_errors for result in self)
+        return self._has_errors
 
     @property
     def has_logs(self) -> bool:
         """If any result has any captured logs."""
-        return any(result.has_logs for result in self)
-
-    def _count(self, predicate: Callable) -> int:
-        return sum(1 for result in self if predicate(result))
+        return self._has_logs
 
     @property
     def passed_count(self) -> int:
-        return self._count(lambda result: not result.has_errors and not result.has_failures)
+        return self._passed_count
 
     @property
     def failed_count(self) -> int:
-        return self._count(lambda result: result.has_failures and not result.is_errored)
+        return self._failed_count
 
     @property
     def errored_count(self) -> int:
-        return self._count(lambda result: result.has_errors or result.is_errored)
+        return self._errored_count
+
+    @property
+    def skipped_count(self) -> int:
+        return self._skipped_count
 
     @property
     def total(self) -> Dict[str, Dict[Union[str, Status], int]]:
         """Aggregated statistic about test results."""
-        output: Dict[str, Dict[Union[str, Status], int]] = {}
-        for item in self.results:
-            for check in item.checks:
-                output.setdefault(check.name, Counter())
-                output[check.name][check.value] += 1
-                output[check.name]["total"] += 1
         # Avoid using Counter, since its behavior could harm in other places:
         # `if not total["unknown"]:` - this will lead to the branch execution
         # It is better to let it fail if there is a wrong key
-        return {key: dict(value) for key, value in output.items()}
+        return {key: dict(value) for key, value in self._total.items()}
+
+    @property
+    def phases(self) -> PhaseTimings:
+        """Durations of test phases for all results."""
+        return self._phases
+
+    @property
+    def latency(self) -> LatencyHistogram:
+        """Response times of all results."""
+        return self._latency
+
+    @property
+    def status_codes(self) -> Dict[int, int]:
+        return dict(self._status_codes)
+
+    def _track_result(self, item: TestResult) -> None:
+        self._count += 1
+        has_failures = item.has_failures
+        has_errors = item.has_errors
+        if item.is_skipped:
+            self._skipped_count += 1
+        elif not has_errors and not has_failures:
+            self._passed_count += 1
+        if has_failures and not item.is_errored:
+            self._failed_count += 1
+        if has_errors or item.is_errored:
+            self._errored_count += 1
+        self._has_failures |= has_failures
+        self._has_errors |= has_errors
+        self._has_logs |= item.has_logs
+        for name, counter in item.check_stats.items():
+            self._total.setdefault(name, Counter()).update(counter)
+        self._phases.extend(item.phases)
+        self._latency.merge(item.latency)
+        for code, count in item.status_codes.items():
+            self._status_codes[code] = self._status_codes.get(code, 0) + count
 
     def append(self, item: TestResult) -> None:
-        """Add a new item to the results list."""
-        self.results.append(item)
+        """Count a new item in the aggregates & keep it in the results list if needed."""
+        with self._lock:
+            if self.keep_results:
+                self.results.append(item)
+            self._track_result(item)
 
 
 CheckFunction = Callable[[GenericResponse, Case], None]  # pragma: no mutate
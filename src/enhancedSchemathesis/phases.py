@@ -0,0 +1,61 @@
+"""Timers for phases of endpoint tests - strategy creation, data generation, network requests, checks, etc.
+
+Durations of each phase are recorded into a fixed-memory histogram, so timers don't grow with the number of examples.
+"""
+import time
+from contextlib import contextmanager
+from typing import Dict, Generator
+
+import attr
+
+from .latency import LatencyHistogram
+
+STRATEGY = "strategy"  # pragma: no mutate
+GENERATION = "generation"  # pragma: no mutate
+NETWORK = "network"  # pragma: no mutate
+CHECKS_PREFIX = "check:"  # pragma: no mutate
+SHRINKING = "shrinking"  # pragma: no mutate
+SERIALIZATION = "serialization"  # pragma: no mutate
+
+
+@attr.s(slots=True)  # pragma: no mutate
+class PhaseTimings:
+    """Durations of phases for a single endpoint test, in seconds.
+
+    After the first failure Hypothesis only shrinks the failing example, therefore all the following generation,
+    network & checks time is accounted as shrinking.
+    """
+
+    durations: Dict[str, LatencyHistogram] = attr.ib(factory=dict)  # pragma: no mutate
+    is_shrinking: bool = attr.ib(default=False)  # pragma: no mutate
+
+    def add(self, phase: str, duration: float) -> None:
+        if self.is_shrinking and phase != SERIALIZATION:
+            phase = SHRINKING
+        histogram = self.durations.get(phase)
+        if histogram is None:
+            histogram = self.durations[phase] = LatencyHistogram()
+        histogram.record(duration)
+
+    @contextmanager
+    def measure(self, phase: str) -> Generator[None, None, None]:
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.add(phase, time.perf_counter() - start)
+
+    def start_shrinking(self) -> None:
+        self.is_shrinking = True
+
+    def extend(self, other: "PhaseTimings") -> None:
+        for phase, histogram in other.durations.items():
+            self.durations.setdefault(phase, LatencyHistogram()).merge(histogram)
+
+    def summary(self) -> Dict[str, Dict[str, float]]:
+        """Count, total, mean & percentiles of durations for each phase."""
+        return {
+            phase: {**histogram.summary(), "total": histogram.total}
+            for phase, histogram in self.durations.items()
+            if histogram.count
+        }
@@ -2,15 +2,22 @@ from typing import Any, Callable, Dict, Generator, Iterable, List, Optional, Tup
 from urllib.parse import urlparse
 
 import hypothesis.errors
+from hypothesis.database import ExampleDatabase
 
 from .. import loaders
 from ..checks import DEFAULT_CHECKS
-from ..models import CheckFunction
+from ..database import open_database
+from ..models import CheckFunction, Endpoint
 from ..schemas import BaseSchema
 from ..types import Filter, NotSet, RawAuth
 from ..utils import dict_not_none_values, dict_true_values, file_exists, get_base_url, get_requests_auth, import_app
+from ..value_pool import ValuePool
 from . import events
 from .impl import BaseRunner, SingleThreadRunner, SingleThreadWSGIRunner, ThreadPoolRunner, ThreadPoolWSGIRunner
+from .impl.budget import DEFAULT_STALE_LIMIT, ExampleBudget
+from .impl.history import TimingHistory
+from .impl.limits import RateLimiter, RunLimits
+from .impl.sharding import Shard
 from collections import OrderedDict
 
 def prepare(  # pylint: disable=too-many-arguments
@@ -34,7 +41,18 @@ def prepare(  # pylint: disable=too-many-arguments
     app: Optional[str] = None,
     validate_schema: bool = True,
     execute_in_order: Optional[dict] = None,
+    value_pool_probability: Optional[float] = None,
+    adaptive_budget: bool = False,
+    adaptive_budget_total: Optional[int] = None,
+    adaptive_budget_stale_limit: int = DEFAULT_STALE_LIMIT,
+    max_duration: Optional[float] = None,
+    max_requests: Optional[int] = None,
+    rate_limit: Optional[float] = None,
+    shard: Optional[Tuple[int, int]] = None,
+    shard_timings: Optional[Dict[str, float]] = None,
+    timing_history: Optional[str] = None,
     # Hypothesis-specific configuration
+    hypothesis_database: Optional[Union[str, ExampleDatabase]] = None,
     hypothesis_deadline: Optional[Union[int, NotSet]] = None,
     hypothesis_derandomize: Optional[bool] = None,
     hypothesis_max_examples: Optional[int] = None,
@@ -50,6 +68,9 @@ def prepare(  # pylint: disable=too-many-arguments
     if auth is None:
         # Auth type doesn't matter if auth is not passed
         auth_type = None  # type: ignore
+    if rate_limit is not None and hypothesis_deadline is None:
+        # Waiting for the rate limit is a part of the test's duration & would exceed the default deadline
+        hypothesis_deadline = NotSet()
     hypothesis_options = prepare_hypothesis_options(
         deadline=hypothesis_deadline,
         derandomize=hypothesis_derandomize,
@@ -59,6 +80,8 @@ def prepare(  # pylint: disable=too-many-arguments
         suppress_health_check=hypothesis_suppress_health_check,
         verbosity=hypothesis_verbosity,
     )
+    if isinstance(hypothesis_database, str):
+        hypothesis_database = open_database(hypothesis_database)
     return execute_from_schema(
         schema_uri=schema_uri,
         loader=loader,
@@ -78,6 +101,16 @@ def prepare(  # pylint: disable=too-many-arguments
         headers=headers,
         request_timeout=request_timeout,
         execute_in_order=execute_in_order,
+        value_pool_probability=value_pool_probability,
+        adaptive_budget=adaptive_budget,
+        adaptive_budget_total=adaptive_budget_total,
+        adaptive_budget_stale_limit=adaptive_budget_stale_limit,
+        max_duration=max_duration,
+        max_requests=max_requests,
+        rate_limit=rate_limit,
+        example_database=hypothesis_database,
+        shard=Shard(*shard, timings=shard_timings or {}) if shard is not None else None,
+        timing_history=TimingHistory.load(timing_history) if timing_history is not None else None,
     )
 
 
@@ -118,6 +151,16 @@ def execute_from_schema(
     headers: Optional[Dict[str, Any]] = None,
     request_timeout: Optional[int] = None,
     execute_in_order: Optional[dict] = None,
+    value_pool_probability: Optional[float] = None,
+    adaptive_budget: bool = False,
+    adaptive_budget_total: Optional[int] = None,
+    adaptive_budget_stale_limit: int = DEFAULT_STALE_LIMIT,
+    max_duration: Optional[float] = None,
+    max_requests: Optional[int] = None,
+    rate_limit: Optional[float] = None,
+    example_database: Optional[ExampleDatabase] = None,
+    shard: Optional[Shard] = None,
+    timing_history: Optional[TimingHistory] = None,
     seed: Optional[int] = None,
     exit_first: bool = False,
 ) -> Generator[events.ExecutionEvent, None, None]:
@@ -143,6 +186,25 @@ def execute_from_schema(
             tag=tag,
             execute_in_order=execute_in_order,
         )
+        value_pool = ValuePool(probability=value_pool_probability, seed=seed) if value_pool_probability else None
+        example_budget = None
+        if adaptive_budget:
+            endpoints: Iterable[Endpoint] = schema.get_all_endpoints(execute_in_order=execute_in_order)
+            if shard is not None:
+                endpoints = shard.select(endpoints, execute_in_order)
+            example_budget = ExampleBudget.from_endpoints(
+                endpoints,
+                hypothesis_options.get("max_examples", hypothesis.settings.default.max_examples),
+                total=adaptive_budget_total,
+                stale_limit=adaptive_budget_stale_limit,
+            )
+        run_limits = None
+        if max_duration is not None or max_requests is not None or rate_limit is not None:
+            run_limits = RunLimits(
+                max_duration=max_duration,
+                max_requests=max_requests,
+                rate_limiter=RateLimiter(rate_limit) if rate_limit is not None else None,
+            )
         runner: BaseRunner
         if workers_num > 1:
             if schema.app:
@@ -156,6 +218,13 @@ def execute_from_schema(
                     seed=seed,
                     workers_num=workers_num,
                     exit_first=exit_first,
+                    execute_in_order=execute_in_order,
+                    value_pool=value_pool,
+                    example_budget=example_budget,
+                    run_limits=run_limits,
+                    example_database=example_database,
+                    shard=shard,
+                    timing_history=timing_history,
                 )
             else:
                 runner = ThreadPoolRunner(
@@ -168,6 +237,14 @@ def execute_from_schema(
                     seed=seed,
                     request_timeout=request_timeout,
                     exit_first=exit_first,
+                    workers_num=workers_num,
+                    execute_in_order=execute_in_order,
+                    value_pool=value_pool,
+                    example_budget=example_budget,
+                    run_limits=run_limits,
+                    example_database=example_database,
+                    shard=shard,
+                    timing_history=timing_history,
                 )
         else:
             if schema.app:
@@ -181,6 +258,12 @@ def execute_from_schema(
                     seed=seed,
                     exit_first=exit_first,
                     execute_in_order=execute_in_order,
+                    value_pool=value_pool,
+                    example_budget=example_budget,
+                    run_limits=run_limits,
+                    example_database=example_database,
+                    shard=shard,
+                    timing_history=timing_history,
                 )
             else:  
                 runner = SingleThreadRunner(
@@ -194,6 +277,12 @@ def execute_from_schema(
                     request_timeout=request_timeout,
                     exit_first=exit_first,
                     execute_in_order=execute_in_order,
+                    value_pool=value_pool,
+                    example_budget=example_budget,
+                    run_limits=run_limits,
+                    example_database=example_database,
+                    shard=shard,
+                    timing_history=timing_history,
                 )               
         yield from runner.execute()
     except Exception as exc:
@@ -1,6 +1,6 @@
 # pylint: disable=too-many-instance-attributes
 import time
-from typing import Dict, List, Optional, Union
+from typing import TYPE_CHECKING, Dict, List, Optional, Union
 
 import attr
 from requests import exceptions
@@ -11,6 +11,9 @@ from ..schemas import BaseSchema
 from ..utils import format_exception
 from .serialization import SerializedTestResult
 
+if TYPE_CHECKING:
+    from .impl.limits import RunLimits
+
 
 @attr.s()  # pragma: no mutate
 class ExecutionEvent:
@@ -30,10 +33,13 @@ class Initialized(ExecutionEvent):
     start_time: float = attr.ib(factory=time.monotonic)  # pragma: no mutate
 
     @classmethod
-    def from_schema(cls, *, schema: BaseSchema) -> "Initialized":
-        """Computes all needed data from a schema instance."""
+    def from_schema(cls, *, schema: BaseSchema, endpoints_count: Optional[int] = None) -> "Initialized":
+        """Computes all needed data from a schema instance.
+
+        `endpoints_count` overrides the number of endpoints, if only a part of them is tested (e.g. with sharding).
+        """
         return cls(
-            endpoints_count=schema.endpoints_count,
+            endpoints_count=schema.endpoints_count if endpoints_count is None else endpoints_count,
             location=schema.location,
             base_url=schema.base_url,
             specification_name=schema.verbose_name,
@@ -65,11 +71,30 @@ class AfterExecution(ExecutionEvent):
     result: SerializedTestResult = attr.ib()  # pragma: no mutate
     # Captured hypothesis stdout
     hypothesis_output: List[str] = attr.ib(factory=list)  # pragma: no mutate
+    # What is left from the run's limits, `None` if there is no such limit
+    remaining_requests: Optional[int] = attr.ib(default=None)  # pragma: no mutate
+    remaining_time: Optional[float] = attr.ib(default=None)  # pragma: no mutate
+    # Duration of the endpoint's test in seconds
+    elapsed_time: float = attr.ib(default=0.0)  # pragma: no mutate
+    # Statistic of durations for each test phase, see `phases.PhaseTimings.summary`
+    phases: Dict[str, Dict[str, float]] = attr.ib(factory=dict)  # pragma: no mutate
 
     @classmethod
-    def from_result(cls, result: TestResult, status: Status, hypothesis_output: List[str]) -> "AfterExecution":
+    def from_result(
+        cls,
+        result: TestResult,
+        status: Status,
+        hypothesis_output: List[str],
+        run_limits: Optional["RunLimits"] = None,
+        elapsed_time: float = 0.0,
+    ) -> "AfterExecution":
         return cls(
-            result=SerializedTestResult.from_test_result(result), status=status, hypothesis_output=hypothesis_output,
+            result=SerializedTestResult.from_test_result(result),
+            status=status,
+            hypothesis_output=hypothesis_output,
+            remaining_requests=run_limits.remaining_requests if run_limits is not None else None,
+            remaining_time=run_limits.remaining_time if run_limits is not None else None,
+            elapsed_time=elapsed_time,
         )
 
 
@@ -123,6 +148,13 @@ class Finished(ExecutionEvent):
 
     # Total test run execution time
     running_time: float = attr.ib()  # pragma: no mutate
+    # Statistic of durations for each test phase in all endpoints
+    phases: Dict[str, Dict[str, float]] = attr.ib(factory=dict)  # pragma: no mutate
+    # Summary of response times & the number of responses by status codes in all endpoints
+    latency: Dict[str, float] = attr.ib(factory=dict)  # pragma: no mutate
+    status_codes: Dict[int, int] = attr.ib(factory=dict)  # pragma: no mutate
+    # Endpoints, that were not tested, since the run's limits were exhausted
+    skipped_count: int = attr.ib(default=0)  # pragma: no mutate
 
     @classmethod
     def from_results(cls, results: TestResultSet, running_time: float) -> "Finished":
@@ -136,4 +168,8 @@ class Finished(ExecutionEvent):
             is_empty=results.is_empty,
             total=results.total,
             running_time=running_time,
+            phases=results.phases.summary(),
+            latency=results.latency.summary(),
+            status_codes=results.status_codes,
+            skipped_count=results.skipped_count,
         )
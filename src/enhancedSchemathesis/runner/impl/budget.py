@@ -0,0 +1,143 @@
+"""Adaptive distribution of examples among endpoints.
+
+The total number of examples for a run is split among endpoints proportionally to the complexity of their
+definitions. An endpoint stops sending requests after a number of consecutive identical outcomes (status code &
+response shape) and examples it didn't use are available to the endpoints that are tested after it.
+"""
+import threading
+from typing import Any, Dict, Hashable, Iterable, Optional
+
+import attr
+import hypothesis
+
+from ...dependencies import get_operation_key
+from ...models import Endpoint
+from ...utils import GenericResponse
+
+# Number of consecutive identical outcomes after which an endpoint is considered fully explored
+DEFAULT_STALE_LIMIT = 10  # pragma: no mutate
+
+
+def get_complexity(endpoint: Endpoint) -> int:
+    """Number of typed schema nodes in the endpoint's parameters & body definitions."""
+    complexity = 1
+    stack = [value for key, value in endpoint.definition.items() if key != "responses"]
+    while stack:
+        item = stack.pop()
+        if isinstance(item, dict):
+            if "type" in item or "$ref" in item:
+                complexity += 1
+            stack.extend(item.values())
+        elif isinstance(item, list):
+            stack.extend(item)
+    return complexity
+
+
+def get_shape(data: Any) -> Hashable:
+    """A coarse structure of a decoded JSON payload - its type and top-level keys."""
+    if isinstance(data, dict):
+        return tuple(sorted(data))
+    if isinstance(data, list):
+        return ("list", get_shape(data[0]) if data else None)
+    return type(data).__name__
+
+
+def get_outcome(response: GenericResponse, payload: Any) -> Hashable:
+    """Status code, content type & shape of the response's payload, that is already decoded by the caller."""
+    return response.status_code, response.headers.get("Content-Type"), get_shape(payload)
+
+
+@attr.s(slots=True)  # pragma: no mutate
+class EndpointBudget:
+    """Examples allocated to a single endpoint and outcomes observed for it."""
+
+    max_examples: int = attr.ib()  # pragma: no mutate
+    stale_limit: int = attr.ib(default=DEFAULT_STALE_LIMIT)  # pragma: no mutate
+    # Number of examples, that actually sent requests
+    used: int = attr.ib(default=0)  # pragma: no mutate
+    _last_outcome: Optional[Hashable] = attr.ib(default=None)  # pragma: no mutate
+    _repeats: int = attr.ib(default=0)  # pragma: no mutate
+    _has_failures: bool = attr.ib(default=False)  # pragma: no mutate
+
+    @property
+    def is_exhausted(self) -> bool:
+        """Whether the endpoint stopped producing new behavior.
+
+        Endpoints with failures are never exhausted - Hypothesis has to reproduce failing examples during shrinking.
+        """
+        return not self._has_failures and self._repeats >= self.stale_limit
+
+    def record(self, outcome: Hashable) -> None:
+        self.used += 1
+        if outcome == self._last_outcome:
+            self._repeats += 1
+        else:
+            self._last_outcome = outcome
+            self._repeats = 1
+
+    def mark_failed(self) -> None:
+        self._has_failures = True
+
+    def apply(self, settings: hypothesis.settings) -> hypothesis.settings:
+        """Hypothesis settings limited to the allocated number of examples."""
+        return hypothesis.settings(settings, max_examples=self.max_examples)
+
+
+@attr.s(slots=True)  # pragma: no mutate
+class ExampleBudget:
+    """The total number of examples for a run, shared by all its workers.
+
+    Every endpoint gets a share of the remaining examples, proportional to its complexity among the endpoints that
+    are not tested yet.
+    """
+
+    total: int = attr.ib()  # pragma: no mutate
+    weights: Dict[str, int] = attr.ib(factory=dict)  # pragma: no mutate
+    stale_limit: int = attr.ib(default=DEFAULT_STALE_LIMIT)  # pragma: no mutate
+    _remaining: int = attr.ib(init=False)  # pragma: no mutate
+    _pending_weight: int = attr.ib(init=False)  # pragma: no mutate
+    _lock: threading.Lock = attr.ib(factory=threading.Lock)  # pragma: no mutate
+
+    def __attrs_post_init__(self) -> None:
+        self._remaining = self.total
+        self._pending_weight = sum(self.weights.values())
+
+    @classmethod
+    def from_endpoints(
+        cls,
+        endpoints: Iterable[Endpoint],
+        max_examples: int,
+        total: Optional[int] = None,
+        stale_limit: int = DEFAULT_STALE_LIMIT,
+    ) -> "ExampleBudget":
+        """By default the total budget is the same as the one without adaptive distribution."""
+        weights = {get_operation_key(endpoint): get_complexity(endpoint) for endpoint in endpoints}
+        if total is None:
+            total = max_examples * len(weights)
+        return cls(total=total, weights=weights, stale_limit=stale_limit)
+
+    @property
+    def remaining(self) -> int:
+        return self._remaining
+
+    def allocate(self, endpoint: Endpoint) -> EndpointBudget:
+        with self._lock:
+            weight = self.weights.pop(get_operation_key(endpoint), None)
+            if weight is None:
+                # Not known in advance, e.g. added by a hook - gets an average share
+                weight = max(self._pending_weight // max(len(self.weights), 1), 1)
+            else:
+                self._pending_weight -= weight
+            share = self._remaining * weight // (self._pending_weight + weight)
+            # Every endpoint is tested at least once
+            max_examples = max(min(share, self._remaining), 1)
+            self._remaining = max(self._remaining - max_examples, 0)
+        return EndpointBudget(max_examples=max_examples, stale_limit=self.stale_limit)
+
+    def release(self, budget: EndpointBudget) -> None:
+        """Return examples, that were not used by the endpoint.
+
+        They go back to the shared pool as is and are split among the remaining endpoints by their complexity.
+        """
+        with self._lock:
+            self._remaining += max(budget.max_examples - budget.used, 0)
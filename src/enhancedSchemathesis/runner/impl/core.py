@@ -3,23 +3,41 @@ import time
 from contextlib import contextmanager
 from typing import Any, Callable, Dict, Generator, Iterable, List, Optional, Union
 
-import attr,json,copy
+import attr,copy
 import hypothesis
 import requests
-from _pytest.logging import LogCaptureHandler, catching_logs
+from hypothesis.database import ExampleDatabase
 from requests.auth import HTTPDigestAuth, _basic_auth_str
 
+from ..._hypothesis import make_test_or_exception
 from ...constants import USER_AGENT
-from ...exceptions import InvalidSchema, get_grouped_exception
+from ...database import EndpointDatabase
+from ...dependencies import DependencyPlan, get_dependency_plan
+from ...exceptions import InvalidSchema, exception_scope, get_grouped_exception
 from ...models import Case, CheckFunction, Endpoint, Status, TestResult, TestResultSet
+from ...phases import CHECKS_PREFIX, NETWORK, SERIALIZATION, STRATEGY, PhaseTimings
 from ...runner import events
 from ...schemas import BaseSchema
+from ...store_result import ResponseStore
 from ...types import RawAuth
-from ...utils import GenericResponse, capture_hypothesis_output
+from ...utils import GenericResponse, capture_hypothesis_output, get_response_payload, get_response_text
+from ...value_pool import ValuePool
+from .budget import EndpointBudget, ExampleBudget, get_outcome
+from .history import TimingHistory
+from .limits import RunLimits
+from .sharding import Shard
 
 DEFAULT_DEADLINE = 500  # pragma: no mutate
 
 
+class StopEndpointTest(BaseException):
+    """Stop generating examples for the current endpoint.
+
+    It is not an `Exception` subclass, therefore Hypothesis doesn't consider it as a test failure & re-raises it
+    immediately instead of shrinking.
+    """
+
+
 def get_hypothesis_settings(hypothesis_options: Dict[str, Any]) -> hypothesis.settings:
     # Default settings, used as a parent settings object below
     hypothesis_options.setdefault("deadline", DEFAULT_DEADLINE)
@@ -39,16 +57,41 @@ class BaseRunner:
     seed: Optional[int] = attr.ib(default=None)  # pragma: no mutate
     exit_first: bool = attr.ib(default=False)  # pragma: no mutate
     execute_in_order: Optional[dict] = attr.ib(None)
-
+    # Shared by all workers, could be passed explicitly to share stored values between multiple runners
+    store_response: ResponseStore = attr.ib(factory=ResponseStore)  # pragma: no mutate
+    # Values harvested from responses to fill generated parameters, disabled if not set
+    value_pool: Optional[ValuePool] = attr.ib(default=None)  # pragma: no mutate
+    # Adaptive distribution of examples among endpoints, `max_examples` is applied to every endpoint if not set
+    example_budget: Optional[ExampleBudget] = attr.ib(default=None)  # pragma: no mutate
+    # Duration, number & rate of requests for the whole run
+    run_limits: Optional[RunLimits] = attr.ib(default=None)  # pragma: no mutate
+    # Storage for found examples, the one from Hypothesis settings is used if not set
+    example_database: Optional[ExampleDatabase] = attr.ib(default=None)  # pragma: no mutate
+    # A part of the schema's endpoints to test, all endpoints are tested if not set
+    shard: Optional[Shard] = attr.ib(default=None)  # pragma: no mutate
+    # Durations of endpoints from previous runs, updated with the durations from this run
+    timing_history: Optional[TimingHistory] = attr.ib(default=None)  # pragma: no mutate
+
+    def get_endpoints(self) -> Iterable[Endpoint]:
+        """Endpoints that are tested by this runner."""
+        endpoints = self.schema.get_all_endpoints(execute_in_order=self.execute_in_order)
+        if self.shard is not None:
+            return self.shard.select(endpoints, self.execute_in_order)
+        return endpoints
 
     def execute(self) -> Generator[events.ExecutionEvent, None, None]:
         """Common logic for all runners."""
         results = TestResultSet()
 
-        initialized = events.Initialized.from_schema(schema=self.schema)
+        endpoints_count = len(list(self.get_endpoints())) if self.shard is not None else None
+        initialized = events.Initialized.from_schema(schema=self.schema, endpoints_count=endpoints_count)
+        if self.run_limits is not None:
+            self.run_limits.start()
         yield initialized
 
         for event in self._execute(results):
+            if self.timing_history is not None and isinstance(event, events.AfterExecution):
+                self.timing_history.record(event)
             if (
                 self.exit_first
                 and isinstance(event, events.AfterExecution)
@@ -56,6 +99,8 @@ class BaseRunner:
             ):
                 break
             yield event
+        if self.timing_history is not None:
+            self.timing_history.save()
 
         yield events.Finished.from_results(results=results, running_time=time.monotonic() - initialized.start_time)
 
@@ -69,25 +114,35 @@ def run_test(
     checks: Iterable[CheckFunction],
     results: TestResultSet,
     execute_in_order: Optional[dict] = None,
-    store_response: Optional[object] = None,
+    store_response: Optional[ResponseStore] = None,
+    endpoint_budget: Optional[EndpointBudget] = None,
+    run_limits: Optional[RunLimits] = None,
+    phases: Optional[PhaseTimings] = None,
     **kwargs: Any,
 ) -> Generator[events.ExecutionEvent, None, None]:
     """A single test run with all error handling needed."""
     # pylint: disable=too-many-arguments
-    result = TestResult(endpoint=endpoint)
+    result = TestResult(endpoint=endpoint, phases=phases if phases is not None else PhaseTimings())
     yield events.BeforeExecution.from_endpoint(endpoint=endpoint)
+    start = time.monotonic()
     hypothesis_output: List[str] = []
     try:
         if isinstance(test, InvalidSchema):
             status = Status.error
             result.add_error(test)
         else:
-            with capture_hypothesis_output() as hypothesis_output:
-                kwargs['execute_in_order'] = execute_in_order
-                kwargs['store_response'] = store_response
-                test(checks, result,**kwargs)
-                  
+            # Exception classes of failures stay the same until the test is finished
+            with capture_hypothesis_output() as hypothesis_output, exception_scope():
+                # Dependencies are compiled once per endpoint, not for every example
+                kwargs["dependency_plan"] = get_dependency_plan(endpoint, execute_in_order)
+                kwargs["store_response"] = store_response
+                kwargs["endpoint_budget"] = endpoint_budget
+                kwargs["run_limits"] = run_limits
+                test(checks, result, **kwargs)
             status = Status.success
+    except StopEndpointTest:
+        # Examples, that were executed before the test was stopped, are reported as usual
+        status = Status.failure if result.has_failures else Status.success
     except (AssertionError, hypothesis.errors.MultipleFailures):
         status = Status.failure
     except hypothesis.errors.Flaky:
@@ -119,102 +174,194 @@ def run_test(
     result.seed = getattr(test, "_hypothesis_internal_use_seed", None) or getattr(
         test, "_hypothesis_internal_use_generated_seed", None
     )
+    with result.phases.measure(SERIALIZATION):
+        event = events.AfterExecution.from_result(
+            result=result,
+            status=status,
+            hypothesis_output=hypothesis_output,
+            run_limits=run_limits,
+            elapsed_time=time.monotonic() - start,
+        )
+    # Summary includes the serialization time, therefore it is computed after the event is created
+    event.phases = result.phases.summary()
+    results.append(result)
+    yield event
+
+
+def run_endpoint_test(
+    endpoint: Endpoint,
+    func: Callable,
+    settings: hypothesis.settings,
+    seed: Optional[int],
+    example_budget: Optional[ExampleBudget],
+    checks: Iterable[CheckFunction],
+    results: TestResultSet,
+    run_limits: Optional[RunLimits] = None,
+    example_database: Optional[ExampleDatabase] = None,
+    value_pool: Optional[ValuePool] = None,
+    **kwargs: Any,
+) -> Generator[events.ExecutionEvent, None, None]:
+    """Create a test for the endpoint within its share of the examples budget & run it."""
+    # pylint: disable=too-many-arguments
+    if run_limits is not None and run_limits.is_exhausted:
+        # No requests could be sent anymore, the remaining endpoints are reported as skipped
+        yield from skip_endpoint(endpoint, results, run_limits)
+        return
+    endpoint_budget = None
+    if example_budget is not None:
+        endpoint_budget = example_budget.allocate(endpoint)
+        settings = endpoint_budget.apply(settings)
+    database = example_database if example_database is not None else settings.database
+    if database is not None:
+        settings = hypothesis.settings(settings, database=EndpointDatabase(database, endpoint))
+    phases = PhaseTimings()
+    with phases.measure(STRATEGY):
+        test = make_test_or_exception(endpoint, func, settings, seed, phases=phases, value_pool=value_pool)
+    try:
+        yield from run_test(
+            endpoint,
+            test,
+            checks,
+            results,
+            endpoint_budget=endpoint_budget,
+            run_limits=run_limits,
+            phases=phases,
+            value_pool=value_pool,
+            **kwargs,
+        )
+    finally:
+        if endpoint_budget is not None:
+            example_budget.release(endpoint_budget)  # type: ignore
+
+
+def skip_endpoint(
+    endpoint: Endpoint, results: TestResultSet, run_limits: Optional[RunLimits] = None
+) -> Generator[events.ExecutionEvent, None, None]:
+    """Report the endpoint as processed without testing it."""
+    result = TestResult(endpoint=endpoint, is_skipped=True)
+    yield events.BeforeExecution.from_endpoint(endpoint=endpoint)
+    event = events.AfterExecution.from_result(
+        result=result, status=Status.success, hypothesis_output=[], run_limits=run_limits
+    )
     results.append(result)
-    yield events.AfterExecution.from_result(result=result, status=status, hypothesis_output=hypothesis_output)
+    yield event
 
 
-def run_checks(case: Case, checks: Iterable[CheckFunction], result: TestResult, response: GenericResponse) -> None:
+def run_checks(
+    case: Case,
+    checks: Iterable[CheckFunction],
+    result: TestResult,
+    response: GenericResponse,
+    endpoint_budget: Optional[EndpointBudget] = None,
+) -> None:
     errors = []
 
     for check in checks:
         check_name = check.__name__
+        start = time.perf_counter()
         try:
             check(response, case)
             result.add_success(check_name, case)
         except AssertionError as exc:
             errors.append(exc)
             result.add_failure(check_name, case, str(exc))
+        finally:
+            result.phases.add(CHECKS_PREFIX + check_name, time.perf_counter() - start)
     
     result.add_status_code(response.status_code)
+    # The payload is decoded once for both the error result & the outcome
+    payload = None
+    if response.status_code > 204 or endpoint_budget is not None:
+        payload = get_response_payload(response)
     if response.status_code > 204:
-        try:
-            res = json.loads(response.text)
-        except Exception as er:
-            res = response.text  
-        result.add_response_error_result(res)
+        result.add_response_error_result(payload if payload is not None else get_response_text(response))
     else:
         result.add_response_error_result("Success")
-    
-    result.add_response_elapsed_time(str(response.elapsed.total_seconds()) + ' sec')
 
+    if endpoint_budget is not None:
+        endpoint_budget.record(get_outcome(response, payload))
+        if errors:
+            endpoint_budget.mark_failed()
     if errors:
+        # Hypothesis will only shrink this example from now on
+        result.phases.start_shrinking()
         raise get_grouped_exception(*errors)
     
 
 
+def add_request(result: TestResult, elapsed: float) -> None:
+    result.add_request(elapsed)
+    result.phases.add(NETWORK, elapsed)
+
+
 def network_test(
     case: Case,
     checks: Iterable[CheckFunction],
     result: TestResult,
     session: requests.Session,
     request_timeout: Optional[int],
-    execute_in_order: Optional[dict],
-    store_response: Optional[object]
+    dependency_plan: Optional[DependencyPlan],
+    store_response: Optional[ResponseStore],
+    value_pool: Optional[ValuePool],
+    endpoint_budget: Optional[EndpointBudget],
+    run_limits: Optional[RunLimits],
 ) -> None:
     """A single test body that will be executed against the target."""
-    # pylint: disable=too-many-arguments   
+    # pylint: disable=too-many-arguments
+    if endpoint_budget is not None and endpoint_budget.is_exhausted:
+        # The endpoint doesn't produce new behavior anymore, the remaining examples are skipped
+        raise StopEndpointTest
+    if run_limits is not None and not run_limits.acquire():
+        # The run's limits are exhausted, the remaining examples are skipped
+        raise StopEndpointTest
     case,session = update_case_header(case,session)
-    case = check_if_change_required(case,execute_in_order,store_response)
+    case = check_if_change_required(case, dependency_plan, store_response)
     timeout = prepare_timeout(request_timeout)
     
-    response = case.call(session=session, timeout=timeout)
-    check_if_storing_required(case,response,execute_in_order,store_response)
-    run_checks(case, checks, result, response)
+    start = time.perf_counter()
+    try:
+        response = case.call(session=session, timeout=timeout)
+    finally:
+        elapsed = time.perf_counter() - start
+        add_request(result, elapsed)
+    result.add_response_time(elapsed)
+    check_if_storing_required(case, response, dependency_plan, store_response, value_pool)
+    run_checks(case, checks, result, response, endpoint_budget)
       
     
-def check_if_change_required(case: Case,execute_in_order,store_response):
-    path = case.endpoint.path.lower()
-    method = case.endpoint.method.lower()
-    if execute_in_order:
-        try:
-            if execute_in_order is not None and method+":"+path in execute_in_order:
-                if execute_in_order[method+":"+path].get('required',None):
-                    for typ,val in execute_in_order[method+":"+path]['required'].items():
-                        if typ == 'path_parameters':
-                            for path_param,depends in val.items():
-                                p = depends.split(":")
-                                case.path_parameters[path_param] = store_response.get_store_result(p[0]+":"+p[1],p[2])
-
-                        elif typ == 'query':
-                            for path_param,depends in val.items():
-                                p = depends.split(":")
-                                case.query[path_param] = store_response.get_store_result(p[0]+":"+p[1],p[2])
-
-                        elif typ == 'body':
-                            for path_param,depends in val.items():
-                                p = depends.split(":")
-                                case.body[path_param] = store_response.get_store_result(p[0]+":"+p[1],p[2])
-        except Exception as er:
-            pass
-    elif '/notes' in path and case.path_parameters and 'note_id' in case.path_parameters:
-        case.path_parameters['note_id'] = store_response.get_store_result('post:/notes','id')
-    elif path == '/notes' and method == 'post':    
-        case.body["ref"] = str(time.time()) + 'platform_testing'      
+def check_if_change_required(
+    case: Case, dependency_plan: Optional[DependencyPlan], store_response: Optional[ResponseStore]
+) -> Case:
+    # Values from the pool are set during generation, explicitly declared dependencies take precedence over them
+    if dependency_plan is not None and store_response is not None:
+        dependency_plan.inject(case, store_response)
     return case
 
-def check_if_storing_required(case,response,execute_in_order,store_response):
-    path = case.endpoint.path.lower()
-    method = case.endpoint.method.lower()
-    if execute_in_order :
-        try:
-            if execute_in_order is not None and method+":"+path in execute_in_order:
-                if execute_in_order[method+":"+path].get('store',None) and response.status_code <= 204 :
-                    for to_store in execute_in_order[method+":"+path]['store']:
-                        store_response.store_result(method+":"+path,to_store,json.loads(response.text).get(to_store,None))
-        except Exception as er:
-            pass
-    elif path == '/notes' and method == 'post':
-        store_response.store_result(method+":"+path,'id',json.loads(response.text).get('id',None))
+
+def check_if_storing_required(
+    case: Case,
+    response: GenericResponse,
+    dependency_plan: Optional[DependencyPlan],
+    store_response: Optional[ResponseStore],
+    value_pool: Optional[ValuePool] = None,
+) -> None:
+    should_store = (
+        dependency_plan is not None
+        and dependency_plan.extractions
+        and store_response is not None
+        and response.status_code <= 204
+    )
+    should_harvest = value_pool is not None and response.status_code < 300
+    if not (should_store or should_harvest):
+        return
+    data = get_response_payload(response)
+    if data is None:
+        return
+    if should_store:
+        store_response.store_many(dependency_plan.operation, dependency_plan.extract(data))  # type: ignore
+    if should_harvest:
+        value_pool.harvest(case.endpoint, data)  # type: ignore
+
 
 def update_case_header(case,session):
     #session = copy.deepcopy(session)
@@ -255,13 +402,35 @@ def wsgi_test(
     auth: Optional[RawAuth],
     auth_type: Optional[str],
     headers: Optional[Dict[str, Any]],
+    dependency_plan: Optional[DependencyPlan],
+    store_response: Optional[ResponseStore],
+    value_pool: Optional[ValuePool],
+    endpoint_budget: Optional[EndpointBudget],
+    run_limits: Optional[RunLimits],
 ) -> None:
     # pylint: disable=too-many-arguments
+    if endpoint_budget is not None and endpoint_budget.is_exhausted:
+        # The endpoint doesn't produce new behavior anymore, the remaining examples are skipped
+        raise StopEndpointTest
+    if run_limits is not None and not run_limits.acquire():
+        # The run's limits are exhausted, the remaining examples are skipped
+        raise StopEndpointTest
+    # Only WSGI runs capture logs, so pytest is not imported for network runs
+    from _pytest.logging import LogCaptureHandler, catching_logs  # pylint: disable=import-outside-toplevel
+
     headers = _prepare_wsgi_headers(headers, auth, auth_type)
+    case = check_if_change_required(case, dependency_plan, store_response)
     with catching_logs(LogCaptureHandler(), level=logging.DEBUG) as recorded:
-        response = case.call_wsgi(headers=headers)
+        start = time.perf_counter()
+        try:
+            response = case.call_wsgi(headers=headers)
+        finally:
+            elapsed = time.perf_counter() - start
+            add_request(result, elapsed)
+    result.add_response_time(elapsed)
     result.logs.extend(recorded.records)
-    run_checks(case, checks, result, response)
+    check_if_storing_required(case, response, dependency_plan, store_response, value_pool)
+    run_checks(case, checks, result, response, endpoint_budget)
 
 
 def _prepare_wsgi_headers(
@@ -0,0 +1,120 @@
+"""Durations of endpoint tests from previous runs, stored in a local JSON file.
+
+They are used to start the slowest endpoints first when tests are distributed among multiple workers (the
+"longest processing time first" rule), so all workers finish at roughly the same time.
+"""
+import json
+import os
+from typing import Any, Dict, Iterable, List, Optional
+
+import attr
+
+from ...dependencies import make_operation_key
+from ...models import Endpoint
+from .. import events
+
+# Incremented on backward-incompatible changes in the file format
+HISTORY_VERSION = 1  # pragma: no mutate
+# Weight of the latest run in the stored values. Smoothing keeps a single unusually slow run from reordering endpoints
+SMOOTHING = 0.5  # pragma: no mutate
+
+
+@attr.s(slots=True)  # pragma: no mutate
+class EndpointTiming:
+    """Timing of a single endpoint test. All durations are in seconds."""
+
+    duration: float = attr.ib()  # pragma: no mutate
+    # Number of examples, that sent requests
+    examples: float = attr.ib(default=0)  # pragma: no mutate
+    mean_latency: float = attr.ib(default=0.0)  # pragma: no mutate
+    # Time not spent on requests - data generation, checks, shrinking, etc.
+    generation_time: float = attr.ib(default=0.0)  # pragma: no mutate
+    runs: int = attr.ib(default=1)  # pragma: no mutate
+
+    @classmethod
+    def from_event(cls, event: events.AfterExecution) -> "EndpointTiming":
+        result = event.result
+        mean_latency = result.requests_time / result.requests_count if result.requests_count else 0.0
+        return cls(
+            duration=event.elapsed_time,
+            examples=result.requests_count,
+            mean_latency=mean_latency,
+            generation_time=max(event.elapsed_time - result.requests_time, 0.0),
+        )
+
+    def merge(self, latest: "EndpointTiming") -> "EndpointTiming":
+        """Combine with the latest timing via exponential smoothing."""
+
+        def smooth(previous: float, current: float) -> float:
+            return previous + (current - previous) * SMOOTHING
+
+        return EndpointTiming(
+            duration=smooth(self.duration, latest.duration),
+            examples=smooth(self.examples, latest.examples),
+            mean_latency=smooth(self.mean_latency, latest.mean_latency),
+            generation_time=smooth(self.generation_time, latest.generation_time),
+            runs=self.runs + 1,
+        )
+
+
+@attr.s(slots=True)  # pragma: no mutate
+class TimingHistory:
+    """Timings of endpoints by `make_operation_key` of their full paths."""
+
+    path: Optional[str] = attr.ib(default=None)  # pragma: no mutate
+    timings: Dict[str, EndpointTiming] = attr.ib(factory=dict)  # pragma: no mutate
+
+    @classmethod
+    def load(cls, path: str) -> "TimingHistory":
+        """Read the history from a file. Missing, broken or outdated files are considered as empty history."""
+        try:
+            with open(path, encoding="utf-8") as fd:
+                data = json.load(fd)
+            if data.get("version") != HISTORY_VERSION:
+                return cls(path)
+            timings = {key: EndpointTiming(**value) for key, value in data["endpoints"].items()}
+        except (OSError, ValueError, TypeError, KeyError, AttributeError):
+            return cls(path)
+        return cls(path, timings)
+
+    def record(self, event: events.AfterExecution) -> None:
+        if event.result.is_skipped:
+            # Durations of skipped endpoints are not known
+            return
+        key = make_operation_key(event.result.method, event.result.path)
+        latest = EndpointTiming.from_event(event)
+        previous = self.timings.get(key)
+        self.timings[key] = previous.merge(latest) if previous is not None else latest
+
+    def save(self) -> None:
+        if self.path is None:
+            return
+        data: Dict[str, Any] = {
+            "version": HISTORY_VERSION,
+            "endpoints": {key: attr.asdict(value) for key, value in sorted(self.timings.items())},
+        }
+        # Readers never see a partially written file
+        temporary = f"{self.path}.tmp"
+        with open(temporary, "w", encoding="utf-8") as fd:
+            json.dump(data, fd, indent=2)
+        os.replace(temporary, self.path)
+
+    def get_duration(self, endpoint: Endpoint) -> Optional[float]:
+        timing = self.timings.get(make_operation_key(endpoint.method, endpoint.path))
+        return timing.duration if timing is not None else None
+
+    def longest_first(self, endpoints: Iterable[Endpoint]) -> List[Endpoint]:
+        """Endpoints ordered by their expected durations, the slowest go first.
+
+        Endpoints without history are expected to take the average time. Equal ones keep their original order.
+        """
+        endpoints = list(endpoints)
+        durations = [self.get_duration(endpoint) for endpoint in endpoints]
+        known = [duration for duration in durations if duration is not None]
+        if not known:
+            return endpoints
+        average = sum(known) / len(known)
+        order = sorted(
+            range(len(endpoints)), key=lambda idx: -(durations[idx] if durations[idx] is not None else average)
+        )
+        return [endpoints[idx] for idx in order]
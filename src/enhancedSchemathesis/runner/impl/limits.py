@@ -0,0 +1,115 @@
+"""Run-level limits - total duration, total number of requests and the rate of requests.
+
+Limits are shared by all workers of a runner and are checked right before every request. When the duration or the
+number of requests is exhausted, the remaining examples & endpoints are skipped. Waiting for the rate limit happens
+inside Hypothesis tests, therefore the default deadline is disabled when the rate is limited.
+"""
+import threading
+import time
+from typing import Callable, Optional
+
+import attr
+
+# Units for rate limits in the "N/unit" format
+RATE_UNITS = {"s": 1, "m": 60, "h": 3600}  # pragma: no mutate
+
+
+def parse_rate_limit(value: str) -> float:
+    """Convert a rate limit in the "N/s", "N/m" or "N/h" format to a number of requests per second."""
+    count, _, unit = value.partition("/")
+    unit = unit or "s"
+    if unit not in RATE_UNITS:
+        raise ValueError(f"Unknown rate limit unit: {unit}")
+    rate = float(count) / RATE_UNITS[unit]
+    if rate <= 0:
+        raise ValueError("Rate limit should be positive")
+    return rate
+
+
+@attr.s(slots=True)  # pragma: no mutate
+class RateLimiter:
+    """Token bucket, that allows bursts up to `capacity` requests and `rate` requests per second on average."""
+
+    rate: float = attr.ib()  # pragma: no mutate
+    capacity: Optional[float] = attr.ib(default=None)  # pragma: no mutate
+    clock: Callable[[], float] = attr.ib(default=time.monotonic)  # pragma: no mutate
+    sleep: Callable[[float], None] = attr.ib(default=time.sleep)  # pragma: no mutate
+    _tokens: float = attr.ib(init=False)  # pragma: no mutate
+    _updated_at: float = attr.ib(init=False)  # pragma: no mutate
+    _lock: threading.Lock = attr.ib(factory=threading.Lock)  # pragma: no mutate
+
+    def __attrs_post_init__(self) -> None:
+        if self.capacity is None:
+            self.capacity = max(self.rate, 1.0)
+        self._tokens = self.capacity
+        self._updated_at = self.clock()
+
+    def _try_acquire(self) -> float:
+        """Take a token if it is available. Otherwise return the time to wait for the next one."""
+        with self._lock:
+            now = self.clock()
+            refilled = self._tokens + (now - self._updated_at) * self.rate
+            self._tokens = min(self.capacity, refilled)  # type: ignore
+            self._updated_at = now
+            if self._tokens >= 1:
+                self._tokens -= 1
+                return 0
+            return (1 - self._tokens) / self.rate
+
+    def acquire(self) -> None:
+        """Wait until a request could be sent."""
+        while True:
+            delay = self._try_acquire()
+            if not delay:
+                return
+            # Sleeping outside of the lock - other workers could compute their delays meanwhile
+            self.sleep(delay)
+
+
+@attr.s(slots=True)  # pragma: no mutate
+class RunLimits:
+    """Limits for the whole run. Duration is in seconds."""
+
+    max_duration: Optional[float] = attr.ib(default=None)  # pragma: no mutate
+    max_requests: Optional[int] = attr.ib(default=None)  # pragma: no mutate
+    rate_limiter: Optional[RateLimiter] = attr.ib(default=None)  # pragma: no mutate
+    clock: Callable[[], float] = attr.ib(default=time.monotonic)  # pragma: no mutate
+    requests_count: int = attr.ib(default=0)  # pragma: no mutate
+    start_time: float = attr.ib(init=False)  # pragma: no mutate
+    _lock: threading.Lock = attr.ib(factory=threading.Lock)  # pragma: no mutate
+
+    def __attrs_post_init__(self) -> None:
+        self.start_time = self.clock()
+
+    def start(self) -> None:
+        """Start measuring the run's duration."""
+        self.start_time = self.clock()
+
+    @property
+    def remaining_time(self) -> Optional[float]:
+        if self.max_duration is None:
+            return None
+        return max(self.max_duration - (self.clock() - self.start_time), 0.0)
+
+    @property
+    def remaining_requests(self) -> Optional[int]:
+        if self.max_requests is None:
+            return None
+        return max(self.max_requests - self.requests_count, 0)
+
+    @property
+    def is_exhausted(self) -> bool:
+        return self.remaining_time == 0 or self.remaining_requests == 0
+
+    def acquire(self) -> bool:
+        """Reserve a request. Waits if the rate limit is reached and returns `False` if the run's limits are exhausted."""
+        if self.is_exhausted:
+            return False
+        if self.rate_limiter is not None:
+            self.rate_limiter.acquire()
+        with self._lock:
+            # The deadline could pass while waiting, or other workers could use the remaining requests
+            if self.is_exhausted:
+                return False
+            self.requests_count += 1
+        return True
@@ -0,0 +1,80 @@
+import threading
+from typing import Dict, List, Optional, Set
+
+from ...dependencies import get_operation_key, get_producers
+from ...models import Endpoint
+from ...store_result import ResponseStore
+
+
+class DependencyQueue:
+    """Distribute endpoints among workers respecting dependencies declared in `execute_in_order`.
+
+    An endpoint is given to a worker as soon as all its producers either stored their values or finished.
+    Independent endpoints run concurrently. It mimics the parts of `queue.Queue` interface, that are used by workers,
+    but `get` returns `None` when there are no endpoints left instead of blocking.
+    """
+
+    def __init__(self, endpoints: List[Endpoint], execute_in_order: Dict, store: ResponseStore) -> None:
+        self._pending = list(endpoints)
+        self._store = store
+        known = {get_operation_key(endpoint) for endpoint in endpoints}
+        # Producers, that are not a part of this run (e.g. filtered out) will never store anything
+        self._producers = {
+            operation: {producer for producer in producers if producer in known and producer != operation}
+            for operation, producers in get_producers(execute_in_order).items()
+        }
+        self._finished: Set[str] = set()
+        self._running: Dict[int, str] = {}
+        self._condition = threading.Condition()
+        self._is_listening = True
+        store.add_listener(self._on_store)
+
+    def _on_store(self, operation: str) -> None:
+        with self._condition:
+            self._condition.notify_all()
+
+    def _is_ready(self, endpoint: Endpoint) -> bool:
+        producers = self._producers.get(get_operation_key(endpoint), ())
+        return all(producer in self._finished or self._store.has_result(producer) for producer in producers)
+
+    def _pop_ready(self) -> Optional[Endpoint]:
+        for idx, endpoint in enumerate(self._pending):
+            if self._is_ready(endpoint):
+                return self._pending.pop(idx)
+        if not self._running:
+            # Nothing could unblock the remaining endpoints - there is a dependency cycle
+            return self._pending.pop(0)
+        return None
+
+    def close(self) -> None:
+        """Stop listening to the store. Called when all endpoints are given to workers or when the run is finished."""
+        with self._condition:
+            if self._is_listening:
+                self._store.remove_listener(self._on_store)
+                self._is_listening = False
+
+    def empty(self) -> bool:
+        with self._condition:
+            return not self._pending
+
+    def get(self) -> Optional[Endpoint]:
+        """Wait for the next endpoint, which dependencies are satisfied."""
+        with self._condition:
+            while self._pending:
+                endpoint = self._pop_ready()
+                if endpoint is not None:
+                    self._running[threading.get_ident()] = get_operation_key(endpoint)
+                    if not self._pending:
+                        # Nobody waits for stored values anymore
+                        self.close()
+                    return endpoint
+                self._condition.wait()
+            return None
+
+    def task_done(self) -> None:
+        """Mark the endpoint, taken by the current thread, as finished."""
+        with self._condition:
+            operation = self._running.pop(threading.get_ident(), None)
+            if operation is not None:
+                self._finished.add(operation)
+            self._condition.notify_all()
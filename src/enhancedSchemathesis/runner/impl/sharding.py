@@ -0,0 +1,84 @@
+"""Deterministic distribution of endpoints among multiple independent runs (e.g. CI jobs).
+
+Every shard computes the same assignment on its own, no coordination is needed. Without timings endpoints are
+assigned by a stable hash of their method & path. With timings from previous runs, endpoints are assigned
+longest-first to the least loaded shard, so all shards take roughly the same time. All shards should use the same
+timings - otherwise some endpoints could be tested twice or not tested at all.
+"""
+import hashlib
+from typing import Dict, Iterable, List, Optional, Tuple
+
+import attr
+
+from ...dependencies import get_operation_key, make_operation_key, normalize_operation_key
+from ...models import Endpoint
+
+
+def parse_shard(value: str) -> Tuple[int, int]:
+    """Convert a shard in the "i/N" format, where `i` is 1-based, to a tuple of integers."""
+    index, _, total = value.partition("/")
+    try:
+        shard = int(index), int(total)
+    except ValueError:
+        raise ValueError("Shard should be in the i/N format. Example: 1/4")
+    if shard[1] < 1 or not 1 <= shard[0] <= shard[1]:
+        raise ValueError("Shard index should be between 1 and the total number of shards")
+    return shard
+
+
+def get_hash_bucket(key: str, total: int) -> int:
+    """Zero-based shard for the key. Unlike `hash`, it doesn't depend on PYTHONHASHSEED."""
+    return int(hashlib.sha256(key.encode("utf-8")).hexdigest()[:16], 16) % total
+
+
+def assign_by_cost(costs: Dict[str, float], total: int) -> Dict[str, int]:
+    """Longest-first assignment of keys to the least loaded of `total` shards.
+
+    Ties are broken by keys & shard indices, so the result is the same on every machine.
+    """
+    loads = [0.0] * total
+    assignment = {}
+    for key, cost in sorted(costs.items(), key=lambda item: (-item[1], item[0])):
+        bucket = min(range(total), key=lambda idx: (loads[idx], idx))
+        loads[bucket] += cost
+        assignment[key] = bucket
+    return assignment
+
+
+@attr.s(slots=True)  # pragma: no mutate
+class Shard:
+    """A part of the schema's endpoints that should be tested by this run. `index` is 1-based."""
+
+    index: int = attr.ib()  # pragma: no mutate
+    total: int = attr.ib()  # pragma: no mutate
+    # Durations of endpoint tests in seconds from previous runs, by `make_operation_key` of full paths
+    timings: Dict[str, float] = attr.ib(factory=dict)  # pragma: no mutate
+
+    def select(self, endpoints: Iterable[Endpoint], execute_in_order: Optional[dict] = None) -> List[Endpoint]:
+        """Endpoints of this shard in their original order.
+
+        Operations from `execute_in_order` depend on values stored by each other, therefore they are always
+        assigned together.
+        """
+        keyed = []
+        units: Dict[str, List[Endpoint]] = {}
+        dependent = {normalize_operation_key(key) for key in execute_in_order or ()}
+        for endpoint in endpoints:
+            key = get_operation_key(endpoint)
+            if key in dependent:
+                key = min(dependent)
+            keyed.append((key, endpoint))
+            units.setdefault(key, []).append(endpoint)
+        if self.timings:
+            # Endpoints without timings, e.g. new ones, are considered as average ones
+            average = sum(self.timings.values()) / len(self.timings)
+            costs = {
+                key: sum(
+                    self.timings.get(make_operation_key(endpoint.method, endpoint.path), average) for endpoint in unit
+                )
+                for key, unit in units.items()
+            }
+            assignment = assign_by_cost(costs, self.total)
+        else:
+            assignment = {key: get_hash_bucket(key, self.total) for key in units}
+        return [endpoint for key, endpoint in keyed if assignment[key] == self.index - 1]
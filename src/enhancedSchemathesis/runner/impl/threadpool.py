@@ -2,40 +2,51 @@ import ctypes
 import threading
 import time
 from queue import Queue
-from typing import Any, Callable, Dict, Generator, Iterable, List, Optional, cast
+from typing import Any, Callable, Dict, Generator, Iterable, List, Optional, Union, cast
 
 import attr
 import hypothesis
 
-from ..._hypothesis import make_test_or_exception
 from ...models import CheckFunction, TestResultSet
 from ...types import RawAuth
 from ...utils import capture_hypothesis_output, get_requests_auth
 from .. import events
-from .core import BaseRunner, get_session, network_test, run_test, wsgi_test
+from .budget import ExampleBudget
+from .core import BaseRunner, get_session, network_test, run_endpoint_test, wsgi_test
+from .scheduler import DependencyQueue
+
+TasksQueue = Union[Queue, DependencyQueue]  # pragma: no mutate
 
 
 def _run_task(
     test_template: Callable,
-    tasks_queue: Queue,
+    tasks_queue: TasksQueue,
     events_queue: Queue,
     checks: Iterable[CheckFunction],
     settings: hypothesis.settings,
     seed: Optional[int],
     results: TestResultSet,
+    example_budget: Optional[ExampleBudget] = None,
     **kwargs: Any,
 ) -> None:
     # pylint: disable=too-many-arguments
     with capture_hypothesis_output():
         while not tasks_queue.empty():
             endpoint = tasks_queue.get()
-            test = make_test_or_exception(endpoint, test_template, settings, seed)
-            for event in run_test(endpoint, test, checks, results, **kwargs):
-                events_queue.put(event)
+            if endpoint is None:
+                # The remaining endpoints were taken by other workers
+                break
+            try:
+                for event in run_endpoint_test(
+                    endpoint, test_template, settings, seed, example_budget, checks, results, **kwargs
+                ):
+                    events_queue.put(event)
+            finally:
+                tasks_queue.task_done()
 
 
 def thread_task(
-    tasks_queue: Queue,
+    tasks_queue: TasksQueue,
     events_queue: Queue,
     checks: Iterable[CheckFunction],
     settings: hypothesis.settings,
@@ -57,7 +68,7 @@ def thread_task(
 
 
 def wsgi_thread_task(
-    tasks_queue: Queue,
+    tasks_queue: TasksQueue,
     events_queue: Queue,
     checks: Iterable[CheckFunction],
     settings: hypothesis.settings,
@@ -115,14 +126,30 @@ class ThreadPoolRunner(BaseRunner):
         except KeyboardInterrupt:
             stop_workers()
             yield events.Interrupted()
-
-    def _get_tasks_queue(self) -> Queue:
-        """All endpoints are distributed among all workers via a queue."""
+        finally:
+            if isinstance(tasks_queue, DependencyQueue):
+                tasks_queue.close()
+
+    def _get_tasks_queue(self) -> TasksQueue:
+        """All endpoints are distributed among all workers via a queue.
+
+        If there are dependencies between endpoints, then independent ones are executed concurrently and
+        the dependent ones are waiting until their producers store the needed values. With timing history the
+        slowest endpoints go first, so workers don't wait for a single long endpoint at the end of the run.
+        """
+        endpoints = self.get_endpoints()
+        if self.timing_history is not None:
+            endpoints = self.timing_history.longest_first(endpoints)
+        if self.execute_in_order:
+            return DependencyQueue(list(endpoints), self.execute_in_order, self.store_response)
         tasks_queue: Queue = Queue()
-        tasks_queue.queue.extend(self.schema.get_all_endpoints())
+        for endpoint in endpoints:
+            tasks_queue.put(endpoint)
         return tasks_queue
 
-    def _init_workers(self, tasks_queue: Queue, events_queue: Queue, results: TestResultSet) -> List[threading.Thread]:
+    def _init_workers(
+        self, tasks_queue: TasksQueue, events_queue: Queue, results: TestResultSet
+    ) -> List[threading.Thread]:
         """Initialize & start workers that will execute tests."""
         workers = [
             threading.Thread(
@@ -137,7 +164,9 @@ class ThreadPoolRunner(BaseRunner):
     def _get_task(self) -> Callable:
         return thread_task
 
-    def _get_worker_kwargs(self, tasks_queue: Queue, events_queue: Queue, results: TestResultSet) -> Dict[str, Any]:
+    def _get_worker_kwargs(
+        self, tasks_queue: TasksQueue, events_queue: Queue, results: TestResultSet
+    ) -> Dict[str, Any]:
         return {
             "tasks_queue": tasks_queue,
             "events_queue": events_queue,
@@ -148,7 +177,15 @@ class ThreadPoolRunner(BaseRunner):
             "headers": self.headers,
             "seed": self.seed,
             "results": results,
-            "kwargs": {"request_timeout": self.request_timeout},
+            "kwargs": {
+                "request_timeout": self.request_timeout,
+                "execute_in_order": self.execute_in_order,
+                "store_response": self.store_response,
+                "value_pool": self.value_pool,
+                "example_budget": self.example_budget,
+                "run_limits": self.run_limits,
+                "example_database": self.example_database,
+            },
         }
 
 
@@ -156,7 +193,9 @@ class ThreadPoolWSGIRunner(ThreadPoolRunner):
     def _get_task(self) -> Callable:
         return wsgi_thread_task
 
-    def _get_worker_kwargs(self, tasks_queue: Queue, events_queue: Queue, results: TestResultSet) -> Dict[str, Any]:
+    def _get_worker_kwargs(
+        self, tasks_queue: TasksQueue, events_queue: Queue, results: TestResultSet
+    ) -> Dict[str, Any]:
         return {
             "tasks_queue": tasks_queue,
             "events_queue": events_queue,
@@ -164,7 +203,17 @@ class ThreadPoolWSGIRunner(ThreadPoolRunner):
             "settings": self.hypothesis_settings,
             "seed": self.seed,
             "results": results,
-            "kwargs": {"auth": self.auth, "auth_type": self.auth_type, "headers": self.headers},
+            "kwargs": {
+                "auth": self.auth,
+                "auth_type": self.auth_type,
+                "headers": self.headers,
+                "execute_in_order": self.execute_in_order,
+                "store_response": self.store_response,
+                "value_pool": self.value_pool,
+                "example_budget": self.example_budget,
+                "run_limits": self.run_limits,
+                "example_database": self.example_database,
+            },
         }
 
 
@@ -0,0 +1,174 @@
+"""CPU & memory allocation profiles of a test run.
+
+With a single worker everything between `BeforeExecution` & `AfterExecution` events is the test of that endpoint, so
+profiles are attributed to endpoints by these boundaries. Work outside of them, e.g. loading the schema, is attributed
+to the run itself.
+"""
+import cProfile
+import pstats
+import tracemalloc
+from typing import Dict, Optional, Tuple, Type
+
+import attr
+
+from . import events
+
+# Attribution of work outside of endpoint tests
+RUN_LABEL = "schemathesis"  # pragma: no mutate
+# Number of frames stored for each memory allocation
+ALLOCATION_TRACEBACK_LIMIT = 16  # pragma: no mutate
+
+
+def get_label(event: events.AfterExecution) -> str:
+    return f"{event.result.method} {event.result.path}"
+
+
+class Profiler:
+    """Profile the run and write the profile to a file when the run is stopped."""
+
+    def start(self) -> None:
+        raise NotImplementedError
+
+    def write(self, event: events.ExecutionEvent) -> None:
+        if isinstance(event, events.BeforeExecution):
+            self.start_endpoint()
+        elif isinstance(event, events.AfterExecution):
+            self.finish_endpoint(get_label(event))
+
+    def start_endpoint(self) -> None:
+        raise NotImplementedError
+
+    def finish_endpoint(self, label: str) -> None:
+        raise NotImplementedError
+
+    def stop(self) -> None:
+        raise NotImplementedError
+
+
+@attr.s(slots=True)  # pragma: no mutate
+class CPUProfiler(Profiler):
+    """Deterministic profile via `cProfile`, written in the `pstats` format.
+
+    Every endpoint is a separate caller of functions called during its test, so the profile could be explored
+    per endpoint with `pstats` or any tool that reads its files, e.g. `snakeviz`.
+    """
+
+    path: str = attr.ib()  # pragma: no mutate
+    _stats: pstats.Stats = attr.ib(factory=pstats.Stats, init=False)  # pragma: no mutate
+    _run_profile: cProfile.Profile = attr.ib(factory=cProfile.Profile, init=False)  # pragma: no mutate
+    _endpoint_profile: Optional[cProfile.Profile] = attr.ib(default=None, init=False)  # pragma: no mutate
+    _is_running: bool = attr.ib(default=False, init=False)  # pragma: no mutate
+
+    def start(self) -> None:
+        self._is_running = True
+        self._run_profile.enable()
+
+    def start_endpoint(self) -> None:
+        if not self._is_running:
+            return
+        # Only one profile could be active at a time
+        self._run_profile.disable()
+        self._endpoint_profile = cProfile.Profile()
+        self._endpoint_profile.enable()
+
+    def finish_endpoint(self, label: str) -> None:
+        if self._endpoint_profile is None:
+            return
+        self._endpoint_profile.disable()
+        self._add(self._endpoint_profile, label)
+        self._endpoint_profile = None
+        self._run_profile.enable()
+
+    def stop(self) -> None:
+        if not self._is_running:
+            return
+        self._is_running = False
+        if self._endpoint_profile is not None:
+            # The run was interrupted during an endpoint's test
+            self._endpoint_profile.disable()
+            self._add(self._endpoint_profile, RUN_LABEL)
+            self._endpoint_profile = None
+        self._run_profile.disable()
+        self._add(self._run_profile, RUN_LABEL)
+        self._stats.dump_stats(self.path)
+
+    def _add(self, profile: cProfile.Profile, label: str) -> None:
+        stats = pstats.Stats(profile)
+        add_caller(stats, ("~", 0, label))
+        self._stats.add(stats)
+
+
+def add_caller(stats: pstats.Stats, caller: Tuple[str, int, str]) -> None:
+    """Make `caller` the caller of all top-level functions in the given stats."""
+    # Entries are `(primitive calls, total calls, own time, cumulative time, callers)`
+    cumulative_time = 0.0
+    for function, (primitive_calls, calls, own_time, function_cumulative_time, callers) in list(
+        stats.stats.items()  # type: ignore
+    ):
+        if not callers:
+            callers[caller] = (calls, primitive_calls, own_time, function_cumulative_time)
+            cumulative_time += function_cumulative_time
+    stats.stats[caller] = (1, 1, 0.0, cumulative_time, {})  # type: ignore
+
+
+@attr.s(slots=True)  # pragma: no mutate
+class AllocationProfiler(Profiler):
+    """Memory allocations via `tracemalloc`, written as collapsed stacks.
+
+    Every line is an endpoint and a stack of allocating frames, followed by the number of bytes, that were allocated
+    there during the endpoint's test and not freed until its end. The output could be rendered with `flamegraph.pl`,
+    `speedscope` or similar tools.
+    """
+
+    path: str = attr.ib()  # pragma: no mutate
+    # Allocated bytes by labels & tracebacks, they are formatted only when the profile is written
+    _sizes: Dict[Tuple[str, tracemalloc.Traceback], int] = attr.ib(factory=dict, init=False)  # pragma: no mutate
+    _is_running: bool = attr.ib(default=False, init=False)  # pragma: no mutate
+
+    def start(self) -> None:
+        self._is_running = True
+        tracemalloc.start(ALLOCATION_TRACEBACK_LIMIT)
+
+    def start_endpoint(self) -> None:
+        self._record(RUN_LABEL)
+
+    def finish_endpoint(self, label: str) -> None:
+        self._record(label)
+
+    def stop(self) -> None:
+        if not self._is_running:
+            return
+        self._record(RUN_LABEL)
+        self._is_running = False
+        tracemalloc.stop()
+        with open(self.path, "w", encoding="utf-8") as fd:
+            for (label, traceback), size in sorted(self._sizes.items(), key=lambda item: item[1], reverse=True):
+                fd.write(f"{format_stack(label, traceback)} {size}\n")
+
+    def _record(self, label: str) -> None:
+        """Attribute allocations since the previous call to the given label."""
+        if not self._is_running:
+            return
+        # Traces are cleared after each call, so snapshots contain only recent allocations & are cheap to take.
+        # Snapshots themselves are freed before the next call and don't show up in the profile
+        snapshot = tracemalloc.take_snapshot()
+        tracemalloc.clear_traces()
+        for statistic in snapshot.statistics("traceback"):
+            key = (label, statistic.traceback)
+            self._sizes[key] = self._sizes.get(key, 0) + statistic.size
+
+
+def format_stack(label: str, traceback: tracemalloc.Traceback) -> str:
+    # Frames are ordered from the oldest to the most recent one
+    frames = (f"{frame.filename}:{frame.lineno}" for frame in traceback)
+    return ";".join(name.replace(";", ",") for name in (label, *frames))
+
+
+PROFILERS: Dict[str, Type[Profiler]] = {
+    "cpu": CPUProfiler,
+    "alloc": AllocationProfiler,
+}  # pragma: no mutate
+
+
+def create_profiler(profile_type: str, path: str) -> Profiler:
+    return PROFILERS[profile_type](path)  # type: ignore
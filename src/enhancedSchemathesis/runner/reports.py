@@ -0,0 +1,167 @@
+"""Reports of a test run in JUnit XML & JSON formats.
+
+Results are appended to a report as soon as an endpoint is tested, so the memory usage doesn't depend on the number of
+endpoints in the schema. The report is completed when the run is finished or interrupted.
+"""
+import re
+from typing import IO, Any, Dict, Optional, Type
+from xml.sax.saxutils import escape, quoteattr
+
+import attr
+
+from ..models import Status
+from . import events
+from .results import JSONListFile, serialize_result
+from .serialization import SerializedTestResult, get_unique_failures, prepare_for_json
+
+# Incremented on backward-incompatible changes in the JSON report format
+REPORT_VERSION = 1  # pragma: no mutate
+# Space reserved for counters in the `testsuite` tag, they are known only in the end of the run
+JUNIT_COUNTERS_WIDTH = 160  # pragma: no mutate
+# Characters that are not allowed in XML documents
+INVALID_XML_CHARACTERS = re.compile("[\x00-\x08\x0b\x0c\x0e-\x1f]")  # pragma: no mutate
+
+
+class ReportWriter:
+    """Write results of tested endpoints from runner events to a report file."""
+
+    def write(self, event: events.ExecutionEvent) -> None:
+        if isinstance(event, events.AfterExecution):
+            self.add_result(event)
+        elif isinstance(event, events.Finished):
+            self.finish(event)
+        elif isinstance(event, events.Interrupted):
+            self.close()
+
+    def add_result(self, event: events.AfterExecution) -> None:
+        raise NotImplementedError
+
+    def finish(self, event: events.Finished) -> None:
+        raise NotImplementedError
+
+    def close(self) -> None:
+        """Complete the report, if the run ended without the `Finished` event."""
+        raise NotImplementedError
+
+
+@attr.s(slots=True)  # pragma: no mutate
+class JSONReportWriter(ReportWriter):
+    """A JSON document with results in the same format as in results files and the summary of the run."""
+
+    path: str = attr.ib()  # pragma: no mutate
+    _output: Optional[JSONListFile] = attr.ib(init=False)  # pragma: no mutate
+
+    def __attrs_post_init__(self) -> None:
+        self._output = JSONListFile(self.path, {"version": REPORT_VERSION})
+
+    def add_result(self, event: events.AfterExecution) -> None:
+        if self._output is not None:
+            self._output.append(serialize_result(event))
+
+    def finish(self, event: events.Finished) -> None:
+        self._complete({"summary": prepare_for_json(attr.asdict(event, recurse=True))})
+
+    def close(self) -> None:
+        self._complete({"summary": None})
+
+    def _complete(self, fields: Dict[str, Any]) -> None:
+        if self._output is not None:
+            self._output.close(fields)
+            self._output = None
+
+
+@attr.s(slots=True)  # pragma: no mutate
+class JUnitReportWriter(ReportWriter):
+    """JUnit XML report, where every endpoint is a test case."""
+
+    path: str = attr.ib()  # pragma: no mutate
+    _file: Optional[IO[str]] = attr.ib(default=None, init=False)  # pragma: no mutate
+    _counters_position: int = attr.ib(default=0, init=False)  # pragma: no mutate
+    _is_completed: bool = attr.ib(default=False, init=False)  # pragma: no mutate
+    tests: int = attr.ib(default=0, init=False)  # pragma: no mutate
+    failures: int = attr.ib(default=0, init=False)  # pragma: no mutate
+    errors: int = attr.ib(default=0, init=False)  # pragma: no mutate
+    skipped: int = attr.ib(default=0, init=False)  # pragma: no mutate
+    time: float = attr.ib(default=0.0, init=False)  # pragma: no mutate
+
+    def _open(self) -> IO[str]:
+        if self._file is None:
+            self._file = open(self.path, "w", encoding="utf-8")
+            self._file.write('<?xml version="1.0" encoding="UTF-8"?>\n<testsuites>\n<testsuite name="schemathesis" ')
+            self._counters_position = self._file.tell()
+            self._file.write(" " * JUNIT_COUNTERS_WIDTH + ">\n")
+        return self._file
+
+    def add_result(self, event: events.AfterExecution) -> None:
+        if self._is_completed:
+            return
+        self.tests += 1
+        if event.result.is_skipped:
+            self.skipped += 1
+        elif event.status == Status.failure:
+            self.failures += 1
+        elif event.status == Status.error:
+            self.errors += 1
+        self.time += event.elapsed_time
+        self._open().write(make_test_case(event.result, event.elapsed_time))
+
+    def finish(self, event: events.Finished) -> None:
+        self._complete(event.running_time)
+
+    def close(self) -> None:
+        self._complete(self.time)
+
+    def _complete(self, running_time: float) -> None:
+        if self._is_completed:
+            return
+        self._is_completed = True
+        fd = self._open()
+        fd.write("</testsuite>\n</testsuites>\n")
+        # Counters are written to the space reserved in the beginning of the file
+        fd.seek(self._counters_position)
+        counters = (
+            f'tests="{self.tests}" failures="{self.failures}" errors="{self.errors}" skipped="{self.skipped}" '
+            f'time="{running_time:.3f}"'
+        )
+        fd.write(counters.ljust(JUNIT_COUNTERS_WIDTH))
+        fd.close()
+
+
+def make_test_case(result: SerializedTestResult, elapsed_time: float) -> str:
+    name = to_attribute(f"{result.method} {result.path}")
+    parts = [f'<testcase name={name} classname="schemathesis" time="{elapsed_time:.3f}">\n']
+    if result.is_skipped:
+        parts.append('<skipped message="The run\'s limits are exhausted"/>\n')
+    for check in get_unique_failures(result.checks):
+        message = check.message or f"Check {check.name} failed"
+        code = check.example.requests_code  # type: ignore
+        text = f"{message}\n\nRun this Python code to reproduce this failure:\n\n    {code}"
+        if result.seed is not None:
+            text += f"\n\nOr add this option to your command line parameters: --hypothesis-seed={result.seed}"
+        parts.append(f"<failure type={to_attribute(check.name)} message={to_attribute(message)}>")
+        parts.append(f"{to_text(text)}</failure>\n")
+    for error in result.errors:
+        parts.append(f"<error message={to_attribute(error.exception.strip())}>")
+        parts.append(f"{to_text(error.exception_with_traceback)}</error>\n")
+    if result.logs:
+        parts.append(f"<system-out>{to_text(chr(10).join(result.logs))}</system-out>\n")
+    parts.append("</testcase>\n")
+    return "".join(parts)
+
+
+def to_attribute(value: str) -> str:
+    return quoteattr(INVALID_XML_CHARACTERS.sub("", value))
+
+
+def to_text(value: str) -> str:
+    return escape(INVALID_XML_CHARACTERS.sub("", value))
+
+
+REPORT_WRITERS: Dict[str, Type[ReportWriter]] = {
+    "junit": JUnitReportWriter,
+    "json": JSONReportWriter,
+}  # pragma: no mutate
+
+
+def create_report_writer(report_format: str, path: str) -> ReportWriter:
+    return REPORT_WRITERS[report_format](path)  # type: ignore
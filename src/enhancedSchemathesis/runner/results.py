@@ -0,0 +1,225 @@
+"""Results of a test run saved to a file, so runs of different shards could be combined into a single summary.
+
+A results file is a JSON document with serialized results of every tested endpoint, their statuses & durations.
+Durations are also used to balance shards in the next runs.
+"""
+import json
+from typing import IO, Any, Dict, Iterable, List, Optional, Union
+
+import attr
+
+from ..dependencies import make_operation_key
+from ..latency import LatencyHistogram
+from ..models import Status
+from . import events
+from .serialization import SerializedCase, SerializedCheck, SerializedError, SerializedTestResult, prepare_for_json
+
+# Incremented on backward-incompatible changes in the file format
+RESULTS_VERSION = 1  # pragma: no mutate
+
+
+@attr.s(slots=True)  # pragma: no mutate
+class JSONListFile:
+    """A JSON object, which items of the `key` list are appended to the file one by one.
+
+    Nothing is kept in memory - the file is opened on the first item and the object is completed by `close`.
+    """
+
+    path: str = attr.ib()  # pragma: no mutate
+    # Fields before the list
+    fields: Dict[str, Any] = attr.ib(factory=dict)  # pragma: no mutate
+    key: str = attr.ib(default="results")  # pragma: no mutate
+    _file: Optional[IO[str]] = attr.ib(default=None, init=False)  # pragma: no mutate
+    _count: int = attr.ib(default=0, init=False)  # pragma: no mutate
+
+    def _open(self) -> IO[str]:
+        if self._file is None:
+            self._file = open(self.path, "w", encoding="utf-8")
+            self._file.write(json.dumps(self.fields, default=str)[:-1])
+            if self.fields:
+                self._file.write(", ")
+            self._file.write(f"{json.dumps(self.key)}: [")
+        return self._file
+
+    def append(self, item: Any) -> None:
+        fd = self._open()
+        if self._count:
+            fd.write(", ")
+        json.dump(item, fd, default=str)
+        self._count += 1
+
+    def close(self, fields: Optional[Dict[str, Any]] = None) -> None:
+        """Finish the object with the given fields after the list."""
+        fd = self._open()
+        fd.write("]")
+        for name, value in (fields or {}).items():
+            fd.write(f", {json.dumps(name)}: {json.dumps(value, default=str)}")
+        fd.write("}")
+        fd.close()
+        self._file = None
+
+
+@attr.s(slots=True)  # pragma: no mutate
+class ResultsWriter:
+    """Append results from runner events to a file as they arrive and finish it when the run is finished."""
+
+    path: str = attr.ib()  # pragma: no mutate
+    # Shard in the "i/N" format, if the run is a part of a sharded one
+    shard: Optional[str] = attr.ib(default=None)  # pragma: no mutate
+    _output: JSONListFile = attr.ib(init=False)  # pragma: no mutate
+
+    def __attrs_post_init__(self) -> None:
+        self._output = JSONListFile(self.path, {"version": RESULTS_VERSION, "shard": self.shard})
+
+    def write(self, event: events.ExecutionEvent) -> None:
+        if isinstance(event, events.AfterExecution):
+            self._output.append(serialize_result(event))
+        elif isinstance(event, events.Finished):
+            self.save(event.running_time)
+
+    def save(self, running_time: float) -> None:
+        self._output.close({"running_time": running_time})
+
+
+def serialize_test_result(result: SerializedTestResult) -> Dict[str, Any]:
+    return prepare_for_json(attr.asdict(result, recurse=True))
+
+
+def serialize_result(event: events.AfterExecution) -> Dict[str, Any]:
+    data = serialize_test_result(event.result)
+    data["status"] = event.status.name
+    data["elapsed_time"] = event.elapsed_time
+    data["hypothesis_output"] = event.hypothesis_output
+    return data
+
+
+def load_event(data: Dict[str, Any]) -> events.AfterExecution:
+    """Restore the event, from which the result was serialized."""
+    data = dict(data)
+    status = Status[data.pop("status")]
+    elapsed_time = data.pop("elapsed_time", 0.0)
+    hypothesis_output = data.pop("hypothesis_output", [])
+    return events.AfterExecution(
+        status=status, result=load_test_result(data), hypothesis_output=hypothesis_output, elapsed_time=elapsed_time,
+    )
+
+
+def load_test_result(data: Dict[str, Any]) -> SerializedTestResult:
+    data = dict(data)
+    # JSON object keys are always strings
+    data["status_codes"] = {int(code): count for code, count in data.get("status_codes", {}).items()}
+    data["checks"] = [
+        SerializedCheck(
+            name=check["name"],
+            value=Status[check["value"]],
+            example=_load_case(check["example"]),
+            message=check["message"],
+        )
+        for check in data["checks"]
+    ]
+    data["errors"] = [
+        SerializedError(
+            exception=error["exception"],
+            exception_with_traceback=error["exception_with_traceback"],
+            example=_load_case(error["example"]),
+        )
+        for error in data["errors"]
+    ]
+    return SerializedTestResult(**data)
+
+
+def _load_case(data: Optional[Dict[str, Any]]) -> Optional[SerializedCase]:
+    if data is None:
+        return None
+    return SerializedCase(**data)
+
+
+def load_results_file(path: str) -> Dict[str, Any]:
+    with open(path, encoding="utf-8") as fd:
+        data = json.load(fd)
+    if data.get("version") != RESULTS_VERSION:
+        raise ValueError(f"Unsupported results file version in {path}: {data.get('version')}")
+    return data
+
+
+@attr.s(slots=True)  # pragma: no mutate
+class MergedResults:
+    """Results of multiple runs, combined as if they were a single run."""
+
+    # Events of all tested endpoints, in the order of the given files
+    items: List[events.AfterExecution] = attr.ib(factory=list)  # pragma: no mutate
+    # Shards run in parallel, therefore the total time is the time of the slowest one
+    running_time: float = attr.ib(default=0.0)  # pragma: no mutate
+    runs_count: int = attr.ib(default=0)  # pragma: no mutate
+
+    @classmethod
+    def from_files(cls, paths: Iterable[str]) -> "MergedResults":
+        merged = cls()
+        for path in paths:
+            data = load_results_file(path)
+            merged.runs_count += 1
+            merged.running_time = max(merged.running_time, data["running_time"])
+            merged.items.extend(load_event(item) for item in data["results"])
+        return merged
+
+    @property
+    def results(self) -> List[SerializedTestResult]:
+        return [event.result for event in self.items]
+
+    @property
+    def hypothesis_output(self) -> List[str]:
+        return [line for event in self.items for line in event.hypothesis_output]
+
+    def to_finished(self) -> events.Finished:
+        """The final event of the combined run, with the same counters as `TestResultSet` would have."""
+        total: Dict[str, Dict[Union[str, Status], int]] = {}
+        passed_count = failed_count = errored_count = skipped_count = 0
+        latency = LatencyHistogram()
+        status_codes: Dict[int, int] = {}
+        results = self.results
+        for result in results:
+            latency.merge(LatencyHistogram.deserialize(result.latency))
+            for code, count in result.status_codes.items():
+                status_codes[code] = status_codes.get(code, 0) + count
+            if result.is_skipped:
+                skipped_count += 1
+            elif not result.has_errors and not result.has_failures:
+                passed_count += 1
+            if result.has_failures and not result.is_errored:
+                failed_count += 1
+            if result.has_errors or result.is_errored:
+                errored_count += 1
+            for check in result.checks:
+                counter = total.setdefault(check.name, {"total": 0})
+                counter[check.value] = counter.get(check.value, 0) + 1
+                counter["total"] += 1
+        return events.Finished(
+            passed_count=passed_count,
+            failed_count=failed_count,
+            errored_count=errored_count,
+            has_failures=any(result.has_failures for result in results),
+            has_errors=any(result.has_errors for result in results),
+            has_logs=any(result.has_logs for result in results),
+            is_empty=not results,
+            total=total,
+            running_time=self.running_time,
+            latency=latency.summary(),
+            status_codes=status_codes,
+            skipped_count=skipped_count,
+        )
+
+    def save(self, path: str) -> None:
+        """Write the combined results in the same format, e.g. to use as timings for the next sharded run."""
+        writer = ResultsWriter(path)
+        for event in self.items:
+            writer.write(event)
+        writer.save(self.running_time)
+
+
+def load_timings(paths: Iterable[str]) -> Dict[str, float]:
+    """Durations of endpoint tests from results files, in the same format as `execute_in_order` keys."""
+    timings = {}
+    for path in paths:
+        for item in load_results_file(path)["results"]:
+            timings[make_operation_key(item["method"], item["path"])] = item.get("elapsed_time", 0.0)
+    return timings
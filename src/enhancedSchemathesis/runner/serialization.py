@@ -4,13 +4,17 @@ They all consist of primitive types and don't have references to schemas, app, e
 """
 # pylint: disable=too-many-instance-attributes
 import logging
-from typing import List, Optional
+import traceback
+from enum import Enum
+from typing import Any, Dict, List, Optional, Sequence, Set, Tuple, TypeVar
 
 import attr
 
 from ..models import Case, Check, Status, TestResult
 from ..types import Body, Cookies, FormData, Headers, PathParameters, Query
-from ..utils import format_exception
+
+# Formatters are stateless, there is no need to create a new one for each result
+LOG_FORMATTER = logging.Formatter("[%(asctime)s] %(levelname)s in %(module)s: %(message)s")  # pragma: no mutate
 
 
 @attr.s(slots=True)  # pragma: no mutate
@@ -44,13 +48,56 @@ class SerializedCheck:
     message: Optional[str] = attr.ib(default=None)  # pragma: no mutate
 
     @classmethod
-    def from_check(cls, check: Check) -> "SerializedCheck":
-        return SerializedCheck(
-            name=check.name,
-            value=check.value,
-            example=SerializedCase.from_case(check.example) if check.example else None,
-            message=check.message,
-        )
+    def from_check(
+        cls, check: Check, with_example: bool = True, cache: Optional[Dict[int, SerializedCase]] = None
+    ) -> "SerializedCheck":
+        example = None
+        if with_example and check.example:
+            if cache is None:
+                example = SerializedCase.from_case(check.example)
+            else:
+                # Multiple checks are executed on the same case, it is enough to serialize it once
+                key = id(check.example)
+                if key not in cache:
+                    cache[key] = SerializedCase.from_case(check.example)
+                example = cache[key]
+        return SerializedCheck(name=check.name, value=check.value, example=example, message=check.message)
+
+
+CheckT = TypeVar("CheckT", Check, SerializedCheck)
+
+
+def get_unique_failures(checks: Sequence[CheckT]) -> List[CheckT]:
+    """The latest failed check with an example for each unique check name & message, the latest ones go first.
+
+    Only these checks are displayed in the output & reports, therefore examples for other checks are not serialized,
+    since making the code to reproduce them is relatively expensive.
+    """
+    seen: Set[Tuple[str, Optional[str]]] = set()
+    unique_checks = []
+    for check in reversed(checks):
+        # There are also could be checks that didn't fail
+        if check.example is not None and check.value == Status.failure and (check.name, check.message) not in seen:
+            unique_checks.append(check)
+            seen.add((check.name, check.message))
+    return unique_checks
+
+
+def prepare_for_json(value: Any) -> Any:
+    """Convert values to types that have a stable JSON representation."""
+    if isinstance(value, Enum):
+        return value.name
+    if isinstance(value, dict):
+        return {_prepare_key(key): prepare_for_json(item) for key, item in value.items()}
+    if isinstance(value, (list, tuple)):
+        return [prepare_for_json(item) for item in value]
+    return value
+
+
+def _prepare_key(key: Any) -> str:
+    if isinstance(key, Enum):
+        return key.name
+    return str(key)
 
 
 @attr.s(slots=True)  # pragma: no mutate
@@ -61,9 +108,11 @@ class SerializedError:
 
     @classmethod
     def from_error(cls, exception: Exception, case: Optional[Case]) -> "SerializedError":
+        # Stack is extracted only once for both representations
+        formatted = traceback.TracebackException.from_exception(exception)
         return cls(
-            exception=format_exception(exception),
-            exception_with_traceback=format_exception(exception, True),
+            exception="".join(formatted.format_exception_only()),
+            exception_with_traceback="".join(formatted.format()),
             example=SerializedCase.from_case(case) if case else None,
         )
 
@@ -80,13 +129,20 @@ class SerializedTestResult:
     checks: List[SerializedCheck] = attr.ib()  # pragma: no mutate
     logs: List[str] = attr.ib()  # pragma: no mutate
     errors: List[SerializedError] = attr.ib()  # pragma: no mutate
+    is_skipped: bool = attr.ib(default=False)  # pragma: no mutate
     response_status_code: int = attr.ib(default=600)
     response_error_result: Optional[str] = attr.ib(default=None)
     response_time_in_sec: Optional[str] = attr.ib(default='0 sec')
+    requests_count: int = attr.ib(default=0)  # pragma: no mutate
+    requests_time: float = attr.ib(default=0.0)  # pragma: no mutate
+    # Serialized `LatencyHistogram` - summary & buckets
+    latency: Dict[str, Any] = attr.ib(factory=dict)  # pragma: no mutate
+    status_codes: Dict[int, int] = attr.ib(factory=dict)  # pragma: no mutate
 
     @classmethod
     def from_test_result(cls, result: TestResult) -> "SerializedTestResult":
-        formatter = logging.Formatter("[%(asctime)s] %(levelname)s in %(module)s: %(message)s")
+        displayed = {id(check) for check in get_unique_failures(result.checks)}
+        cache: Dict[int, SerializedCase] = {}
         return SerializedTestResult(
             method=result.endpoint.method,
             path=result.endpoint.path,
@@ -95,10 +151,18 @@ class SerializedTestResult:
             has_logs=result.has_logs,
             is_errored=result.is_errored,
             seed=result.seed,
-            checks=[SerializedCheck.from_check(check) for check in result.checks],
-            logs=[formatter.format(record) for record in result.logs],
+            checks=[
+                SerializedCheck.from_check(check, with_example=id(check) in displayed, cache=cache)
+                for check in result.checks
+            ],
+            logs=[LOG_FORMATTER.format(record) for record in result.logs],
             errors=[SerializedError.from_error(*error) for error in result.errors],
+            is_skipped=result.is_skipped,
             response_status_code=result.response_status_code,
             response_error_result=result.response_error_result,
             response_time_in_sec=result.response_time_in_sec,
+            requests_count=result.requests_count,
+            requests_time=result.requests_time,
+            latency=result.latency.serialize(),
+            status_codes=dict(result.status_codes),
         )
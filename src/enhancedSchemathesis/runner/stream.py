@@ -0,0 +1,60 @@
+"""Machine-readable stream of runner events for external consumers.
+
+Every event is written as a single JSON document on its own line (newline-delimited JSON) and flushed immediately,
+so other processes (dashboards, parent processes in CI, etc.) can follow the run without importing Schemathesis.
+"""
+import json
+import socket
+from typing import IO, Any, Dict, Optional
+
+import attr
+
+from ..models import Endpoint
+from . import events
+from .serialization import prepare_for_json
+
+# Incremented on backward-incompatible changes in the output format
+SCHEMA_VERSION = 1  # pragma: no mutate
+UNIX_SOCKET_PREFIX = "unix:"  # pragma: no mutate
+
+
+def _is_serializable(attribute: attr.Attribute, value: Any) -> bool:
+    # Endpoints contain references to schemas and apps, events have all needed data in primitive fields
+    return not isinstance(value, Endpoint)
+
+
+def serialize_event(event: events.ExecutionEvent) -> Dict[str, Any]:
+    """Convert an event to a JSON-compatible dictionary."""
+    data = attr.asdict(event, recurse=True, filter=_is_serializable)
+    return {"version": SCHEMA_VERSION, "event": event.__class__.__name__, "data": prepare_for_json(data)}
+
+
+@attr.s(slots=True)  # pragma: no mutate
+class EventStream:
+    """Write events to a text stream as newline-delimited JSON."""
+
+    stream: IO[str] = attr.ib()  # pragma: no mutate
+    # Sockets need to be closed together with their file objects
+    connection: Optional[socket.socket] = attr.ib(default=None)  # pragma: no mutate
+
+    def write(self, event: events.ExecutionEvent) -> None:
+        self.stream.write(json.dumps(serialize_event(event), default=str))
+        self.stream.write("\n")
+        self.stream.flush()
+
+    def close(self) -> None:
+        self.stream.close()
+        if self.connection is not None:
+            self.connection.close()
+
+
+def open_stream(target: str) -> EventStream:
+    """Open an event stream for the given target.
+
+    The target could be a file path (including named pipes) or "unix:<path>" for a Unix socket.
+    """
+    if target.startswith(UNIX_SOCKET_PREFIX):
+        connection = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)  # type: ignore
+        connection.connect(target[len(UNIX_SOCKET_PREFIX) :])
+        return EventStream(connection.makefile("w", encoding="utf-8"), connection)
+    return EventStream(open(target, "w", encoding="utf-8"))
@@ -25,6 +25,7 @@ from collections import OrderedDict
 from ._hypothesis import make_test_or_exception
 from .constants import HookLocation
 from .converter import to_json_schema
+from .dependencies import sort_operations
 from .exceptions import InvalidSchema
 from .filters import should_skip_by_tag, should_skip_endpoint, should_skip_method
 from .models import Endpoint, empty_object
@@ -224,7 +225,7 @@ class SwaggerV20(BaseSchema):
         try:
             paths = self.raw_schema["paths"]  # pylint: disable=unsubscriptable-object
             for path, methods in paths.items():
-                full_path = self.get_full_path(path) if self.base_url is None else path
+                full_path = self.get_full_path(path)
                 if should_skip_endpoint(full_path, self.endpoint) :
                     continue
                 methods = self.resolve(methods)
@@ -240,14 +241,15 @@ class SwaggerV20(BaseSchema):
                     ):
                         continue
                     parameters = itertools.chain(definition.get("parameters", ()), common_parameters)
-                    yield self.make_endpoint(full_path, method, parameters, definition)
+                    yield self.make_endpoint(full_path, method, parameters, definition, schema_path=path)
                    
             if execute_in_order is not None:        
-                for method_path in execute_in_order:
+                # Operations that provide values for other ones go first
+                for method_path in sort_operations(execute_in_order):
                     method , path = method_path.split(":")
                     methods = {}
                     methods[method] = paths[path][method]
-                    full_path = self.get_full_path(path) if self.base_url is None else path
+                    full_path = self.get_full_path(path)
                     if should_skip_endpoint(full_path, self.endpoint) :
                         continue
                     methods = self.resolve(methods)
@@ -260,20 +262,31 @@ class SwaggerV20(BaseSchema):
                         ):
                             continue
                         parameters = itertools.chain(definition.get("parameters", ()), common_parameters)
-                        yield self.make_endpoint(full_path, method, parameters, definition)
+                        yield self.make_endpoint(full_path, method, parameters, definition, schema_path=path)
                         
         except (KeyError, AttributeError, jsonschema.exceptions.RefResolutionError):
             raise InvalidSchema("Schema parsing failed. Please check your schema.")
 
     def make_endpoint(
-        self, full_path: str, method: str, parameters: Iterator[Dict[str, Any]], definition: Dict[str, Any]
+        self,
+        full_path: str,
+        method: str,
+        parameters: Iterator[Dict[str, Any]],
+        definition: Dict[str, Any],
+        schema_path: Optional[str] = None,
     ) -> Endpoint:
         """Create JSON schemas for query, body, etc from Swagger parameters definitions."""
         base_url = self.base_url
         if base_url is not None:
             base_url = base_url.rstrip("/")  # pragma: no mutate
         endpoint = Endpoint(
-            path=full_path, method=method.upper(), definition=definition, base_url=base_url, app=self.app, schema=self
+            path=full_path,
+            method=method.upper(),
+            definition=definition,
+            base_url=base_url,
+            app=self.app,
+            schema=self,
+            schema_path=schema_path,
         )
         for parameter in parameters:
             self.process_parameter(endpoint, parameter)
@@ -411,10 +424,15 @@ class OpenApi30(SwaggerV20):  # pylint: disable=too-many-ancestors
         return path
 
     def make_endpoint(
-        self, full_path: str, method: str, parameters: Iterator[Dict[str, Any]], definition: Dict[str, Any]
+        self,
+        full_path: str,
+        method: str,
+        parameters: Iterator[Dict[str, Any]],
+        definition: Dict[str, Any],
+        schema_path: Optional[str] = None,
     ) -> Endpoint:
         """Create JSON schemas for query, body, etc from Swagger parameters definitions."""
-        endpoint = super().make_endpoint(full_path, method, parameters, definition)
+        endpoint = super().make_endpoint(full_path, method, parameters, definition, schema_path)
         if "requestBody" in definition:
             if 'multipart/form-data' in definition["requestBody"]["content"]:
                 self.process_form_data_example(endpoint,definition["requestBody"]["content"]['multipart/form-data'])
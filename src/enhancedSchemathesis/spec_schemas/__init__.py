@@ -0,0 +1,46 @@
+"""Meta-schemas of Open API / Swagger specifications.
+
+These schemas are copied from https://github.com/OAI/OpenAPI-Specification/tree/master/schemas and stored as JSON
+files next to this module. They are read on first use, therefore runs without schema validation don't load them.
+"""
+import json
+import pathlib
+import sys
+from functools import lru_cache
+from typing import TYPE_CHECKING, Any, Dict
+
+if TYPE_CHECKING:
+    import jsonschema
+
+HERE = pathlib.Path(__file__).parent
+FILES = {"SWAGGER_20": "swagger_20.json", "OPENAPI_30": "openapi_30.json"}  # pragma: no mutate
+
+
+@lru_cache()
+def get_schema(name: str) -> Dict[str, Any]:
+    with (HERE / FILES[name]).open(encoding="utf-8") as fd:
+        return json.load(fd)
+
+
+@lru_cache()
+def get_validator(name: str) -> "jsonschema.Draft4Validator":
+    """A validator for the meta-schema, that is checked & built once per process."""
+    import jsonschema  # pylint: disable=import-outside-toplevel
+
+    schema = get_schema(name)
+    cls = jsonschema.validators.validator_for(schema)
+    cls.check_schema(schema)
+    return cls(schema)
+
+
+def __getattr__(name: str) -> Dict[str, Any]:
+    # `SWAGGER_20` & `OPENAPI_30` were module-level dictionaries
+    if name in FILES:
+        return get_schema(name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+if sys.version_info < (3, 7):
+    # Module-level `__getattr__` is not supported before Python 3.7
+    SWAGGER_20 = get_schema("SWAGGER_20")
+    OPENAPI_30 = get_schema("OPENAPI_30")
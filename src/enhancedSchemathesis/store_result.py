@@ -1,11 +1,55 @@
+"""Storage for values extracted from responses, that are used in the subsequent requests."""
+import threading
+from typing import Any, Callable, Dict, List, Optional
 
-class Store_response():
-    def __init__(self):
-        self.store = {}
-    
-    def store_result(self,path,k,v):
-        self.store[path] = {}
-        self.store[path][k]=v
-    
-    def get_store_result(self,path,k):
-        return self.store[path][k]
\ No newline at end of file
+import attr
+
+
+@attr.s(slots=True)  # pragma: no mutate
+class ResponseStore:
+    """Values stored from responses, grouped by operations in the "method:path" format.
+
+    It is shared by all workers of a runner. Writes are serialized, while reads are lock-free - every write replaces
+    the whole operation's dictionary, therefore readers always see a complete set of values.
+    """
+
+    store: Dict[str, Dict[str, Any]] = attr.ib(factory=dict)  # pragma: no mutate
+    _lock: threading.Lock = attr.ib(factory=threading.Lock)  # pragma: no mutate
+    # Called with an operation name after new values are stored for it. The list is replaced on every change, so it
+    # could be iterated without the lock
+    _listeners: List[Callable[[str], None]] = attr.ib(factory=list)  # pragma: no mutate
+
+    def add_listener(self, listener: Callable[[str], None]) -> None:
+        with self._lock:
+            self._listeners = [*self._listeners, listener]
+
+    def remove_listener(self, listener: Callable[[str], None]) -> None:
+        """Stop calling the listener. Unknown listeners are ignored."""
+        with self._lock:
+            self._listeners = [item for item in self._listeners if item != listener]
+
+    def store_result(self, path: str, k: str, v: Any) -> None:
+        """Store a single value for the given operation."""
+        self.store_many(path, {k: v})
+
+    def store_many(self, path: str, values: Dict[str, Any]) -> None:
+        """Store multiple values for the given operation, keeping the previously stored ones."""
+        with self._lock:
+            self.store[path] = {**self.store.get(path, {}), **values}
+        for listener in self._listeners:
+            listener(path)
+
+    def get_store_result(self, path: str, k: str) -> Any:
+        """Get a stored value. Raises `KeyError` if it was not stored yet."""
+        return self.store[path][k]
+
+    def get(self, path: str, k: str, default: Optional[Any] = None) -> Any:
+        return self.store.get(path, {}).get(k, default)
+
+    def has_result(self, path: str) -> bool:
+        """Whether any values were stored for the given operation."""
+        return path in self.store
+
+
+# Backward-compatible name
+Store_response = ResponseStore
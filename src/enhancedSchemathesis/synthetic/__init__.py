@@ -0,0 +1,3 @@
+"""Large synthetic schemas & applications, that implement them - for benchmarks & load tests of Schemathesis."""
+from .app import make_app, write_app_module
+from .specs import SpecConfig, generate_schema
@@ -0,0 +1,206 @@
+"""A WSGI application, that implements any schema with canned responses.
+
+Responses are built from response schemas once, when the application is created - requests are served by a lookup in
+a routing trie, so the cost of a request doesn't depend on the number of endpoints in the schema.
+"""
+import json
+import os
+from typing import Any, Callable, Dict, Iterable, List, Optional, Set, Tuple
+from urllib.parse import urlsplit
+
+import attr
+from werkzeug.wrappers import Request, Response
+
+SCHEMA_PATH = "/schema.json"  # pragma: no mutate
+# Key for path templates segments, like `{item_id}`, in the routing trie
+PARAMETER = "{}"  # pragma: no mutate
+# Key for operations in the routing trie
+OPERATIONS = ""  # pragma: no mutate
+HTTP_METHODS = ("get", "put", "post", "delete", "options", "head", "patch", "trace")  # pragma: no mutate
+
+
+@attr.s(slots=True)  # pragma: no mutate
+class CannedResponse:
+    status: int = attr.ib()  # pragma: no mutate
+    body: Optional[bytes] = attr.ib()  # pragma: no mutate
+
+
+@attr.s(slots=True)  # pragma: no mutate
+class InstanceBuilder:
+    """Build minimal JSON instances, that are valid against schemas with local references.
+
+    Instances of referenced definitions are cached, so every definition is built once. Properties, that lead to
+    recursion, are omitted unless they are required.
+    """
+
+    raw_schema: Dict[str, Any] = attr.ib()  # pragma: no mutate
+    _cache: Dict[str, Any] = attr.ib(factory=dict)  # pragma: no mutate
+    _stack: Set[str] = attr.ib(factory=set)  # pragma: no mutate
+
+    def resolve(self, reference: str) -> Dict[str, Any]:
+        document: Any = self.raw_schema
+        for part in reference.lstrip("#/").split("/"):
+            document = document[part.replace("~1", "/").replace("~0", "~")]
+        return document
+
+    def is_recursive(self, schema: Dict[str, Any]) -> bool:
+        if "$ref" in schema:
+            return schema["$ref"] in self._stack
+        if "items" in schema:
+            return self.is_recursive(schema["items"])
+        return False
+
+    def build(self, schema: Dict[str, Any]) -> Any:
+        # pylint: disable=too-many-return-statements
+        if "$ref" in schema:
+            reference = schema["$ref"]
+            if reference not in self._cache:
+                self._stack.add(reference)
+                try:
+                    self._cache[reference] = self.build(self.resolve(reference))
+                finally:
+                    self._stack.discard(reference)
+            return self._cache[reference]
+        if "allOf" in schema:
+            instance: Dict[str, Any] = {}
+            for subschema in schema["allOf"]:
+                instance.update(self.build(subschema))
+            return instance
+        for keyword in ("oneOf", "anyOf"):
+            if keyword in schema:
+                return self.build(schema[keyword][0])
+        if "enum" in schema:
+            return schema["enum"][0]
+        schema_type = schema.get("type", "object")
+        if schema_type == "object":
+            required = schema.get("required", [])
+            return {
+                name: self.build(subschema)
+                for name, subschema in schema.get("properties", {}).items()
+                if name in required or not self.is_recursive(subschema)
+            }
+        if schema_type == "array":
+            if schema.get("minItems", 0) > 0:
+                return [self.build(schema.get("items", {}))] * schema["minItems"]
+            return []
+        if schema_type == "integer":
+            return schema.get("minimum", 1)
+        if schema_type == "number":
+            return schema.get("minimum", 0)
+        if schema_type == "boolean":
+            return True
+        if schema_type == "string":
+            return "x" * max(schema.get("minLength", 1), 1)
+        return None
+
+
+def get_response_schema(definition: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+    if "schema" in definition:
+        # Swagger 2.0
+        return definition["schema"]
+    content = definition.get("content", {})
+    if "application/json" in content:
+        return content["application/json"].get("schema")
+    return None
+
+
+def make_response(builder: InstanceBuilder, operation: Dict[str, Any]) -> CannedResponse:
+    """The first successful response of the operation."""
+    for status, definition in operation.get("responses", {}).items():
+        if str(status).startswith("2"):
+            if "$ref" in definition:
+                definition = builder.resolve(definition["$ref"])
+            schema = get_response_schema(definition)
+            body = json.dumps(builder.build(schema)).encode("utf-8") if schema is not None else None
+            return CannedResponse(status=int(status), body=body)
+    return CannedResponse(status=200, body=b"{}")
+
+
+def get_base_path(raw_schema: Dict[str, Any]) -> str:
+    if "swagger" in raw_schema:
+        base_path = raw_schema.get("basePath", "/")
+    else:
+        servers = raw_schema.get("servers", [])
+        base_path = urlsplit(servers[0]["url"]).path if servers else "/"
+    return base_path.rstrip("/")
+
+
+def split_path(path: str) -> List[str]:
+    return [segment for segment in path.split("/") if segment]
+
+
+def make_routes(raw_schema: Dict[str, Any]) -> Dict[str, Any]:
+    """Routing trie, where every node maps path segments to child nodes and `OPERATIONS` to canned responses."""
+    builder = InstanceBuilder(raw_schema)
+    root: Dict[str, Any] = {}
+    base_path = get_base_path(raw_schema)
+    for path, path_item in raw_schema.get("paths", {}).items():
+        node = root
+        for segment in split_path(base_path + path):
+            key = PARAMETER if segment.startswith("{") and segment.endswith("}") else segment
+            node = node.setdefault(key, {})
+        operations = node.setdefault(OPERATIONS, {})
+        for method, operation in path_item.items():
+            if method in HTTP_METHODS:
+                operations[method.upper()] = make_response(builder, operation)
+    return root
+
+
+def find_operations(routes: Dict[str, Any], path: str) -> Optional[Dict[str, CannedResponse]]:
+    node = routes
+    for segment in split_path(path):
+        # Static segments take precedence over templated ones
+        if segment in node and segment != OPERATIONS:
+            node = node[segment]
+        elif PARAMETER in node:
+            node = node[PARAMETER]
+        else:
+            return None
+    return node.get(OPERATIONS)
+
+
+def json_response(body: Optional[bytes], status: int) -> Response:
+    return Response(body, status=status, content_type="application/json")
+
+
+def make_app(raw_schema: Dict[str, Any]) -> Callable[[Dict[str, Any], Callable], Iterable[bytes]]:
+    """Create a WSGI application, that serves the given schema at `SCHEMA_PATH` & responds to all its operations.
+
+    Every operation responds with a JSON instance of its first successful response schema.
+    """
+    routes = make_routes(raw_schema)
+    serialized_schema = json.dumps(raw_schema).encode("utf-8")
+
+    def get_response(request: Request) -> Tuple[Optional[bytes], int]:
+        if request.path == SCHEMA_PATH:
+            return serialized_schema, 200
+        operations = find_operations(routes, request.path)
+        if operations is None:
+            return b'{"detail": "Not found"}', 404
+        response = operations.get(request.method)
+        if response is None:
+            return b'{"detail": "Method not allowed"}', 405
+        return response.body, response.status
+
+    def app(environ: Dict[str, Any], start_response: Callable) -> Iterable[bytes]:
+        body, status = get_response(Request(environ))
+        return json_response(body, status)(environ, start_response)
+
+    return app
+
+
+APP_MODULE_TEMPLATE = '''"""A stub application for {schema_path}. Generated by `schemathesis synthesize`."""
+import json
+import os
+
+from schemathesis.synthetic import make_app
+
+with open({schema_path!r}, encoding="utf-8") as fd:
+    app = make_app(json.load(fd))
+'''  # pragma: no mutate
+
+
+def write_app_module(module_path: str, schema_path: str) -> None:
+    """Write a Python module with the stub application for a schema file in its `app` variable."""
+    with open(module_path, "w", encoding="utf-8") as fd:
+        fd.write(APP_MODULE_TEMPLATE.format(schema_path=os.path.abspath(schema_path)))
@@ -0,0 +1,149 @@
+"""Generation of large Swagger 2.0 / Open API 3.0 schemas.
+
+Schemas are fully determined by their configuration, so the same configuration always gives the same schema.
+Definitions are organized in levels - every definition on a level refers to `ref_fanout` definitions on the next one,
+the last level has only scalar properties.
+"""
+from copy import deepcopy
+from typing import Any, Dict, List
+
+import attr
+
+SWAGGER_20 = "2.0"  # pragma: no mutate
+OPENAPI_30 = "3.0"  # pragma: no mutate
+SPEC_VERSIONS = (SWAGGER_20, OPENAPI_30)  # pragma: no mutate
+# Scalar properties of every definition
+SCALARS: Dict[str, Dict[str, Any]] = {
+    "id": {"type": "integer", "minimum": 1},
+    "name": {"type": "string", "minLength": 1, "maxLength": 50},
+    "price": {"type": "number", "minimum": 0},
+    "active": {"type": "boolean"},
+    "status": {"type": "string", "enum": ["available", "pending", "sold"]},
+}  # pragma: no mutate
+VARIANTS = ("Cat", "Dog")  # pragma: no mutate
+PARAMETER_TYPES = (
+    {"type": "integer", "minimum": 1, "maximum": 1000},
+    {"type": "string", "minLength": 1, "maxLength": 20},
+    {"type": "boolean"},
+    {"type": "string", "enum": ["asc", "desc"]},
+)  # pragma: no mutate
+
+
+@attr.s(slots=True)  # pragma: no mutate
+class SpecConfig:
+    """Shape of a generated schema."""
+
+    spec_version: str = attr.ib(default=OPENAPI_30, validator=attr.validators.in_(SPEC_VERSIONS))  # pragma: no mutate
+    # Every path has an item endpoint with GET, PUT & DELETE operations
+    paths: int = attr.ib(default=100)  # pragma: no mutate
+    # Query & header parameters of every operation, in addition to the path parameter
+    parameters: int = attr.ib(default=2)  # pragma: no mutate
+    # Number of definitions on each level
+    definitions: int = attr.ib(default=10)  # pragma: no mutate
+    # Number of references from every definition to the next level & the number of levels
+    ref_fanout: int = attr.ib(default=2)  # pragma: no mutate
+    ref_depth: int = attr.ib(default=3)  # pragma: no mutate
+    # Top-level definitions contain a list of themselves
+    recursive: bool = attr.ib(default=False)  # pragma: no mutate
+    # Top-level definitions have variants, that extend them via `allOf`. In Open API 3.0 payloads are `oneOf` them
+    polymorphic: bool = attr.ib(default=False)  # pragma: no mutate
+
+
+def get_definition_name(level: int, idx: int) -> str:
+    return f"Model{level}_{idx}"
+
+
+def make_definitions(config: SpecConfig) -> Dict[str, Dict[str, Any]]:
+    prefix = "#/definitions/" if config.spec_version == SWAGGER_20 else "#/components/schemas/"
+    definitions = {}
+    for level in range(max(config.ref_depth, 1)):
+        for idx in range(config.definitions):
+            # Copies, so the schema has no shared objects
+            properties = deepcopy(SCALARS)
+            if level < config.ref_depth - 1:
+                for position in range(config.ref_fanout):
+                    target = get_definition_name(level + 1, (idx * config.ref_fanout + position) % config.definitions)
+                    properties[f"ref{position}"] = {"$ref": prefix + target}
+            name = get_definition_name(level, idx)
+            if level == 0 and config.recursive:
+                properties["children"] = {"type": "array", "items": {"$ref": prefix + name}, "maxItems": 3}
+            definitions[name] = {"type": "object", "required": ["id", "name"], "properties": properties}
+            if level == 0 and config.polymorphic:
+                for variant in VARIANTS:
+                    # Variants are disjoint, so exactly one of them matches any valid instance
+                    extension = {
+                        "type": "object",
+                        "required": ["kind"],
+                        "properties": {"kind": {"type": "string", "enum": [variant]}},
+                    }
+                    definitions[name + variant] = {"allOf": [{"$ref": prefix + name}, extension]}
+    return definitions
+
+
+def get_operation_schema(config: SpecConfig, idx: int) -> Dict[str, Any]:
+    """Schema of the request & response payloads of the operations on the given path."""
+    prefix = "#/definitions/" if config.spec_version == SWAGGER_20 else "#/components/schemas/"
+    name = get_definition_name(0, idx % config.definitions)
+    if config.polymorphic and config.spec_version == OPENAPI_30:
+        return {"oneOf": [{"$ref": prefix + name + variant} for variant in VARIANTS]}
+    if config.polymorphic:
+        # There is no `oneOf` in Swagger 2.0
+        return {"$ref": prefix + name + VARIANTS[idx % len(VARIANTS)]}
+    return {"$ref": prefix + name}
+
+
+def make_parameters(config: SpecConfig, idx: int) -> List[Dict[str, Any]]:
+    parameters = []
+    for position in range(config.parameters):
+        schema = PARAMETER_TYPES[(idx + position) % len(PARAMETER_TYPES)]
+        # Every third parameter is a header
+        location = "header" if position % 3 == 2 else "query"
+        name = f"X-Param-{position}" if location == "header" else f"param{position}"
+        parameter: Dict[str, Any] = {"name": name, "in": location, "required": position == 0}
+        if config.spec_version == SWAGGER_20:
+            parameter.update(deepcopy(schema))
+        else:
+            parameter["schema"] = deepcopy(schema)
+        parameters.append(parameter)
+    return parameters
+
+
+def make_path_item(config: SpecConfig, idx: int) -> Dict[str, Any]:
+    schema = get_operation_schema(config, idx)
+    path_parameter: Dict[str, Any] = {"name": "item_id", "in": "path", "required": True}
+    if config.spec_version == SWAGGER_20:
+        path_parameter.update(type="integer", minimum=1)
+        response = {"description": "OK", "schema": schema}
+        body = {"parameters": [{"name": "body", "in": "body", "required": True, "schema": schema}]}
+    else:
+        path_parameter["schema"] = {"type": "integer", "minimum": 1}
+        response = {"description": "OK", "content": {"application/json": {"schema": schema}}}
+        body = {"requestBody": {"required": True, "content": {"application/json": {"schema": schema}}}}
+    not_found = {"description": "Not found"}
+    return {
+        "parameters": [path_parameter],
+        "get": {
+            "operationId": f"getItem{idx}",
+            "parameters": make_parameters(config, idx),
+            "responses": {"200": response, "404": not_found},
+        },
+        "put": {"operationId": f"updateItem{idx}", **body, "responses": {"200": response, "404": not_found}},
+        "delete": {"operationId": f"deleteItem{idx}", "responses": {"204": {"description": "Deleted"}}},
+    }
+
+
+def generate_schema(config: SpecConfig) -> Dict[str, Any]:
+    """Create a raw schema with the given shape."""
+    info = {"title": "Synthetic API", "version": "1.0.0"}
+    paths = {f"/items{idx}/{{item_id}}": make_path_item(config, idx) for idx in range(config.paths)}
+    definitions = make_definitions(config)
+    if config.spec_version == SWAGGER_20:
+        return {
+            "swagger": "2.0",
+            "info": info,
+            "consumes": ["application/json"],
+            "produces": ["application/json"],
+            "paths": paths,
+            "definitions": definitions,
+        }
+    return {"openapi": "3.0.2", "info": info, "paths": paths, "components": {"schemas": definitions}}
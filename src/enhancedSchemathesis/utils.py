@@ -1,4 +1,5 @@
 import cgi
+import json
 import pathlib
 import re
 import sys
@@ -165,6 +166,22 @@ def get_requests_auth(auth: Optional[RawAuth], auth_type: Optional[str]) -> Opti
 GenericResponse = Union[requests.Response, WSGIResponse]  # pragma: no mutate
 
 
+def get_response_payload(response: GenericResponse) -> Any:
+    """Decode the response's JSON payload. Returns `None` if it is not a valid JSON."""
+    try:
+        if isinstance(response, requests.Response):
+            return response.json()
+        return json.loads(response.get_data(as_text=True))
+    except ValueError:
+        return None
+
+
+def get_response_text(response: GenericResponse) -> str:
+    if isinstance(response, requests.Response):
+        return response.text
+    return response.get_data(as_text=True)
+
+
 def import_app(path: str) -> Any:
     """Import an application from a string."""
     path, name = (re.split(r":(?![\\/])", path, 1) + [None])[:2]  # type: ignore
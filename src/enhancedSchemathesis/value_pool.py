@@ -0,0 +1,132 @@
+"""Values harvested from successful responses, that are used to make generated parameters more realistic.
+
+Randomly generated identifiers rarely exist on the tested application, therefore most requests with them end up with
+404 and never reach the deeper application logic. The pool collects scalar values from responses by their field names
+and generated path, query & body parameters with the same names are replaced with them with a configurable
+probability. The replacement is a part of the data generation strategy, therefore Hypothesis shrinks & replays
+examples with pool values as any other generated data.
+"""
+import random
+import re
+import threading
+from typing import Any, Dict, List, Optional, Tuple
+
+import attr
+
+from .models import Endpoint
+
+# Parameter locations that could be filled with values from the pool
+POOL_LOCATIONS = ("path_parameters", "query", "body")  # pragma: no mutate
+DEFAULT_PROBABILITY = 0.5  # pragma: no mutate
+# Maximum number of values stored per field name
+DEFAULT_MAX_SIZE = 100  # pragma: no mutate
+# Maximum number of distinct field names in the pool
+MAX_FIELDS = 1024  # pragma: no mutate
+# Longer strings are rarely identifiers and are not worth storing
+MAX_STRING_LENGTH = 256  # pragma: no mutate
+IDENTIFIER_FIELD = "id"  # pragma: no mutate
+PATH_PARAMETER_RE = re.compile(r"{[^}]+}")  # pragma: no mutate
+
+
+def get_resource_name(endpoint: Endpoint) -> Optional[str]:
+    """Singular name of the resource from the last static segment of the endpoint's path, e.g. "note" for "/notes"."""
+    segments = [segment for segment in endpoint.path.split("/") if segment and not PATH_PARAMETER_RE.search(segment)]
+    if not segments:
+        return None
+    name = segments[-1]
+    if name.endswith("s") and len(name) > 1:
+        name = name[:-1]
+    return name
+
+
+def _is_poolable(value: Any) -> bool:
+    if isinstance(value, bool):
+        return False
+    if isinstance(value, str):
+        return 0 < len(value) <= MAX_STRING_LENGTH
+    return isinstance(value, (int, float))
+
+
+def _get_aliases(name: str) -> Tuple[str, str]:
+    # Identifiers of a resource are usually referenced as "note_id" or "noteId" by other operations
+    return f"{name}_id", f"{name}Id"
+
+
+def iter_fields(data: Any, resource: Optional[str]) -> List[Tuple[str, Any]]:
+    """Scalar values from a decoded JSON payload with their field names.
+
+    Generic "id" fields are also returned under the names of their parent objects or of the resource itself.
+    """
+    output: List[Tuple[str, Any]] = []
+    stack: List[Tuple[Any, Optional[str]]] = [(data, resource)]
+    while stack:
+        item, parent = stack.pop()
+        if isinstance(item, list):
+            stack.extend((child, parent) for child in item)
+        elif isinstance(item, dict):
+            for key, value in item.items():
+                if _is_poolable(value):
+                    output.append((key, value))
+                    if key == IDENTIFIER_FIELD and parent is not None:
+                        output.extend((alias, value) for alias in _get_aliases(parent))
+                elif isinstance(value, (dict, list)):
+                    stack.append((value, key))
+    return output
+
+
+@attr.s(slots=True)  # pragma: no mutate
+class ValuePool:
+    """Bounded pool of values per field name.
+
+    Each field keeps a uniform random sample (reservoir sampling) of all values seen for it. The pool is shared by all
+    workers of a runner.
+    """
+
+    probability: float = attr.ib(default=DEFAULT_PROBABILITY)  # pragma: no mutate
+    max_size: int = attr.ib(default=DEFAULT_MAX_SIZE)  # pragma: no mutate
+    seed: Optional[int] = attr.ib(default=None)  # pragma: no mutate
+    _values: Dict[str, List[Any]] = attr.ib(factory=dict)  # pragma: no mutate
+    _seen: Dict[str, int] = attr.ib(factory=dict)  # pragma: no mutate
+    _random: random.Random = attr.ib(init=False)  # pragma: no mutate
+    _lock: threading.Lock = attr.ib(factory=threading.Lock)  # pragma: no mutate
+
+    def __attrs_post_init__(self) -> None:
+        self._random = random.Random(self.seed)
+
+    def add(self, name: str, value: Any) -> None:
+        with self._lock:
+            values = self._values.get(name)
+            if values is None:
+                if len(self._values) >= MAX_FIELDS:
+                    return
+                values = self._values[name] = []
+            seen = self._seen.get(name, 0) + 1
+            self._seen[name] = seen
+            if len(values) < self.max_size:
+                values.append(value)
+            else:
+                idx = self._random.randrange(seen)
+                if idx < self.max_size:
+                    values[idx] = value
+
+    def harvest(self, endpoint: Endpoint, data: Any) -> None:
+        """Collect values from a decoded payload of a successful response."""
+        for name, value in iter_fields(data, get_resource_name(endpoint)):
+            self.add(name, value)
+
+    def get(self, name: str) -> List[Any]:
+        """A copy of values stored for the given field name."""
+        with self._lock:
+            return list(self._values.get(name, ()))
+
+    def get_candidates(self, location: str, name: str, current: Any) -> List[Any]:
+        """Stored values that could replace the generated value of the given parameter.
+
+        Only values of the same type are used, so the case still matches the schema in most cases. Numeric identifiers
+        could fill string path parameters.
+        """
+        values = self.get(name)
+        if location == "path_parameters" and isinstance(current, str):
+            # Path parameters are a part of the URL anyway
+            values = [str(value) for value in values]
+        return [value for value in values if type(value) is type(current)]  # pylint: disable=unidiomatic-typecheck
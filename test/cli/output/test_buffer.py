@@ -0,0 +1,70 @@
+import io
+import time
+
+import click
+import pytest
+
+from schemathesis.cli.output import buffer
+
+
+class CountingStream(io.StringIO):
+    def __init__(self):
+        super().__init__()
+        self.writes = 0
+
+    def write(self, text):
+        self.writes += 1
+        return super().write(text)
+
+
+def test_writes_are_batched():
+    stream = CountingStream()
+    output = buffer.BufferedOutput(stream, flush_interval=60)
+    for _ in range(100):
+        click.echo("message", file=output)
+    # Click flushes after every message, but nothing is written until the buffer is drained
+    assert stream.writes == 0
+    output.close()
+    assert stream.writes == 1
+    assert stream.getvalue() == "message\n" * 100
+
+
+def test_big_buffer_is_written(mocker):
+    mocker.patch("schemathesis.cli.output.buffer.MAX_BUFFER_SIZE", 10)
+    stream = io.StringIO()
+    output = buffer.BufferedOutput(stream, flush_interval=60)
+    output.write("12345")
+    assert stream.getvalue() == ""
+    output.write("67890")
+    assert stream.getvalue() == "1234567890"
+
+
+def test_threaded():
+    stream = io.StringIO()
+    output = buffer.BufferedOutput(stream, flush_interval=0.01, threaded=True)
+    output.write("message")
+    deadline = time.monotonic() + 5
+    while not stream.getvalue() and time.monotonic() < deadline:
+        time.sleep(0.01)
+    assert stream.getvalue() == "message"
+    output.write(" & the rest")
+    output.close()
+    assert stream.getvalue() == "message & the rest"
+
+
+def test_bytes_are_rejected():
+    # Click checks whether a stream is binary by writing bytes to it
+    with pytest.raises(TypeError):
+        buffer.BufferedOutput(io.StringIO()).write(b"")
+
+
+@pytest.mark.parametrize("threaded", (True, False))
+def test_buffered_stdout(capsys, threaded):
+    with pytest.raises(click.exceptions.Exit):
+        with buffer.buffered_stdout(threaded=threaded):
+            click.echo("Finished")
+            raise click.exceptions.Exit(1)
+    # The output is written and `sys.stdout` is restored even if the block fails
+    assert capsys.readouterr().out == "Finished\n"
+    print("after")
+    assert capsys.readouterr().out == "after\n"
@@ -0,0 +1,127 @@
+import sys
+
+import click
+import pytest
+
+import schemathesis
+from schemathesis.cli import get_output_handler
+from schemathesis.cli.context import ExecutionContext
+from schemathesis.cli.output import dashboard
+from schemathesis.models import Status
+from schemathesis.runner import events
+from schemathesis.runner.serialization import SerializedTestResult
+
+
+def make_after_execution(path, status=Status.success, status_codes=None, examples=5):
+    result = SerializedTestResult(
+        method="GET",
+        path=path,
+        has_failures=status == Status.failure,
+        has_errors=status == Status.error,
+        has_logs=False,
+        is_errored=status == Status.error,
+        seed=None,
+        checks=[],
+        logs=[],
+        errors=[],
+        requests_count=sum((status_codes or {}).values()),
+        status_codes=status_codes or {},
+    )
+    return events.AfterExecution(
+        status=status, result=result, phases={"generation": {"count": examples}}, elapsed_time=0.1
+    )
+
+
+def make_before_execution(path):
+    return events.BeforeExecution(method="GET", path=path, endpoint=None)
+
+
+@pytest.fixture(autouse=True)
+def click_context():
+    """Keep escape sequences in the output."""
+    with click.Context(schemathesis.cli.run, color=True):
+        yield
+
+
+@pytest.fixture
+def statistic():
+    return dashboard.LiveStatistic(workers=[None, None], endpoints_count=4)
+
+
+def test_workers(statistic):
+    statistic.start(make_before_execution("/first"))
+    statistic.start(make_before_execution("/second"))
+    assert statistic.workers == ["GET /first", "GET /second"]
+    statistic.finish(make_after_execution("/first"))
+    # The freed slot is taken by the next endpoint
+    statistic.start(make_before_execution("/third"))
+    assert statistic.workers == ["GET /third", "GET /second"]
+
+
+def test_counters(statistic):
+    statistic.finish(make_after_execution("/a", Status.success, {200: 8, 500: 2}))
+    statistic.finish(make_after_execution("/b", Status.failure, {200: 10}))
+    statistic.finish(make_after_execution("/c", Status.error))
+    assert statistic.processed == 3
+    assert (statistic.passed, statistic.failed, statistic.errored) == (1, 1, 1)
+    assert statistic.requests == 20
+    assert statistic.server_errors == 2
+    assert statistic.examples == 15
+
+
+def test_render(mocker, statistic):
+    statistic.start_time = 0
+    mocker.patch("time.monotonic", return_value=10)
+    statistic.start(make_before_execution("/users"))
+    statistic.finish(make_after_execution("/a", Status.success, {200: 90, 500: 10}, examples=50))
+    lines = statistic.render(200)
+    assert lines == [
+        "Endpoints: 1 / 4 (25%)    Elapsed: 10s    ETA: 30s",
+        "Throughput: 10.0 requests/s    5.0 examples/s",
+        "Results: 1 passed, 0 failed, 0 errored, 0 skipped    Error rate: 0.0%    5xx responses: 10.0%",
+        "Worker 1: GET /users",
+        "Worker 2: idle",
+    ]
+    # Lines are not wrapped in narrow terminals
+    assert all(len(line) <= 10 for line in statistic.render(10))
+
+
+def test_draw_in_place(capsys, mocker):
+    mocker.patch("schemathesis.cli.output.default.get_terminal_width", return_value=80)
+    context = ExecutionContext(workers_num=2)
+    context.live_statistic = dashboard.LiveStatistic(workers=[None, None], endpoints_count=4)
+    dashboard.draw(context)
+    out = capsys.readouterr().out
+    assert out.count(dashboard.CLEAR_LINE) == 5
+    assert dashboard.CURSOR_UP.format(5) not in out
+    # Redraws are throttled
+    dashboard.draw(context)
+    assert capsys.readouterr().out == ""
+    # The previous frame is overwritten
+    dashboard.draw(context, force=True)
+    assert capsys.readouterr().out.startswith(dashboard.CURSOR_UP.format(5))
+
+
+def test_handle_event(capsys, mocker):
+    mocker.patch("schemathesis.cli.output.default.handle_finished")
+    context = ExecutionContext(workers_num=2)
+    initialized = events.Initialized(
+        endpoints_count=1, location=None, base_url=None, specification_name="Open API 3.0.0"
+    )
+    dashboard.handle_event(context, initialized)
+    dashboard.handle_event(context, make_before_execution("/users"))
+    dashboard.handle_event(context, make_after_execution("/users"))
+    # Results are kept for the summary
+    assert len(context.results) == 1
+    assert context.live_statistic.processed == 1
+    assert "Endpoints: 1 / 1 (100%)" in capsys.readouterr().out
+
+
+@pytest.mark.parametrize(
+    "workers_num, isatty, expected",
+    ((1, True, "default"), (2, True, "dashboard"), (2, False, "short")),
+)
+def test_get_output_handler(mocker, workers_num, isatty, expected):
+    mocker.patch.object(sys.stdout, "isatty", return_value=isatty)
+    handler = get_output_handler(workers_num)
+    assert handler.__module__ == f"schemathesis.cli.output.{expected}"
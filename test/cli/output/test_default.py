@@ -1,4 +1,5 @@
 import os
+import signal
 import sys
 
 import click
@@ -203,6 +204,17 @@ def test_handle_after_execution(capsys, execution_context, after_execution, stat
     assert strip_style_win32(click.style("[100%]", fg="cyan")) == percentage
 
 
+def test_handle_after_execution_skipped(capsys, execution_context, after_execution):
+    # Given an endpoint, that was skipped due to the run's limits
+    after_execution.result.is_skipped = True
+    default.handle_after_execution(execution_context, after_execution)
+    symbol, _ = capsys.readouterr().out.strip().split()
+    # Then it is displayed with its own symbol
+    assert strip_style_win32(click.style("S", fg="yellow")) == symbol
+    # And it is counted as processed
+    assert execution_context.endpoints_processed == 1
+
+
 def test_after_execution_attributes(execution_context, after_execution):
     # When `handle_after_execution` is executed
     default.handle_after_execution(execution_context, after_execution)
@@ -327,3 +339,29 @@ def test_display_summary(capsys, results_set, swagger_20):
     assert "=== 1 passed in 1.26s ===" in out
     # And it should be in green & bold style
     assert strip_style_win32(click.style(click.unstyle(out), fg="green", bold=True)) == out
+
+
+def test_display_summary_skipped(capsys, endpoint):
+    results = models.TestResultSet([models.TestResult(endpoint), models.TestResult(endpoint, is_skipped=True)])
+    event = runner.events.Finished.from_results(results=results, running_time=1.257)
+    with pytest.raises(click.exceptions.Exit):
+        default.display_summary(event)
+    # Skipped endpoints are not counted as passed
+    assert "=== 1 passed, 1 skipped in 1.26s ===" in capsys.readouterr().out
+
+
+@pytest.mark.skipif(not hasattr(signal, "SIGWINCH"), reason="SIGWINCH is not available on Windows")
+def test_terminal_width_is_refreshed_on_resize(mocker):
+    get_terminal_size = mocker.patch("shutil.get_terminal_size", return_value=os.terminal_size((80, 24)))
+    # The width is cached by a previous run
+    assert default.get_terminal_width() == 80
+    get_terminal_size.return_value = os.terminal_size((100, 24))
+    with default.refresh_terminal_width_on_resize():
+        # And it is refreshed when a new run starts
+        assert default.get_terminal_width() == 100
+        get_terminal_size.return_value = os.terminal_size((120, 24))
+        # The width is cached during the run
+        assert default.get_terminal_width() == 100
+        os.kill(os.getpid(), signal.SIGWINCH)
+        assert default.get_terminal_width() == 120
+    default.get_terminal_width.cache_clear()
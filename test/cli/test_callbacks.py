@@ -58,3 +58,14 @@ def test_reraise_format_error():
 def test_validate_regex(value):
     with pytest.raises(click.BadParameter, match="Invalid regex: "):
         callbacks.validate_regex(None, None, (value,))
+
+
+@pytest.mark.parametrize("value, expected", (("10/s", 10), ("120/m", 2), ("5", 5), (None, None)))
+def test_convert_rate_limit(value, expected):
+    assert callbacks.convert_rate_limit(None, None, value) == expected
+
+
+@pytest.mark.parametrize("value", ("10/d", "0/s", "-1/s", "a/s", ""))
+def test_convert_rate_limit_invalid(value):
+    with pytest.raises(click.BadParameter):
+        callbacks.convert_rate_limit(None, None, value)
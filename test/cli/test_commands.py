@@ -1,8 +1,10 @@
 import json
 import pathlib
+import pstats
 import time
 from test.utils import HERE, SIMPLE_PATH
 from urllib.parse import urljoin
+from xml.etree import ElementTree
 
 import pytest
 import requests
@@ -32,7 +34,9 @@ def test_commands_help(cli):
 
     assert result.exit_code == ExitCode.OK
     lines = result.stdout.split("\n")
-    assert lines[11] == "  run  Perform schemathesis test."
+    assert lines[11] == "  merge       Combine results of multiple runs."
+    assert lines[12] == "  run         Perform schemathesis test."
+    assert lines[13] == "  synthesize  Generate a large schema & an application for it."
 
     result_help = cli.main("--help")
     result_h = cli.main("-h")
@@ -127,6 +131,29 @@ def test_commands_version(cli):
             "Error: Invalid value for '--header' / '-H': Header value should be latin-1 encodable",
         ),
         (("run", "//test"), "Error: Invalid SCHEMA, must be a valid URL or file path."),
+        (
+            ("run", "http://127.0.0.1", "--shard=1"),
+            "Error: Invalid value for '--shard': Shard should be in the i/N format. Example: 1/4. Got: 1",
+        ),
+        (
+            ("run", "http://127.0.0.1", "--shard=3/2"),
+            "Error: Invalid value for '--shard': Shard index should be between 1 and the total number of shards. "
+            "Got: 3/2",
+        ),
+        (
+            ("run", "http://127.0.0.1", "--report=xml:report.xml"),
+            "Error: Invalid value for '--report': Should be in FORMAT:PATH format, where FORMAT is one of: "
+            "junit, json. Got: xml:report.xml",
+        ),
+        (
+            ("run", "http://127.0.0.1", "--profile=cpu"),
+            "Error: Invalid value for '--profile': Should be in TYPE:PATH format, where TYPE is one of: cpu, alloc. "
+            "Got: cpu",
+        ),
+        (
+            ("run", "http://127.0.0.1", "--profile=cpu:run.prof", "--workers=2"),
+            "Error: --profile requires a single worker",
+        ),
     ),
 )
 def test_commands_run_errors(cli, args, error):
@@ -183,10 +210,75 @@ def test_commands_run_help(cli):
         "",
         "  --validate-schema BOOLEAN       Enable or disable validation of input schema.",
         "  --show-errors-tracebacks        Show full tracebacks for internal errors.",
+        "  --profile-phases                Show how much time was spent on strategies,",
+        "                                  data generation, network, checks, shrinking &",
+        "                                  serialization.",
+        "",
+        "  --profile TEXT                  Profile the run per endpoint and write the",
+        "                                  profile to a file, in TYPE:PATH format. CPU",
+        "                                  profiles are written in the pstats format,",
+        "                                  allocations as collapsed stacks. Requires a",
+        "                                  single worker. Supported types: cpu, alloc.",
+        "                                  Example: cpu:run.prof",
+        "",
+        "  --event-stream TEXT             Write all runner events as newline-delimited",
+        "                                  JSON to the given file, named pipe or",
+        "                                  unix:<path> socket.",
+        "",
+        "  --value-pool-probability FLOAT RANGE",
+        "                                  Probability of replacing generated parameters",
+        "                                  with values of the same name from previous",
+        "                                  successful responses.",
+        "",
+        "  --adaptive-budget               Distribute examples among endpoints by their",
+        "                                  complexity and stop testing endpoints that",
+        "                                  keep producing the same responses.",
+        "",
+        "  --adaptive-budget-total INTEGER RANGE",
+        "                                  Total number of examples for all endpoints",
+        "                                  with --adaptive-budget. Defaults to",
+        "                                  --hypothesis-max-examples multiplied by the",
+        "                                  number of endpoints.",
+        "",
+        "  --max-duration FLOAT RANGE      Maximum duration of the whole test run in",
+        "                                  seconds. Endpoints that are not tested yet are",
+        "                                  skipped after it.",
+        "",
+        "  --max-requests INTEGER RANGE    Maximum number of requests for the whole test",
+        "                                  run.",
+        "",
+        "  --rate-limit TEXT               Maximum rate of requests shared by all",
+        "                                  workers, in N/s, N/m or N/h format. Example:",
+        "                                  10/s",
+        "",
+        "  --shard TEXT                    Test only the i-th of N parts of the",
+        "                                  endpoints, in i/N format. Example: 2/4",
+        "",
+        "  --shard-timings FILE            Results file of a previous run, used to",
+        "                                  balance shards by the endpoints' durations.",
+        "                                  All shards should use the same files.",
+        "",
+        "  --results-file FILE             Write results of the run to a JSON file, that",
+        "                                  could be combined with results of other shards",
+        "                                  via `schemathesis merge`.",
+        "",
+        "  --report TEXT                   Write a report of the run in the given format",
+        "                                  to a file, in FORMAT:PATH format. Supported",
+        "                                  formats: junit, json. Example:",
+        "                                  junit:report.xml",
+        "",
+        "  --timing-history FILE           JSON file to keep durations of endpoints",
+        "                                  between runs. With multiple workers the",
+        "                                  slowest endpoints are started first.",
+        "",
         "  --hypothesis-deadline INTEGER RANGE",
         "                                  Duration in milliseconds that each individual",
         "                                  example with a test is not allowed to exceed.",
         "",
+        "  --hypothesis-database TEXT      Directory or SQLite file (*.db, *.sqlite,",
+        "                                  *.sqlite3) to store found examples in. Could",
+        "                                  be shared by multiple runs & processes.",
+        "",
         "  --hypothesis-derandomize        Use Hypothesis's deterministic mode.",
         "  --hypothesis-max-examples INTEGER RANGE",
         "                                  Maximum number of generated examples per each",
@@ -271,6 +363,16 @@ def test_execute_arguments(cli, mocker, simple_schema, args, expected):
         "headers": {},
         "request_timeout": None,
         "seed": None,
+        "value_pool_probability": None,
+        "adaptive_budget": False,
+        "adaptive_budget_total": None,
+        "adaptive_budget_stale_limit": 10,
+        "max_duration": None,
+        "max_requests": None,
+        "rate_limit": None,
+        "example_database": None,
+        "shard": None,
+        "timing_history": None,
         **expected,
     }
 
@@ -1040,3 +1142,102 @@ def test_multipart_upload(testdir, base_url, cli):
     assert result.exit_code == ExitCode.OK
     assert "= ERRORS =" not in result.stdout
     # NOTE, that the actual endpoint is not checked in this test
+
+
+@pytest.mark.parametrize("workers", (1, 2))
+def test_event_stream(cli, cli_args, workers, tmpdir):
+    path = tmpdir.join("events.jsonl")
+    # When `--event-stream` is passed
+    cli.run(*cli_args, f"--workers={workers}", f"--event-stream={path}")
+    # Then all events are written as JSON lines
+    lines = [json.loads(line) for line in path.readlines()]
+    names = [line["event"] for line in lines]
+    assert names[0] == "Initialized"
+    assert names[-1] == "Finished"
+    assert names.count("BeforeExecution") == names.count("AfterExecution") == 2
+    # And all of them have a schema version
+    assert {line["version"] for line in lines} == {1}
+
+
+@pytest.mark.endpoints("success", "failure", "path_variable")
+def test_shards_merge(cli, schema_url, tmpdir):
+    # When endpoints are split into shards
+    paths = [str(tmpdir.join(f"shard-{idx}.json")) for idx in (1, 2)]
+    for idx, path in enumerate(paths, 1):
+        cli.run(schema_url, f"--shard={idx}/2", f"--results-file={path}", "--hypothesis-max-examples=1")
+    shards = [json.load(open(path)) for path in paths]
+    # Then every endpoint is tested exactly once
+    tested = sorted(item["path"] for shard in shards for item in shard["results"])
+    assert tested == ["/api/failure", "/api/path_variable/{key}", "/api/success"]
+    assert [shard["shard"] for shard in shards] == ["1/2", "2/2"]
+    # And the results could be combined into a single summary
+    merged = str(tmpdir.join("merged.json"))
+    result = cli.main("merge", *paths, f"--output={merged}")
+    assert "Merged results of 3 endpoints from 2 files" in result.stdout
+    assert len(json.load(open(merged))["results"]) == 3
+    # And they could be used to balance shards in the next runs
+    result = cli.run(schema_url, "--shard=1/2", f"--shard-timings={merged}", "--hypothesis-max-examples=1")
+    assert "collected endpoints: " in result.stdout
+
+
+@pytest.mark.endpoints("success", "failure")
+def test_reports(cli, schema_url, tmpdir):
+    # When reports are requested
+    junit_path = tmpdir.join("report.xml")
+    json_path = tmpdir.join("report.json")
+    result = cli.run(
+        schema_url, f"--report=junit:{junit_path}", f"--report=json:{json_path}", "--hypothesis-max-examples=1"
+    )
+    assert result.exit_code == ExitCode.TESTS_FAILED, result.stdout
+    # Then every tested endpoint is in both of them
+    suite = ElementTree.parse(str(junit_path)).getroot().find("testsuite")
+    assert suite.attrib["tests"] == "2"
+    assert suite.attrib["failures"] == "1"
+    assert sorted(case.attrib["name"] for case in suite.iter("testcase")) == ["GET /api/failure", "GET /api/success"]
+    report = json.loads(json_path.read())
+    assert sorted(item["path"] for item in report["results"]) == ["/api/failure", "/api/success"]
+    assert report["summary"]["failed_count"] == 1
+    # And failures are still displayed in the summary
+    assert " FAILURES " in result.stdout
+
+
+@pytest.mark.endpoints("success", "slow")
+def test_profile(cli, schema_url, tmpdir):
+    cpu_path = tmpdir.join("run.prof")
+    alloc_path = tmpdir.join("alloc.txt")
+    # When CPU & allocation profiles are requested
+    result = cli.run(
+        schema_url, f"--profile=cpu:{cpu_path}", f"--profile=alloc:{alloc_path}", "--hypothesis-max-examples=1"
+    )
+    assert result.exit_code == ExitCode.OK, result.stdout
+    # Then they are attributed to the tested endpoints
+    stats = pstats.Stats(str(cpu_path))
+    # Built-in functions have the same file name, but their names are in angle brackets
+    labels = {name for (filename, _, name) in stats.stats if filename == "~" and not name.startswith("<")}
+    assert labels == {"GET /api/success", "GET /api/slow", "schemathesis"}
+    stacks = {line.split(";", 1)[0] for line in alloc_path.readlines()}
+    assert {"GET /api/success", "GET /api/slow"} <= stacks
+
+
+@pytest.mark.endpoints("success")
+def test_profile_phases(cli, schema_url):
+    # When `--profile-phases` is passed
+    result = cli.run(schema_url, "--profile-phases", "--hypothesis-max-examples=5")
+    assert result.exit_code == ExitCode.OK, result.stdout
+    # Then the time spent in each phase is displayed
+    assert " PHASES " in result.stdout
+    phases = {line.split()[0] for line in result.stdout.split(" PHASES ")[1].split("\n")[3:] if line.strip()}
+    assert {"strategy", "generation", "network", "check:not_a_server_error", "serialization"} <= phases
+
+
+def test_synthesize(cli, testdir, monkeypatch):
+    schema_path = str(testdir.tmpdir.join("schema.json"))
+    module_path = str(testdir.tmpdir.join("synthetic_app.py"))
+    result = cli.main("synthesize", schema_path, "--paths=2", "--spec-version=2.0", f"--app-module={module_path}")
+    assert result.exit_code == ExitCode.OK, result.stdout
+    assert result.stdout.split("\n")[0] == f"Schema with 6 endpoints is written to {schema_path}"
+    # The generated application implements the schema
+    monkeypatch.syspath_prepend(str(testdir.tmpdir))
+    result = cli.run("/schema.json", "--app=synthetic_app:app", "--hypothesis-max-examples=1")
+    assert result.exit_code == ExitCode.OK, result.stdout
+    assert "6 passed in" in result.stdout
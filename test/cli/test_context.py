@@ -0,0 +1,35 @@
+from schemathesis.cli.context import DisplayedResults
+from schemathesis.runner.serialization import SerializedTestResult
+
+
+def make_result(path, has_failures):
+    return SerializedTestResult(
+        method="GET",
+        path=path,
+        has_failures=has_failures,
+        has_errors=False,
+        has_logs=False,
+        is_errored=False,
+        seed=None,
+        checks=[],
+        logs=[],
+        errors=[],
+        status_codes={500: 1},
+    )
+
+
+def test_displayed_results():
+    results = DisplayedResults()
+    assert list(results) == []
+    results.append(make_result("/success", False))
+    results.append(make_result("/failure-1", True))
+    # All results are counted
+    assert len(results) == 2
+    # But only the ones with something to display are kept
+    assert list(results) == [make_result("/failure-1", True)]
+    # Results could be appended after a partial iteration
+    next(iter(results))
+    results.append(make_result("/failure-2", True))
+    assert [result.path for result in results] == ["/failure-1", "/failure-2"]
+    results.close()
+    assert list(results) == []
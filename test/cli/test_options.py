@@ -1,11 +1,18 @@
 from enum import Enum
 
 import click
+import hypothesis
 import pytest
 from hypothesis import example, given
 from hypothesis import strategies as st
 
-from schemathesis.cli import CSVOption
+from schemathesis.cli import (
+    HYPOTHESIS_HEALTH_CHECKS,
+    HYPOTHESIS_PHASES,
+    HYPOTHESIS_VERBOSITY_LEVELS,
+    CSVOption,
+    HypothesisCSVOption,
+)
 
 
 class Options(Enum):
@@ -19,3 +26,29 @@ def test_csv_option(value):
     option = CSVOption(Options)
     with pytest.raises(click.BadParameter):
         option.convert(value, None, None)
+
+
+@pytest.mark.parametrize(
+    "enum, names",
+    (
+        (hypothesis.Phase, HYPOTHESIS_PHASES),
+        (hypothesis.HealthCheck, HYPOTHESIS_HEALTH_CHECKS),
+        (hypothesis.Verbosity, HYPOTHESIS_VERBOSITY_LEVELS),
+    ),
+)
+def test_hypothesis_names(enum, names):
+    # Names of Hypothesis enums' members are listed without importing Hypothesis and should match its enums
+    assert set(names) == set(enum.__members__)
+
+
+def test_hypothesis_csv_option():
+    option = HypothesisCSVOption("Phase", HYPOTHESIS_PHASES)
+    assert option.convert("explicit,shrink", None, None) == [hypothesis.Phase.explicit, hypothesis.Phase.shrink]
+
+
+def test_hypothesis_csv_option_unsupported():
+    # When a member is not available in the installed Hypothesis version
+    option = HypothesisCSVOption("Phase", (*HYPOTHESIS_PHASES, "unknown"))
+    # Then it is a usage error
+    with pytest.raises(click.BadParameter, match="unknown is not supported by the installed Hypothesis version"):
+        option.convert("explicit,unknown", None, None)
@@ -0,0 +1,92 @@
+import hypothesis
+import pytest
+import requests
+
+from schemathesis.models import Endpoint
+from schemathesis.runner.impl.budget import EndpointBudget, ExampleBudget, get_complexity, get_outcome, get_shape
+
+
+def make_endpoint(path, **definition):
+    return Endpoint(path, "GET", definition, schema=None)
+
+
+SIMPLE = make_endpoint("/simple")
+COMPLEX = make_endpoint(
+    "/complex",
+    parameters=[
+        {"in": "query", "name": "id", "type": "integer"},
+        {
+            "in": "body",
+            "name": "body",
+            "schema": {"type": "object", "properties": {"a": {"type": "string"}, "b": {"$ref": "#/definitions/B"}}},
+        },
+    ],
+    responses={"200": {"schema": {"type": "object"}}},
+)
+
+
+def test_get_complexity():
+    assert get_complexity(SIMPLE) == 1
+    # Responses are not counted
+    assert get_complexity(COMPLEX) == 5
+
+
+@pytest.mark.parametrize(
+    "data, expected",
+    (({"b": 1, "a": 2}, ("a", "b")), ([{"a": 1}], ("list", ("a",))), ([], ("list", None)), (None, "NoneType")),
+)
+def test_get_shape(data, expected):
+    assert get_shape(data) == expected
+
+
+def test_get_outcome():
+    response = requests.Response()
+    response.status_code = 200
+    response.headers["Content-Type"] = "application/json"
+    response._content = b"not json"
+    # The already decoded payload is used, the response's content is not decoded again
+    assert get_outcome(response, {"b": 1, "a": 2}) == (200, "application/json", ("a", "b"))
+
+
+def test_allocate_by_complexity():
+    budget = ExampleBudget.from_endpoints([SIMPLE, COMPLEX], max_examples=70)
+    assert budget.total == 140
+    assert budget.allocate(SIMPLE).max_examples == 23
+    assert budget.allocate(COMPLEX).max_examples == 117
+    assert budget.remaining == 0
+    # Unknown endpoints are tested at least once
+    assert budget.allocate(make_endpoint("/unknown")).max_examples == 1
+
+
+def test_release_unused_examples():
+    budget = ExampleBudget.from_endpoints([SIMPLE, COMPLEX], max_examples=70)
+    simple = budget.allocate(SIMPLE)
+    for _ in range(5):
+        simple.record((200, None, None))
+    budget.release(simple)
+    # Examples not used by the first endpoint are given to the next one
+    assert budget.allocate(COMPLEX).max_examples == 135
+
+
+def test_stale_endpoint():
+    budget = EndpointBudget(max_examples=100, stale_limit=2)
+    budget.record((200, "application/json", ("id",)))
+    budget.record((404, "application/json", ("detail",)))
+    assert not budget.is_exhausted
+    budget.record((404, "application/json", ("detail",)))
+    assert budget.is_exhausted
+    assert budget.used == 3
+
+
+def test_failed_endpoint_is_never_exhausted():
+    budget = EndpointBudget(max_examples=100, stale_limit=1)
+    budget.record((500, None, None))
+    budget.mark_failed()
+    # Hypothesis should be able to replay the failing examples
+    assert not budget.is_exhausted
+
+
+def test_apply():
+    settings = EndpointBudget(max_examples=7).apply(hypothesis.settings(deadline=None))
+    assert settings.max_examples == 7
+    assert settings.deadline is None
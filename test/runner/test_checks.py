@@ -4,14 +4,14 @@ import pytest
 import requests
 
 import schemathesis
-from schemathesis import models
+from schemathesis import exceptions, models
 from schemathesis.checks import (
     content_type_conformance,
     not_a_server_error,
     response_schema_conformance,
     status_code_conformance,
 )
-from schemathesis.exceptions import InvalidSchema
+from schemathesis.exceptions import InvalidSchema, get_grouped_exception, get_status_code_error
 from schemathesis.schemas import BaseSchema
 
 
@@ -292,3 +292,49 @@ def test_response_schema_conformance_invalid_openapi(openapi_30, content, defini
     case = make_case(openapi_30, definition)
     with pytest.raises(AssertionError):
         response_schema_conformance(response, case)
+
+
+def test_response_schema_conformance_same_error_class(swagger_20):
+    # When responses violate the schema in the same way, but contain different data
+    definition = {"responses": {"200": {"description": "text", "schema": SUCCESS_SCHEMA}}}
+    classes = []
+    for content in (b'{"random": "text"}', b'{"random": "' + b"x" * 1000 + b'"}'):
+        with pytest.raises(AssertionError) as exc_info:
+            response_schema_conformance(make_response(content), make_case(swagger_20, definition))
+        classes.append(exc_info.type)
+    # Then they are identified as the same failure
+    assert classes[0] is classes[1]
+
+
+def test_grouped_exception():
+    first = get_status_code_error(500)("First")
+    second = get_status_code_error(500)("Second")
+    # Grouped exceptions are identified by failure types, not by messages
+    assert get_grouped_exception(first) is get_grouped_exception(second)
+    assert get_grouped_exception(first) is not get_grouped_exception(first, get_status_code_error(502)("Other"))
+    # Plain assertions from custom checks are distinguished by messages
+    assert get_grouped_exception(AssertionError("A")) is not get_grouped_exception(AssertionError("B"))
+
+
+def test_exceptions_cache_is_bounded(mocker):
+    mocker.patch("schemathesis.exceptions.CACHE_MAX_SIZE", 2)
+    mocker.patch("schemathesis.exceptions.CACHE", exceptions.CACHE.__class__())
+    for code in (500, 501, 502):
+        get_status_code_error(code)
+    assert list(exceptions.CACHE) == ["StatusCodeError501", "StatusCodeError502"]
+
+
+def test_exceptions_used_by_running_test_are_not_evicted(mocker):
+    mocker.patch("schemathesis.exceptions.CACHE_MAX_SIZE", 2)
+    mocker.patch("schemathesis.exceptions.CACHE", exceptions.CACHE.__class__())
+    with exceptions.exception_scope():
+        # When a test produces more distinct failures than the cache could hold
+        first = get_status_code_error(500)
+        for code in (501, 502, 503):
+            get_status_code_error(code)
+        # Then the failure, that it already raised, still has the same class
+        assert get_status_code_error(500) is first
+        assert "StatusCodeError500" in exceptions.PINNED
+    # And classes are evicted as usual after the test is finished
+    assert exceptions.PINNED == {}
+    assert len(exceptions.CACHE) == 2
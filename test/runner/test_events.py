@@ -1,4 +1,8 @@
+import json
+
+from schemathesis.models import Status
 from schemathesis.runner import events
+from schemathesis.runner.stream import serialize_event
 
 
 def test_unknown_exception():
@@ -8,3 +12,24 @@ def test_unknown_exception():
         event = events.InternalError.from_exc(exc)
         assert event.message == "An internal error happened during a test run"
         assert event.exception.strip() == "ZeroDivisionError: division by zero"
+
+
+def test_serialize_finished():
+    # Given a `Finished` event with statistic keyed by enums
+    event = events.Finished(
+        passed_count=1,
+        failed_count=0,
+        errored_count=0,
+        has_failures=False,
+        has_errors=False,
+        has_logs=False,
+        is_empty=False,
+        total={"not_a_server_error": {Status.success: 1, "total": 1}},
+        running_time=1.0,
+    )
+    # When it is serialized for the event stream
+    serialized = serialize_event(event)
+    # Then it contains only JSON-compatible values with a stable representation
+    assert serialized["event"] == "Finished"
+    assert serialized["data"]["total"] == {"not_a_server_error": {"success": 1, "total": 1}}
+    assert json.loads(json.dumps(serialized)) == serialized
@@ -0,0 +1,66 @@
+import json
+
+import pytest
+
+from schemathesis.models import Endpoint, Status
+from schemathesis.runner import events
+from schemathesis.runner.impl.history import EndpointTiming, TimingHistory
+from schemathesis.runner.serialization import SerializedTestResult
+
+
+def make_event(path, elapsed_time, requests_count=4, requests_time=1.0):
+    result = SerializedTestResult(
+        method="GET",
+        path=path,
+        has_failures=False,
+        has_errors=False,
+        has_logs=False,
+        is_errored=False,
+        seed=None,
+        checks=[],
+        logs=[],
+        errors=[],
+        requests_count=requests_count,
+        requests_time=requests_time,
+    )
+    return events.AfterExecution(status=Status.success, result=result, elapsed_time=elapsed_time)
+
+
+def test_from_event():
+    timing = EndpointTiming.from_event(make_event("/users", 3.0))
+    assert timing == EndpointTiming(duration=3.0, examples=4, mean_latency=0.25, generation_time=2.0)
+
+
+def test_record_smoothing():
+    history = TimingHistory()
+    history.record(make_event("/users", 2.0))
+    history.record(make_event("/users", 4.0))
+    timing = history.timings["get:/users"]
+    assert timing.duration == 3.0
+    assert timing.runs == 2
+
+
+def test_save_and_load(tmp_path):
+    path = str(tmp_path / "history.json")
+    history = TimingHistory(path)
+    history.record(make_event("/users", 2.0))
+    history.save()
+    assert TimingHistory.load(path) == history
+
+
+@pytest.mark.parametrize("content", (None, "{", json.dumps({"version": 0, "endpoints": {}})))
+def test_load_empty(tmp_path, content):
+    path = tmp_path / "history.json"
+    if content is not None:
+        path.write_text(content)
+    # Missing, broken or outdated files are not an error
+    assert TimingHistory.load(str(path)).timings == {}
+
+
+def test_longest_first():
+    endpoints = [Endpoint(f"/{name}", "GET", {}, schema=None) for name in ("fast", "unknown", "slow", "new")]
+    history = TimingHistory()
+    history.record(make_event("/fast", 1.0))
+    history.record(make_event("/slow", 5.0))
+    # Endpoints without history are expected to take the average time
+    assert [endpoint.path for endpoint in history.longest_first(endpoints)] == ["/slow", "/unknown", "/new", "/fast"]
@@ -0,0 +1,67 @@
+import pytest
+
+from schemathesis.runner.impl.limits import RateLimiter, RunLimits, parse_rate_limit
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+    def sleep(self, delay):
+        self.now += delay
+
+
+@pytest.mark.parametrize("value, expected", (("10/s", 10), ("60/m", 1), ("36/h", 0.01), ("2.5", 2.5)))
+def test_parse_rate_limit(value, expected):
+    assert parse_rate_limit(value) == expected
+
+
+def test_rate_limiter():
+    clock = FakeClock()
+    limiter = RateLimiter(2, clock=clock, sleep=clock.sleep)
+    # The bucket is full initially and allows a burst of requests
+    limiter.acquire()
+    limiter.acquire()
+    assert clock.now == 0
+    # Then requests are sent with the configured rate
+    limiter.acquire()
+    assert clock.now == 0.5
+    limiter.acquire()
+    assert clock.now == 1.0
+
+
+def test_max_requests():
+    limits = RunLimits(max_requests=2)
+    assert limits.acquire()
+    assert limits.remaining_requests == 1
+    assert limits.acquire()
+    assert limits.is_exhausted
+    assert not limits.acquire()
+    assert limits.requests_count == 2
+
+
+def test_max_duration():
+    clock = FakeClock()
+    limits = RunLimits(max_duration=10, clock=clock)
+    clock.now = 4
+    assert limits.remaining_time == 6
+    assert limits.acquire()
+    clock.now = 11
+    assert limits.remaining_time == 0
+    assert not limits.acquire()
+    # Duration is measured from the run's start
+    limits.start()
+    assert limits.acquire()
+
+
+def test_deadline_passed_while_waiting():
+    clock = FakeClock()
+    limits = RunLimits(max_duration=1, rate_limiter=RateLimiter(0.5, clock=clock, sleep=clock.sleep), clock=clock)
+    assert limits.acquire()
+    # The next token is available only in 2 seconds
+    assert not limits.acquire()
+    # And the request, that was not sent, is not counted
+    assert limits.requests_count == 1
@@ -0,0 +1,91 @@
+import pstats
+
+import pytest
+
+from schemathesis.models import Status
+from schemathesis.runner import events
+from schemathesis.runner.profiling import RUN_LABEL, AllocationProfiler, CPUProfiler, create_profiler
+from schemathesis.runner.serialization import SerializedTestResult
+
+
+def make_before_execution(path):
+    return events.BeforeExecution(method="GET", path=path, endpoint=None)
+
+
+def make_after_execution(path):
+    result = SerializedTestResult(
+        method="GET",
+        path=path,
+        has_failures=False,
+        has_errors=False,
+        has_logs=False,
+        is_errored=False,
+        seed=None,
+        checks=[],
+        logs=[],
+        errors=[],
+    )
+    return events.AfterExecution(status=Status.success, result=result, elapsed_time=0.1)
+
+
+def allocate_users():
+    return [{"id": idx} for idx in range(1000)]
+
+
+def allocate_items():
+    return [{"id": idx} for idx in range(1000)]
+
+
+def run(profiler):
+    profiler.start()
+    kept = []
+    for path, function in (("/users", allocate_users), ("/items", allocate_items)):
+        profiler.write(make_before_execution(path))
+        kept.append(function())
+        profiler.write(make_after_execution(path))
+    profiler.stop()
+    return kept
+
+
+def get_callers(stats, name):
+    for (_, _, function), (*_, callers) in stats.stats.items():
+        if function == name:
+            return {caller[2] for caller in callers}
+    raise AssertionError(f"{name} is not in the profile")
+
+
+def test_cpu(tmp_path):
+    path = tmp_path / "run.prof"
+    run(CPUProfiler(str(path)))
+    stats = pstats.Stats(str(path))
+    # Functions are called by endpoints, where they were called
+    assert get_callers(stats, "allocate_users") == {"GET /users"}
+    assert get_callers(stats, "allocate_items") == {"GET /items"}
+    assert get_callers(stats, "make_before_execution") == {RUN_LABEL}
+
+
+def test_alloc(tmp_path):
+    path = tmp_path / "alloc.txt"
+    run(AllocationProfiler(str(path)))
+    lines = path.read_text().splitlines()
+    stacks = {}
+    for line in lines:
+        stack, size = line.rsplit(" ", 1)
+        stacks[stack] = int(size)
+    # Allocations are attributed to endpoints and ordered from the biggest one
+    assert list(stacks.values()) == sorted(stacks.values(), reverse=True)
+    frame = f"{__file__}:{allocate_users.__code__.co_firstlineno + 1}"
+    users = [stack for stack in stacks if stack.endswith(frame)]
+    assert users
+    assert all(stack.startswith("GET /users;") for stack in users)
+    assert sum(stacks[stack] for stack in users) > 1000 * 50
+
+
+@pytest.mark.parametrize("profile_type, expected", (("cpu", CPUProfiler), ("alloc", AllocationProfiler)))
+def test_stop_without_start(tmp_path, profile_type, expected):
+    path = tmp_path / "profile"
+    profiler = create_profiler(profile_type, str(path))
+    assert isinstance(profiler, expected)
+    # E.g. when the run failed before it started
+    profiler.stop()
+    assert not path.exists()
@@ -0,0 +1,124 @@
+import json
+from xml.etree import ElementTree
+
+import pytest
+
+from schemathesis.models import Status
+from schemathesis.runner import events
+from schemathesis.runner.reports import JSONReportWriter, JUnitReportWriter, create_report_writer
+from schemathesis.runner.results import load_event
+from schemathesis.runner.serialization import SerializedCase, SerializedCheck, SerializedError, SerializedTestResult
+
+
+def make_event(path, status, message="Boom"):
+    example = SerializedCase(requests_code="requests.get('http://127.0.0.1/')", query={"id": 1})
+    check = SerializedCheck(name="not_a_server_error", value=status, example=example, message=message)
+    errors = []
+    if status == Status.error:
+        error = SerializedError(exception="ValueError: <Oops>\n", exception_with_traceback="Traceback", example=None)
+        errors.append(error)
+    result = SerializedTestResult(
+        method="GET",
+        path=path,
+        has_failures=status == Status.failure,
+        has_errors=status == Status.error,
+        has_logs=False,
+        is_errored=status == Status.error,
+        seed=1,
+        checks=[check],
+        logs=[],
+        errors=errors,
+    )
+    return events.AfterExecution(status=status, result=result, elapsed_time=1.5)
+
+
+def make_finished():
+    return events.Finished(
+        passed_count=1,
+        failed_count=1,
+        errored_count=1,
+        has_failures=True,
+        has_errors=True,
+        has_logs=False,
+        is_empty=False,
+        total={},
+        running_time=2.0,
+    )
+
+
+EVENTS = [
+    make_event("/success", Status.success),
+    make_event("/failure", Status.failure, "Invalid \x00 response & <data>"),
+    make_event("/error", Status.error),
+]
+
+
+def test_json(tmp_path):
+    path = str(tmp_path / "report.json")
+    writer = create_report_writer("json", path)
+    for event in EVENTS:
+        writer.write(event)
+    writer.write(make_finished())
+    with open(path) as fd:
+        report = json.load(fd)
+    assert report["version"] == 1
+    # Results are in the same format as in results files
+    assert [load_event(item) for item in report["results"]] == EVENTS
+    assert report["summary"]["failed_count"] == 1
+
+
+def test_junit(tmp_path):
+    path = str(tmp_path / "report.xml")
+    writer = create_report_writer("junit", path)
+    for event in EVENTS:
+        writer.write(event)
+    writer.write(make_finished())
+    suite = ElementTree.parse(path).getroot().find("testsuite")
+    assert suite.attrib == {
+        "name": "schemathesis",
+        "tests": "3",
+        "failures": "1",
+        "errors": "1",
+        "skipped": "0",
+        "time": "2.000",
+    }
+    success, failure, error = suite.iter("testcase")
+    assert success.attrib["name"] == "GET /success"
+    assert list(success) == []
+    # Characters, that are not allowed in XML, are removed
+    assert failure.find("failure").attrib == {"type": "not_a_server_error", "message": "Invalid  response & <data>"}
+    assert "requests.get('http://127.0.0.1/')" in failure.find("failure").text
+    assert error.find("error").attrib == {"message": "ValueError: <Oops>"}
+    assert error.find("error").text == "Traceback"
+
+
+def test_junit_skipped(tmp_path):
+    path = str(tmp_path / "report.xml")
+    writer = JUnitReportWriter(path)
+    event = make_event("/skipped", Status.success)
+    event.result.checks = []
+    event.result.is_skipped = True
+    writer.write(event)
+    writer.write(make_finished())
+    # Endpoints, that were not tested due to the run's limits, are reported as skipped
+    suite = ElementTree.parse(path).getroot().find("testsuite")
+    assert suite.attrib["tests"] == "1"
+    assert suite.attrib["skipped"] == "1"
+    assert suite.find("testcase").find("skipped") is not None
+
+
+@pytest.mark.parametrize("cls", (JSONReportWriter, JUnitReportWriter))
+def test_interrupted(tmp_path, cls):
+    path = str(tmp_path / "report")
+    writer = cls(path)
+    writer.write(EVENTS[0])
+    writer.write(events.Interrupted())
+    # Closing is safe after the report is completed
+    writer.close()
+    # Reports of interrupted runs are valid documents with results tested so far
+    with open(path) as fd:
+        content = fd.read()
+    if cls is JSONReportWriter:
+        assert len(json.loads(content)["results"]) == 1
+    else:
+        assert ElementTree.fromstring(content).find("testsuite").attrib["tests"] == "1"
@@ -13,10 +13,12 @@ from schemathesis import loaders
 from schemathesis.checks import (
     DEFAULT_CHECKS,
     content_type_conformance,
+    not_a_server_error,
     response_schema_conformance,
     status_code_conformance,
 )
 from schemathesis.constants import __version__
+from schemathesis.database import SQLiteExampleDatabase
 from schemathesis.models import Status
 from schemathesis.runner import events, get_base_url, get_requests_auth, prepare
 from schemathesis.runner.impl.core import get_wsgi_auth
@@ -521,3 +523,137 @@ def test_custom_loader(swagger_20, base_url):
     *others, finished = list(prepare({}, loader=lambda *args, **kwargs: swagger_20))
     assert not finished.has_errors
     assert not finished.has_failures
+
+
+@pytest.mark.endpoints("path_variable")
+def test_adaptive_budget(schema_url):
+    # When the adaptive budget is enabled
+    # And an endpoint keeps returning the same response
+    *_, after, finished = prepare(
+        schema_url,
+        checks=(not_a_server_error,),
+        hypothesis_max_examples=50,
+        hypothesis_derandomize=True,
+        adaptive_budget=True,
+        adaptive_budget_stale_limit=3,
+    )
+    assert not finished.has_errors
+    # Then the endpoint stops sending requests after the configured number of identical outcomes
+    assert len(after.result.checks) == 3
+    # And Hypothesis doesn't generate the remaining examples
+    assert after.phases["generation"]["count"] == 4
+    assert after.status == Status.success
+
+
+@pytest.mark.endpoints("path_variable", "success")
+def test_max_requests(schema_url):
+    # When the number of requests for the whole run is limited
+    _, _, after, *others, finished = prepare(
+        schema_url, checks=(not_a_server_error,), hypothesis_max_examples=50, max_requests=2
+    )
+    # Then no more requests are sent
+    assert len(after.result.checks) == 2
+    # And Hypothesis doesn't generate the remaining examples
+    assert after.phases["generation"]["count"] == 3
+    # And the remaining budget is reported
+    assert after.remaining_requests == 0
+    assert after.remaining_time is None
+    # And the remaining endpoints are reported as skipped
+    assert finished.total == {"not_a_server_error": {Status.success: 2, "total": 2}}
+    skipped = [event for event in others if isinstance(event, events.AfterExecution)]
+    assert len(skipped) == 1
+    assert skipped[0].result.is_skipped
+    assert finished.passed_count == 1
+    assert finished.skipped_count == 1
+
+
+@pytest.mark.endpoints("path_variable")
+def test_rate_limit_deadline(schema_url):
+    # When the rate of requests is limited, so waiting for the next request takes longer than the default deadline
+    *_, after, finished = prepare(
+        schema_url, checks=(not_a_server_error,), hypothesis_max_examples=2, hypothesis_derandomize=True, rate_limit=1
+    )
+    # Then the waiting time doesn't fail the test
+    assert after.status == Status.success
+    assert not finished.has_errors
+    assert after.result.requests_count == 2
+
+
+@pytest.mark.endpoints("success", "failure")
+def test_latency(args):
+    _, kwargs = args
+    # When multiple examples are sent
+    _, *others, finished = prepare(**kwargs, hypothesis_max_examples=5)
+    after = [event for event in others if isinstance(event, events.AfterExecution)]
+    # Then response times & status codes of all responses are reported for each endpoint
+    for event in after:
+        assert event.result.latency["count"] == sum(event.result.status_codes.values())
+        assert {"p50", "p95", "p99", "buckets"} <= set(event.result.latency)
+    # And for the whole run
+    assert finished.latency["count"] == sum(event.result.latency["count"] for event in after)
+    assert finished.latency["count"] == sum(finished.status_codes.values()) > 0
+
+
+@pytest.mark.endpoints("success")
+def test_phases(schema_url):
+    def fails(response, case):
+        raise AssertionError("Failed")
+
+    # When a failure is found
+    _, _, after, finished = prepare(schema_url, checks=(fails,), hypothesis_max_examples=5)
+    # Then durations of test phases are reported for the endpoint and for the whole run
+    assert {"strategy", "generation", "network", "check:fails", "shrinking", "serialization"} <= set(after.phases)
+    assert set(finished.phases) == set(after.phases)
+    assert after.phases["strategy"]["count"] == 1
+    # And requests, sent while shrinking, are not accounted as the usual network time
+    assert after.phases["network"]["count"] == 1
+
+
+@pytest.mark.endpoints("success", "slow")
+def test_timing_history(schema_url, tmp_path):
+    path = str(tmp_path / "history.json")
+    # When timing history is enabled
+    *_, finished = prepare(schema_url, timing_history=path, hypothesis_max_examples=1, workers_num=2)
+    assert not finished.has_errors
+    # Then durations of all tested endpoints are stored
+    stored = json.load(open(path))["endpoints"]
+    assert set(stored) == {"get:/api/success", "get:/api/slow"}
+    # The slow endpoint sleeps for 100ms before responding
+    assert stored["get:/api/slow"]["duration"] >= 0.1
+    assert stored["get:/api/slow"]["duration"] > stored["get:/api/success"]["duration"]
+    assert stored["get:/api/slow"]["examples"] == 1
+
+
+@pytest.mark.endpoints("success")
+def test_hypothesis_database(schema_url, tmp_path):
+    path = str(tmp_path / "examples.db")
+
+    def fails(response, case):
+        raise AssertionError("Failed")
+
+    # When a failure is found with a configured database
+    *_, finished = prepare(schema_url, checks=(fails,), hypothesis_database=path)
+    assert finished.has_failures
+    # Then examples are stored under the endpoint's key
+    keys = {key for key, in SQLiteExampleDatabase(path)._connection.execute("SELECT key FROM examples")}
+    assert keys
+    assert all(key.startswith(b"GET /api/success:") for key in keys)
+
+
+@pytest.mark.endpoints("path_variable", "success")
+def test_execute_in_order_base_path(schema_url, app):
+    # When the schema has a non-root base path (`/api`)
+    # And dependencies between endpoints are defined with paths as they are in the schema
+    execute_in_order = {
+        "get:/success": {"store": ["success"]},
+        "get:/path_variable/{key}": {"required": {"path_parameters": {"key": "get:/success:success"}}},
+    }
+    *_, finished = prepare(schema_url, execute_in_order=execute_in_order, hypothesis_max_examples=3)
+    assert not finished.has_errors
+    # Then the producer is tested first
+    requests = get_incoming_requests(app)
+    assert requests[0].path == "/api/success"
+    # And its stored value is used by the dependent endpoint
+    dependent = [request for request in requests if request.path != "/api/success"]
+    assert dependent
+    assert all(request.path == "/api/path_variable/True" for request in dependent)
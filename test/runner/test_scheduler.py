@@ -0,0 +1,82 @@
+import threading
+
+from schemathesis.models import Endpoint
+from schemathesis.runner.impl.scheduler import DependencyQueue
+from schemathesis.store_result import ResponseStore
+
+EXECUTE_IN_ORDER = {
+    "post:/notes": {"store": ["id"]},
+    "get:/notes/{note_id}": {"required": {"path_parameters": {"note_id": "post:/notes:id"}}},
+}
+
+
+def make_queue(swagger_20, store):
+    endpoints = [
+        Endpoint("/users", "GET", {}, swagger_20),
+        Endpoint("/notes/{note_id}", "GET", {}, swagger_20),
+        Endpoint("/notes", "POST", {}, swagger_20),
+    ]
+    return DependencyQueue(endpoints, EXECUTE_IN_ORDER, store)
+
+
+def test_independent_endpoints_first(swagger_20):
+    queue = make_queue(swagger_20, ResponseStore())
+    # Endpoints without unsatisfied dependencies are given in the original order
+    assert queue.get().path == "/users"
+    assert queue.get().path == "/notes"
+
+
+def test_dependent_endpoint_waits_for_stored_values(swagger_20):
+    store = ResponseStore()
+    queue = make_queue(swagger_20, store)
+    queue.get()
+    queue.get()
+    taken = []
+    worker = threading.Thread(target=lambda: taken.append(queue.get()))
+    worker.start()
+    worker.join(0.05)
+    # When the producer is still running and didn't store anything
+    # Then the dependent endpoint is not started
+    assert not taken
+    # And it is started as soon as the value is stored
+    store.store_result("post:/notes", "id", 1)
+    worker.join(1)
+    assert taken[0].path == "/notes/{note_id}"
+    assert queue.empty()
+
+
+def test_dependent_endpoint_after_producer_finished(swagger_20):
+    queue = make_queue(swagger_20, ResponseStore())
+    assert queue.get().path == "/users"
+    queue.task_done()
+    assert queue.get().path == "/notes"
+    # When the producer finished without storing values
+    queue.task_done()
+    # Then the dependent endpoint is not blocked anymore
+    assert queue.get().path == "/notes/{note_id}"
+    queue.task_done()
+    assert queue.get() is None
+
+
+def test_stops_listening_when_drained(swagger_20):
+    store = ResponseStore()
+    queue = make_queue(swagger_20, store)
+    assert len(store._listeners) == 1
+    queue.get()
+    queue.get()
+    store.store_result("post:/notes", "id", 1)
+    # When the last endpoint is given to a worker
+    assert queue.get().path == "/notes/{note_id}"
+    # Then the queue doesn't listen to the store anymore
+    assert store._listeners == []
+
+
+def test_close(swagger_20):
+    store = ResponseStore()
+    queue = make_queue(swagger_20, store)
+    # When the run is finished before all endpoints are given to workers
+    queue.close()
+    # Then the queue doesn't listen to the store anymore
+    assert store._listeners == []
+    # And closing is idempotent
+    queue.close()
@@ -0,0 +1,39 @@
+from schemathesis.models import Case, Endpoint, Status, TestResult
+from schemathesis.runner.serialization import SerializedTestResult, get_unique_failures, prepare_for_json
+
+
+def test_serialize_only_displayed_examples(swagger_20):
+    endpoint = Endpoint("/success", "GET", definition={}, base_url="http://127.0.0.1:8080", schema=swagger_20)
+    first, second = Case(endpoint, query={"a": 1}), Case(endpoint, query={"a": 2})
+    result = TestResult(endpoint)
+    result.add_success("not_a_server_error", first)
+    result.add_failure("not_a_server_error", first, "Message")
+    result.add_failure("not_a_server_error", second, "Message")
+    result.add_failure("status_code_conformance", second, "Other")
+    # When a result is serialized
+    serialized = SerializedTestResult.from_test_result(result)
+    examples = [check.example for check in serialized.checks]
+    # Then examples are not serialized for passed checks
+    assert examples[0] is None
+    # And only the latest failure for the same check & message has an example
+    assert examples[1] is None
+    assert examples[2].requests_code == "requests.get('http://127.0.0.1:8080/success', params={'a': 2})"
+    # And the same case is serialized only once
+    assert examples[3] is examples[2]
+    assert [check.value for check in serialized.checks] == [
+        Status.success,
+        Status.failure,
+        Status.failure,
+        Status.failure,
+    ]
+
+    # And serialized checks have the same unique failures as the original ones
+    assert [check.message for check in get_unique_failures(serialized.checks)] == ["Other", "Message"]
+    assert [check.message for check in get_unique_failures(result.checks)] == ["Other", "Message"]
+
+
+def test_prepare_for_json():
+    assert prepare_for_json({Status.success: (Status.failure, 1), 200: [None]}) == {
+        "success": ["failure", 1],
+        "200": [None],
+    }
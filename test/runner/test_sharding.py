@@ -0,0 +1,96 @@
+import pytest
+
+from schemathesis.models import Endpoint, Status
+from schemathesis.runner import events
+from schemathesis.runner.impl.sharding import Shard, assign_by_cost, parse_shard
+from schemathesis.runner.results import MergedResults, ResultsWriter, load_timings
+from schemathesis.runner.serialization import SerializedCase, SerializedCheck, SerializedTestResult
+
+ENDPOINTS = [Endpoint(f"/items/{idx}", "GET", {}, schema=None) for idx in range(20)]
+
+
+def select_all(shards):
+    return [[endpoint.path for endpoint in shard.select(ENDPOINTS)] for shard in shards]
+
+
+@pytest.mark.parametrize("value, expected", (("1/1", (1, 1)), ("2/4", (2, 4))))
+def test_parse_shard(value, expected):
+    assert parse_shard(value) == expected
+
+
+@pytest.mark.parametrize("value", ("1", "0/2", "3/2", "1/0", "a/b"))
+def test_parse_shard_invalid(value):
+    with pytest.raises(ValueError):
+        parse_shard(value)
+
+
+@pytest.mark.parametrize("timings", ({}, {f"get:/items/{idx}": float(idx) for idx in range(10)}))
+def test_shards_are_disjoint(timings):
+    shards = select_all([Shard(index, 3, timings=timings) for index in (1, 2, 3)])
+    # Every endpoint is tested exactly once
+    assert sorted(path for shard in shards for path in shard) == sorted(endpoint.path for endpoint in ENDPOINTS)
+    # And the assignment doesn't change between runs
+    assert shards == select_all([Shard(index, 3, timings=timings) for index in (1, 2, 3)])
+
+
+def test_assign_by_cost():
+    costs = {"a": 5, "b": 4, "c": 3, "d": 3, "e": 1}
+    assignment = assign_by_cost(costs, 2)
+    # Longest-first assignment gives equal loads
+    assert [sum(cost for key, cost in costs.items() if assignment[key] == idx) for idx in (0, 1)] == [8, 8]
+
+
+def test_dependent_endpoints_are_not_split():
+    execute_in_order = {f"get:/items/{idx}": {} for idx in range(5)}
+    shards = [Shard(index, 4).select(ENDPOINTS, execute_in_order) for index in (1, 2, 3, 4)]
+    dependent = [idx for idx, shard in enumerate(shards) if ENDPOINTS[0] in shard]
+    assert len(dependent) == 1
+    assert ENDPOINTS[:5] == [endpoint for endpoint in shards[dependent[0]] if endpoint in ENDPOINTS[:5]]
+
+
+def test_dependent_endpoints_keys_case():
+    # Keys of `execute_in_order` are not necessarily lowercased
+    execute_in_order = {f"GET:/Items/{idx}": {} for idx in range(5)}
+    shards = [Shard(index, 4).select(ENDPOINTS, execute_in_order) for index in (1, 2, 3, 4)]
+    dependent = [idx for idx, shard in enumerate(shards) if any(endpoint in shard for endpoint in ENDPOINTS[:5])]
+    assert len(dependent) == 1
+    assert ENDPOINTS[:5] == [endpoint for endpoint in shards[dependent[0]] if endpoint in ENDPOINTS[:5]]
+
+
+def make_event(path, status):
+    example = SerializedCase(requests_code="requests.get('http://127.0.0.1/')", query={"id": 1})
+    check = SerializedCheck(name="not_a_server_error", value=status, example=example, message="Boom")
+    result = SerializedTestResult(
+        method="GET",
+        path=path,
+        has_failures=status == Status.failure,
+        has_errors=False,
+        has_logs=False,
+        is_errored=False,
+        seed=1,
+        checks=[check],
+        logs=[],
+        errors=[],
+    )
+    return events.AfterExecution(status=status, result=result, hypothesis_output=["Output"], elapsed_time=1.5)
+
+
+def test_merge_results(tmp_path):
+    paths = []
+    for idx, status in enumerate((Status.success, Status.failure)):
+        path = str(tmp_path / f"{idx}.json")
+        writer = ResultsWriter(path, shard=f"{idx + 1}/2")
+        writer.write(make_event(f"/items/{idx}", status))
+        writer.save(running_time=float(idx + 1))
+        paths.append(path)
+    merged = MergedResults.from_files(paths)
+    # Results are restored as they were
+    assert merged.items[1] == make_event("/items/1", Status.failure)
+    assert merged.hypothesis_output == ["Output", "Output"]
+    finished = merged.to_finished()
+    assert finished.passed_count == finished.failed_count == 1
+    assert finished.has_failures
+    assert finished.total == {"not_a_server_error": {Status.success: 1, Status.failure: 1, "total": 2}}
+    # Shards run in parallel
+    assert finished.running_time == 2.0
+    assert load_timings(paths) == {"get:/items/0": 1.5, "get:/items/1": 1.5}
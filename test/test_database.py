@@ -0,0 +1,68 @@
+import threading
+
+import pytest
+from hypothesis.database import DirectoryBasedExampleDatabase, InMemoryExampleDatabase
+
+from schemathesis.database import EndpointDatabase, SQLiteExampleDatabase, get_schema_hash, open_database
+from schemathesis.models import Endpoint
+
+
+def make_endpoint(path="/users", method="GET", **definition):
+    return Endpoint(path, method, definition, schema=None)
+
+
+@pytest.fixture
+def sqlite_db(tmp_path):
+    return SQLiteExampleDatabase(str(tmp_path / "examples.db"))
+
+
+def test_sqlite_database(sqlite_db):
+    sqlite_db.save(b"key", b"a")
+    sqlite_db.save(b"key", b"a")
+    sqlite_db.save(b"key", b"b")
+    assert sorted(sqlite_db.fetch(b"key")) == [b"a", b"b"]
+    sqlite_db.move(b"key", b"other", b"a")
+    assert list(sqlite_db.fetch(b"key")) == [b"b"]
+    assert list(sqlite_db.fetch(b"other")) == [b"a"]
+    sqlite_db.delete(b"key", b"b")
+    assert list(sqlite_db.fetch(b"key")) == []
+
+
+def test_sqlite_database_shared(sqlite_db):
+    # When multiple workers write to the same file
+    def save(idx):
+        database = SQLiteExampleDatabase(sqlite_db.path)
+        for value in range(10):
+            database.save(b"key", f"{idx}-{value}".encode())
+
+    threads = [threading.Thread(target=save, args=(idx,)) for idx in range(4)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    # Then all examples are stored
+    assert len(list(sqlite_db.fetch(b"key"))) == 40
+
+
+def test_endpoint_database():
+    backend = InMemoryExampleDatabase()
+    users = EndpointDatabase(backend, make_endpoint())
+    users.save(b"key", b"value")
+    # Examples are isolated by endpoints
+    assert list(users.fetch(b"key")) == [b"value"]
+    assert list(EndpointDatabase(backend, make_endpoint(method="POST")).fetch(b"key")) == []
+    # And by their definitions
+    changed = make_endpoint(parameters=[{"in": "query", "name": "id", "type": "integer"}])
+    assert list(EndpointDatabase(backend, changed).fetch(b"key")) == []
+
+
+def test_get_schema_hash():
+    assert get_schema_hash(make_endpoint(a=1, b=2)) == get_schema_hash(make_endpoint(b=2, a=1))
+    assert get_schema_hash(make_endpoint(a=1)) != get_schema_hash(make_endpoint(a=2))
+
+
+@pytest.mark.parametrize(
+    "name, expected", (("examples.db", SQLiteExampleDatabase), ("examples", DirectoryBasedExampleDatabase))
+)
+def test_open_database(tmp_path, name, expected):
+    assert isinstance(open_database(tmp_path / name), expected)
@@ -0,0 +1,115 @@
+import pytest
+
+from schemathesis.dependencies import (
+    compile_plan,
+    get_dependency_plan,
+    get_field,
+    get_producers,
+    parse_dependency,
+    parse_field_path,
+    sort_operations,
+)
+from schemathesis.models import Case, Endpoint
+from schemathesis.store_result import ResponseStore
+
+EXECUTE_IN_ORDER = {
+    "get:/notes/{note_id}": {"required": {"path_parameters": {"note_id": "post:/notes:id"}}},
+    "delete:/users/{user_id}": {"required": {"path_parameters": {"user_id": "post:/users:id"}}},
+    "post:/notes": {"store": ["id"], "required": {"body": {"owner": "post:/users:id"}}},
+    "post:/users": {"store": ["id"]},
+}
+
+
+def test_parse_dependency():
+    assert parse_dependency("post:/notes:id") == ("post:/notes", "id")
+
+
+def test_get_producers():
+    assert get_producers(EXECUTE_IN_ORDER) == {
+        "get:/notes/{note_id}": {"post:/notes"},
+        "delete:/users/{user_id}": {"post:/users"},
+        "post:/notes": {"post:/users"},
+        "post:/users": set(),
+    }
+
+
+def test_sort_operations():
+    # Producers go before their consumers
+    assert sort_operations(EXECUTE_IN_ORDER) == [
+        "post:/users",
+        "delete:/users/{user_id}",
+        "post:/notes",
+        "get:/notes/{note_id}",
+    ]
+
+
+def test_sort_operations_cycle():
+    execute_in_order = {
+        "post:/a": {"required": {"body": {"b": "post:/b:id"}}},
+        "post:/b": {"required": {"body": {"a": "post:/a:id"}}},
+        "post:/c": {},
+    }
+    # Operations from cycles are placed in the end
+    assert sort_operations(execute_in_order) == ["post:/c", "post:/a", "post:/b"]
+
+
+@pytest.mark.parametrize(
+    "value, expected",
+    (
+        ("id", ("id",)),
+        ("data.items.0.id", ("data", "items", "0", "id")),
+        ("/data/items/0/id", ("data", "items", "0", "id")),
+        ("/a~1b/c~0d", ("a/b", "c~d")),
+    ),
+)
+def test_parse_field_path(value, expected):
+    assert parse_field_path(value) == expected
+
+
+def test_get_field():
+    data = {"data": {"items": [{"id": 1}, {"id": 2}]}}
+    assert get_field(data, ("data", "items", "1", "id")) == 2
+    # Missing values are stored as `None`
+    assert get_field(data, ("data", "items", "5", "id")) is None
+    assert get_field(data, ("data", "unknown")) is None
+
+
+def test_plan_inject():
+    plan = compile_plan(
+        "POST:/notes/{note_id}",
+        {
+            "required": {
+                "path_parameters": {"note_id": "post:/notes:data.id"},
+                "query": {"owner": "post:/users:id"},
+                "body": {"/meta/parent": "post:/notes:data.id", "missing": "post:/tags:id"},
+            }
+        },
+    )
+    store = ResponseStore()
+    store.store_many("post:/notes", {"data.id": 42})
+    store.store_result("post:/users", "id", None)
+    endpoint = Endpoint("/notes/{note_id}", "POST", {}, schema=None)
+    case = Case(endpoint, path_parameters={"note_id": 1}, body={"meta": "text"})
+    plan.inject(case, store)
+    assert case.path_parameters == {"note_id": 42}
+    # Stored `None` values are injected, parameters without stored values are left as is
+    assert case.query == {"owner": None}
+    assert case.body == {"meta": {"parent": 42}}
+
+
+def test_plan_extract():
+    plan = compile_plan("post:/notes", {"store": ["id", "data.items.0.id", "/links/self"]})
+    data = {"id": 1, "data": {"items": [{"id": 2}]}, "links": {"self": "/notes/1"}}
+    assert plan.extract(data) == {"id": 1, "data.items.0.id": 2, "/links/self": "/notes/1"}
+
+
+def test_get_dependency_plan():
+    endpoint = Endpoint("/Notes/{note_id}", "GET", {}, schema=None)
+    assert get_dependency_plan(endpoint, None) is None
+    plan = get_dependency_plan(endpoint, EXECUTE_IN_ORDER)
+    assert plan.operation == "get:/notes/{note_id}"
+    assert [(item.location, item.target, item.producer, item.field) for item in plan.injections] == [
+        ("path_parameters", ("note_id",), "post:/notes", "id")
+    ]
+    # Endpoints without `execute_in_order` entries have empty plans
+    assert get_dependency_plan(Endpoint("/tags", "GET", {}, schema=None), EXECUTE_IN_ORDER).injections == []
@@ -1,11 +1,11 @@
 from base64 import b64decode
 
 import pytest
-from hypothesis import HealthCheck, given, settings, strategies
+from hypothesis import HealthCheck, Phase, given, settings, strategies
 
 import schemathesis
 from schemathesis import Case, register_string_format
-from schemathesis._hypothesis import PARAMETERS, get_case_strategy, get_example, is_valid_query
+from schemathesis._hypothesis import PARAMETERS, create_test, get_case_strategy, get_example, is_valid_query
 from schemathesis.exceptions import InvalidSchema
 from schemathesis.models import Endpoint
 
@@ -89,6 +89,32 @@ def test_warning(swagger_20):
     assert not record
 
 
+def test_no_example_draws(recwarn, swagger_20):
+    example = {"name": "John"}
+    endpoint = make_endpoint(
+        swagger_20, query={"example": example}, body={"type": "object", "properties": {"id": {"type": "integer"}}}
+    )
+    # Explicit examples are drawn without `SearchStrategy.example`, that generates many values and warns
+    case = get_example(endpoint)
+    assert case.query == example
+    assert isinstance(case.body, dict)
+    assert not recwarn
+
+
+@pytest.mark.parametrize("phases, calls", (([Phase.explicit, Phase.generate], 1), ([Phase.generate], 0)))
+def test_explicit_phase(mocker, swagger_20, phases, calls):
+    endpoint = make_endpoint(swagger_20, query={"example": {"name": "John"}})
+    get_example_mock = mocker.patch("schemathesis._hypothesis.get_example", return_value=None)
+
+    def test(case):
+        pass
+
+    # When the explicit phase is disabled
+    create_test(endpoint, test, settings=settings(phases=phases))
+    # Then the explicit example is not created
+    assert get_example_mock.call_count == calls
+
+
 @pytest.mark.filterwarnings("ignore:.*method is good for exploring strategies.*")
 def test_custom_strategies(swagger_20):
     register_string_format("even_4_digits", strategies.from_regex(r"\A[0-9]{4}\Z").filter(lambda x: int(x) % 2 == 0))
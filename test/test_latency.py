@@ -0,0 +1,49 @@
+import json
+
+import pytest
+
+from schemathesis.latency import SUB_BUCKETS, LatencyHistogram, get_bucket, get_bucket_upper_bound
+
+
+@pytest.mark.parametrize("seconds", (0.000001, 0.0015, 0.2, 3.7, 120.0))
+def test_bucket_precision(seconds):
+    upper_bound = get_bucket_upper_bound(get_bucket(seconds))
+    assert seconds <= upper_bound <= seconds * (1 + 1 / SUB_BUCKETS) * 1.0001
+
+
+def test_percentiles():
+    histogram = LatencyHistogram()
+    for milliseconds in range(1, 101):
+        histogram.record(milliseconds / 1000)
+    summary = histogram.summary()
+    assert summary["count"] == 100
+    assert summary["min"] == 0.001
+    assert summary["max"] == 0.1
+    for key, expected in (("p50", 0.05), ("p95", 0.095), ("p99", 0.099)):
+        assert summary[key] == pytest.approx(expected, rel=1 / SUB_BUCKETS)
+
+
+def test_fixed_memory():
+    histogram = LatencyHistogram()
+    for _ in range(10000):
+        histogram.record(0.01)
+    assert len(histogram.buckets) == 1
+
+
+def test_merge_serialized():
+    first, second = LatencyHistogram(), LatencyHistogram()
+    first.record(0.01)
+    second.record(0.5)
+    # Histograms survive a JSON round trip and could be merged afterwards
+    restored = LatencyHistogram.deserialize(json.loads(json.dumps(second.serialize())))
+    assert restored == second
+    first.merge(restored)
+    assert first.count == 2
+    assert first.min == 0.01
+    assert first.max == 0.5
+
+
+def test_empty():
+    histogram = LatencyHistogram()
+    assert histogram.summary() == {}
+    assert histogram.get_percentile(50) is None
@@ -1,7 +1,9 @@
 import pytest
+from jsonschema import ValidationError
 
 import schemathesis
 from schemathesis.constants import USER_AGENT
+from schemathesis.spec_schemas import get_schema, get_validator
 
 from .utils import SIMPLE_PATH
 
@@ -39,3 +41,18 @@ def test_base_url_override(schema_url, url):
 def test_unsupported_type():
     with pytest.raises(ValueError, match="^Unsupported schema type$"):
         schemathesis.from_dict({})
+
+
+@pytest.mark.parametrize("validate_schema, loaded", ((False, 0), (True, 1)))
+def test_meta_schemas_are_loaded_lazily(simple_schema, validate_schema, loaded):
+    get_schema.cache_clear()
+    get_validator.cache_clear()
+    # Meta-schemas are read from files only if the schema is validated
+    schemathesis.from_dict(simple_schema, validate_schema=validate_schema)
+    assert get_schema.cache_info().currsize == loaded
+
+
+def test_invalid_schema():
+    # Validation errors are the same as from `jsonschema.validate`
+    with pytest.raises(ValidationError, match="'paths' is a required property"):
+        schemathesis.from_dict({"swagger": "2.0", "info": {"title": "Test", "version": "0.1"}})
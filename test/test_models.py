@@ -4,7 +4,7 @@ import pytest
 import requests
 
 import schemathesis
-from schemathesis.models import Case, Endpoint
+from schemathesis.models import Case, Check, Endpoint, Status, TestResult, TestResultSet
 
 
 def test_path(swagger_20):
@@ -109,3 +109,39 @@ def test_(case):
     )
     result = testdir.runpytest()
     result.assert_outcomes(passed=1)
+
+
+def test_result_set_aggregates():
+    # Given results with passed, failed and errored tests
+    passed = TestResult(ENDPOINT, [Check("not_a_server_error", Status.success)])
+    failed = TestResult(ENDPOINT)
+    failed.add_success("not_a_server_error", Case(ENDPOINT))
+    failed.add_failure("not_a_server_error", Case(ENDPOINT), "Message")
+    errored = TestResult(ENDPOINT)
+    errored.add_error(ZeroDivisionError("division by zero"))
+    results = TestResultSet([passed])
+    # When they are added one by one
+    results.append(failed)
+    results.append(errored)
+    # Then aggregates reflect all of them without rescanning
+    assert results.passed_count == 1
+    assert results.failed_count == 1
+    assert results.errored_count == 1
+    assert results.has_failures
+    assert results.has_errors
+    assert not results.has_logs
+    assert results.total == {"not_a_server_error": {Status.success: 2, Status.failure: 1, "total": 3}}
+
+
+
+@pytest.mark.parametrize("keep_results, expected", ((False, 0), (True, 1)))
+def test_result_set_keep_results(keep_results, expected):
+    results = TestResultSet(keep_results=keep_results)
+    assert results.is_empty
+    # When a result is added
+    results.append(TestResult(ENDPOINT))
+    # Then it is counted
+    assert not results.is_empty
+    assert results.passed_count == 1
+    # And it is kept only if needed
+    assert len(results.results) == expected
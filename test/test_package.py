@@ -1,5 +1,10 @@
+import json
+import subprocess
 import sys
 
+import pytest
+
+import schemathesis
 from schemathesis._compat import metadata
 
 
@@ -15,3 +20,56 @@ def test_dev_version(monkeypatch, mocker):
 
     # Then it's version is "dev"
     assert __version__ == "dev"
+
+
+# Modules, that are slow to import and are not needed until tests are generated & executed
+HEAVY_MODULES = {
+    "hypothesis",
+    "hypothesis_jsonschema",
+    "jsonschema",
+    "requests",
+    "werkzeug",
+    "yaml",
+    "_pytest.logging",
+    "schemathesis.spec_schemas",
+    "schemathesis.runner",
+}
+RUN_HELP = """
+from click.testing import CliRunner
+from schemathesis.cli import schemathesis
+assert CliRunner().invoke(schemathesis, ["run", "--help"]).exit_code == 0
+"""
+
+
+def get_imported_modules(code):
+    script = f"import json, sys\n{code}\nprint(json.dumps(sorted(sys.modules)))"
+    output = subprocess.check_output([sys.executable, "-c", script])
+    return set(json.loads(output.splitlines()[-1]))
+
+
+@pytest.mark.parametrize(
+    "code, allowed",
+    (
+        ("import schemathesis", set()),
+        (RUN_HELP, set()),
+        # Pytest imports its logging plugin by itself
+        ("import schemathesis.extra.pytest_plugin", {"_pytest.logging"}),
+    ),
+    ids=("package", "cli-help", "pytest-plugin"),
+)
+def test_lazy_imports(code, allowed):
+    # When the package is imported without running any tests
+    imported = get_imported_modules(code)
+    # Then heavy dependencies are not imported
+    assert imported & HEAVY_MODULES <= allowed
+
+
+def test_lazy_attributes():
+    # Public API is available via attributes of the package
+    for name in ("from_uri", "from_dict", "from_wsgi", "from_pytest_fixture", "register_check", "Case"):
+        assert name in dir(schemathesis)
+        assert callable(getattr(schemathesis, name))
+    # As well as submodules
+    assert schemathesis.loaders.from_uri is schemathesis.from_uri
+    with pytest.raises(AttributeError):
+        schemathesis.unknown
@@ -0,0 +1,47 @@
+import pytest
+
+from schemathesis.latency import SUB_BUCKETS
+from schemathesis.phases import GENERATION, NETWORK, SERIALIZATION, SHRINKING, PhaseTimings
+
+
+def test_summary():
+    timings = PhaseTimings()
+    for duration in (0.1, 0.3, 0.2):
+        timings.add(NETWORK, duration)
+    summary = timings.summary()[NETWORK]
+    assert summary["count"] == 3
+    assert summary["total"] == pytest.approx(0.6)
+    assert summary["p50"] == pytest.approx(0.2, rel=1 / SUB_BUCKETS)
+    assert summary["p99"] == 0.3
+
+
+def test_fixed_memory():
+    timings = PhaseTimings()
+    for _ in range(10000):
+        timings.add(NETWORK, 0.01)
+    # Durations are not kept, only bucket counts
+    assert len(timings.durations[NETWORK].buckets) == 1
+    assert timings.summary()[NETWORK]["count"] == 10000
+
+
+def test_extend():
+    timings, other = PhaseTimings(), PhaseTimings()
+    timings.add(NETWORK, 0.1)
+    other.add(NETWORK, 0.3)
+    other.add(GENERATION, 0.2)
+    timings.extend(other)
+    summary = timings.summary()
+    assert summary[NETWORK]["count"] == 2
+    assert summary[NETWORK]["total"] == pytest.approx(0.4)
+    assert summary[GENERATION]["count"] == 1
+
+
+def test_shrinking():
+    timings = PhaseTimings()
+    with timings.measure(GENERATION):
+        pass
+    timings.start_shrinking()
+    # After the first failure everything, except serialization, is shrinking
+    timings.add(NETWORK, 1.0)
+    timings.add(SERIALIZATION, 1.0)
+    assert set(timings.summary()) == {GENERATION, SHRINKING, SERIALIZATION}
@@ -113,3 +113,40 @@ def test_b(case, a):
     result = testdir.runpytest("-Werror")
     # There should be no errors. There are no warnings from Schemathesis pytest plugin
     result.assert_outcomes(passed=3)
+
+
+def test_tests_are_created_on_setup(testdir):
+    # When a schema has multiple endpoints
+    testdir.make_test(
+        """
+from schemathesis import _hypothesis
+
+created = []
+original = _hypothesis.create_test
+
+def create_test(endpoint, test, *args, **kwargs):
+    created.append(f"{endpoint.method}:{endpoint.path}")
+    return original(endpoint, test, *args, **kwargs)
+
+_hypothesis.create_test = create_test
+
+@schema.parametrize()
+@settings(max_examples=1)
+def test_(request, case):
+    request.config.HYPOTHESIS_CASES += 1
+    assert created == ["POST:/v1/users"]
+""",
+        paths={
+            "/users": {
+                "get": {"responses": {"200": {"description": "OK"}}},
+                "post": {"responses": {"200": {"description": "OK"}}},
+            }
+        },
+    )
+    # Then all of them are collected
+    result = testdir.runpytest("--collect-only")
+    result.stdout.re_match_lines([r".*test_\[GET:/v1/users\]", r".*test_\[POST:/v1/users\]"])
+    # But Hypothesis tests are created only for the selected items
+    result = testdir.runpytest("-v", "-s", "-k", "POST")
+    result.assert_outcomes(passed=1)
+    result.stdout.re_match_lines([r"Hypothesis calls: 1"])
@@ -0,0 +1,34 @@
+import threading
+
+from schemathesis.store_result import ResponseStore
+
+
+def test_store_multiple_keys():
+    store = ResponseStore()
+    # When multiple values are stored for the same operation separately
+    store.store_result("post:/users", "id", 1)
+    store.store_result("post:/users", "name", "John")
+    # Then all of them are available
+    assert store.get_store_result("post:/users", "id") == 1
+    assert store.get_store_result("post:/users", "name") == "John"
+    # And the latest value wins
+    store.store_many("post:/users", {"id": 2})
+    assert store.store == {"post:/users": {"id": 2, "name": "John"}}
+    assert store.get("get:/users", "id") is None
+    assert not store.has_result("get:/users")
+
+
+def test_concurrent_writes():
+    store = ResponseStore()
+
+    def worker(idx):
+        for value in range(100):
+            store.store_result("post:/users", f"key-{idx}", value)
+
+    threads = [threading.Thread(target=worker, args=(idx,)) for idx in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    # No values are lost when multiple workers write to the same operation
+    assert store.store["post:/users"] == {f"key-{idx}": 99 for idx in range(8)}
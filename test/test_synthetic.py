@@ -0,0 +1,110 @@
+import pytest
+from werkzeug.test import Client
+
+import schemathesis
+from schemathesis.models import Case
+from schemathesis.synthetic import SpecConfig, generate_schema, make_app
+from schemathesis.synthetic.app import InstanceBuilder
+from schemathesis.utils import WSGIResponse
+
+SPEC_VERSIONS = ("2.0", "3.0")
+
+
+def get_definitions(raw_schema):
+    if "swagger" in raw_schema:
+        return raw_schema["definitions"]
+    return raw_schema["components"]["schemas"]
+
+
+@pytest.mark.parametrize("spec_version", SPEC_VERSIONS)
+@pytest.mark.parametrize("recursive, polymorphic", ((False, False), (True, True)))
+def test_valid_schema(spec_version, recursive, polymorphic):
+    config = SpecConfig(spec_version=spec_version, paths=5, recursive=recursive, polymorphic=polymorphic)
+    # The schema is validated against the specification's meta-schema
+    schema = schemathesis.from_dict(generate_schema(config))
+    assert len(schema.raw_schema["paths"]) == 5
+
+
+@pytest.mark.parametrize("spec_version", SPEC_VERSIONS)
+def test_endpoints(spec_version):
+    schema = schemathesis.from_dict(generate_schema(SpecConfig(spec_version=spec_version, paths=5, parameters=4)))
+    assert len(list(schema.get_all_endpoints())) == 15
+    get_endpoint = schema["/items0/{item_id}"]["GET"]
+    assert [parameter["name"] for parameter in get_endpoint.definition["parameters"]] == [
+        "param0",
+        "param1",
+        "X-Param-2",
+        "param3",
+    ]
+
+
+def test_deterministic():
+    config = SpecConfig(paths=3, recursive=True, polymorphic=True)
+    assert generate_schema(config) == generate_schema(config)
+
+
+@pytest.mark.parametrize("spec_version, prefix", (("2.0", "#/definitions/"), ("3.0", "#/components/schemas/")))
+def test_references(spec_version, prefix):
+    config = SpecConfig(spec_version=spec_version, paths=1, definitions=4, ref_fanout=3, ref_depth=2)
+    definitions = get_definitions(generate_schema(config))
+    assert len(definitions) == 8
+    # Definitions refer to the next level
+    assert definitions["Model0_1"]["properties"]["ref2"] == {"$ref": prefix + "Model1_1"}
+    # The last level has only scalar properties
+    assert "ref0" not in definitions["Model1_0"]["properties"]
+
+
+@pytest.mark.parametrize(
+    "spec_version, expected",
+    (
+        ("2.0", {"$ref": "#/definitions/Model0_1Dog"}),
+        (
+            "3.0",
+            {
+                "oneOf": [
+                    {"$ref": "#/components/schemas/Model0_1Cat"},
+                    {"$ref": "#/components/schemas/Model0_1Dog"},
+                ]
+            },
+        ),
+    ),
+)
+def test_recursive_polymorphic(spec_version, expected):
+    config = SpecConfig(spec_version=spec_version, paths=2, recursive=True, polymorphic=True)
+    raw_schema = generate_schema(config)
+    definitions = get_definitions(raw_schema)
+    assert definitions["Model0_0"]["properties"]["children"]["items"]["$ref"].endswith("/Model0_0")
+    assert "allOf" in definitions["Model0_0Cat"]
+    responses = raw_schema["paths"]["/items1/{item_id}"]["get"]["responses"]
+    if spec_version == "2.0":
+        assert responses["200"]["schema"] == expected
+    else:
+        assert responses["200"]["content"]["application/json"]["schema"] == expected
+
+
+@pytest.mark.parametrize("spec_version", SPEC_VERSIONS)
+def test_app_responses_conform(spec_version):
+    raw_schema = generate_schema(SpecConfig(spec_version=spec_version, paths=3, ref_depth=4, polymorphic=True))
+    schema = schemathesis.from_dict(raw_schema, app=make_app(raw_schema))
+    for endpoint in schema.get_all_endpoints():
+        case = Case(endpoint, path_parameters={"item_id": 1})
+        response = case.call_wsgi()
+        case.validate_response(response)
+
+
+def test_app_routing():
+    raw_schema = generate_schema(SpecConfig(paths=2))
+    client = Client(make_app(raw_schema), WSGIResponse)
+    assert client.get("/schema.json").json == raw_schema
+    assert client.get("/items1/42").status_code == 200
+    assert client.delete("/items1/42").status_code == 204
+    assert client.post("/items1/42").status_code == 405
+    assert client.get("/items2/42").status_code == 404
+    assert client.get("/items1").status_code == 404
+
+
+def test_recursive_instance():
+    raw_schema = generate_schema(SpecConfig(paths=1, ref_depth=1, recursive=True, polymorphic=True))
+    instance = InstanceBuilder(raw_schema).build({"$ref": "#/components/schemas/Model0_0Cat"})
+    # Recursive properties are not required and omitted
+    assert instance == {"id": 1, "name": "x", "price": 0, "active": True, "status": "available", "kind": "Cat"}
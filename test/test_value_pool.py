@@ -0,0 +1,103 @@
+import json
+
+import hypothesis.strategies as st
+import pytest
+import requests
+from hypothesis import given, settings
+
+from schemathesis._hypothesis import pooled_strategy
+from schemathesis.models import Case, Endpoint
+from schemathesis.runner.impl.core import check_if_storing_required
+from schemathesis.value_pool import ValuePool, get_resource_name, iter_fields
+
+
+@pytest.mark.parametrize(
+    "path, expected", (("/notes", "note"), ("/users/{user_id}/notes/{note_id}", "note"), ("/{id}", None))
+)
+def test_get_resource_name(path, expected):
+    assert get_resource_name(Endpoint(path, "GET", {}, schema=None)) == expected
+
+
+def test_iter_fields():
+    data = {"id": 1, "title": "Test", "done": True, "owner": {"id": "a"}, "tags": [{"name": "x"}], "text": "y" * 1000}
+    assert sorted(iter_fields(data, "note"), key=str) == sorted(
+        [
+            ("id", 1),
+            ("note_id", 1),
+            ("noteId", 1),
+            ("title", "Test"),
+            ("id", "a"),
+            ("owner_id", "a"),
+            ("ownerId", "a"),
+            ("name", "x"),
+        ],
+        key=str,
+    )
+
+
+def test_pool_is_bounded():
+    pool = ValuePool(max_size=5, seed=1)
+    for value in range(100):
+        pool.add("id", value)
+    values = pool.get("id")
+    assert len(values) == 5
+    assert set(values) <= set(range(100))
+
+
+def make_case(**kwargs):
+    return st.builds(lambda: Case(Endpoint("/notes/{note_id}", "GET", {}, schema=None), **kwargs))
+
+
+@pytest.mark.parametrize("probability, expected", ((0, 0), (1, 42)))
+def test_pooled_strategy(probability, expected):
+    pool = ValuePool(probability=probability)
+    pool.harvest(Endpoint("/notes", "POST", {}, schema=None), {"id": 42, "title": "Test"})
+
+    @given(case=pooled_strategy(make_case(path_parameters={"note_id": 0}, query={"title": 1, "unknown": 0}), pool))
+    @settings(max_examples=10)
+    def test(case):
+        assert case.path_parameters == {"note_id": expected}
+        # Values of other types are not used
+        assert case.query == {"title": 1, "unknown": 0}
+
+    test()
+
+
+def test_pooled_strategy_string_path_parameters():
+    pool = ValuePool(probability=1)
+    pool.add("note_id", 42)
+
+    @given(case=pooled_strategy(make_case(path_parameters={"note_id": "foo"}), pool))
+    @settings(max_examples=1)
+    def test(case):
+        assert case.path_parameters == {"note_id": "42"}
+
+    test()
+
+
+def test_pooled_strategy_reproducible():
+    # When a failure depends on a value from the pool
+    pool = ValuePool(probability=0.5)
+    pool.add("note_id", 42)
+
+    @given(case=pooled_strategy(make_case(path_parameters={"note_id": 0}), pool))
+    @settings(max_examples=100, database=None)
+    def test(case):
+        assert case.path_parameters["note_id"] != 42
+
+    # Then Hypothesis replays it as any other generated data, instead of reporting a flaky test
+    with pytest.raises(AssertionError):
+        test()
+
+
+@pytest.mark.parametrize("status_code, expected", ((201, [42]), (404, [])))
+def test_harvest_successful_responses(status_code, expected):
+    pool = ValuePool(probability=1)
+    endpoint = Endpoint("/notes", "POST", {}, schema=None)
+    response = requests.Response()
+    response.status_code = status_code
+    response._content = json.dumps({"id": 42}).encode()
+    check_if_storing_required(Case(endpoint), response, None, None, pool)
+    assert pool.get("note_id") == expected
+    # And harvested values are available for other endpoints
+    assert pool.get_candidates("path_parameters", "note_id", 1) == expected